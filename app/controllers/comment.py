@@ -0,0 +1,90 @@
+from typing import Annotated, Any
+from litestar import Controller, get, post, Request
+from litestar.di import Provide
+from litestar.exceptions import NotAuthorizedException
+from litestar.params import Parameter
+from app.services.comment_service import (
+    CommentService,
+    DEFAULT_COMMENT_DEPTH,
+    DEFAULT_COMMENT_PAGE_SIZE,
+    MAX_COMMENT_DEPTH,
+    MAX_COMMENT_PAGE_SIZE,
+)
+from app.dtos.comment import CommentCreateDTO, CommentResponseDTO, CommentTreeDTO
+
+
+def provide_comment_service() -> CommentService:
+    return CommentService()
+
+
+class CommentController(Controller):
+    """
+    Controller for handling comments on posts.
+    """
+
+    path = "/api/posts"
+    dependencies = {"comment_service": Provide(lambda: provide_comment_service())}
+
+    @post("/{post_id:int}/comments")
+    async def create_comment(
+        self,
+        post_id: int,
+        data: CommentCreateDTO,
+        request: Request,
+        comment_service: CommentService,
+    ) -> CommentResponseDTO:
+        """
+        Comment on a post, or reply to a comment when `parent_id` is set.
+
+        Args:
+            post_id: The ID of the post.
+            data: The comment data.
+            request: The request object.
+            comment_service: The injected comment service.
+
+        Returns:
+            CommentResponseDTO: The created comment.
+
+        Raises:
+            NotAuthorizedException: If not authenticated.
+            NotFoundException: If the post or parent comment does not exist.
+        """
+        user: dict[str, Any] | None = request.user
+        if not user:
+            raise NotAuthorizedException()
+
+        return await comment_service.create_comment(
+            post_id, data, author_id=int(user["id"])
+        )
+
+    @get("/{post_id:int}/comments")
+    async def get_comments(
+        self,
+        post_id: int,
+        comment_service: CommentService,
+        depth: Annotated[
+            int, Parameter(ge=1, le=MAX_COMMENT_DEPTH)
+        ] = DEFAULT_COMMENT_DEPTH,
+        limit: Annotated[
+            int, Parameter(ge=1, le=MAX_COMMENT_PAGE_SIZE)
+        ] = DEFAULT_COMMENT_PAGE_SIZE,
+        cursor: str | None = None,
+        parent_id: int | None = None,
+    ) -> CommentTreeDTO:
+        """
+        Get the comment tree of a post.
+
+        Args:
+            post_id: The ID of the post.
+            comment_service: The injected comment service.
+            depth: How many levels of replies to load.
+            limit: The maximum number of comments to return.
+            cursor: The `next_cursor` value from the previous page.
+            parent_id: Load only the replies below this comment ("load more").
+
+        Returns:
+            CommentTreeDTO: The comment tree and the cursor for the next page.
+        """
+        return await comment_service.get_comment_tree(
+            post_id, depth=depth, limit=limit, cursor=cursor, parent_id=parent_id
+        )
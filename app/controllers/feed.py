@@ -0,0 +1,52 @@
+from typing import Annotated, Any
+from litestar import Controller, get, Request
+from litestar.di import Provide
+from litestar.exceptions import NotAuthorizedException
+from litestar.params import Parameter
+from app.dtos.post import PostPageDTO
+from app.services.home_feed_service import HomeFeedService
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+def provide_home_feed_service() -> HomeFeedService:
+    return HomeFeedService()
+
+
+class FeedController(Controller):
+    """
+    Controller for the personalized feeds of the authenticated user.
+    """
+
+    path = "/api/feed"
+    dependencies = {"home_feed_service": Provide(lambda: provide_home_feed_service())}
+
+    @get("/home")
+    async def get_home_feed(
+        self,
+        request: Request,
+        home_feed_service: HomeFeedService,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> PostPageDTO:
+        """
+        Get the newest posts from the subreddits the user has joined.
+
+        Args:
+            request: The request object to retrieve the authenticated user.
+            home_feed_service: The injected home feed service.
+            limit: The maximum number of posts to return.
+            cursor: The `next_cursor` value from the previous page.
+
+        Returns:
+            PostPageDTO: The page of posts and the cursor for the next page.
+
+        Raises:
+            NotAuthorizedException: If the user is not authenticated.
+        """
+        user: dict[str, Any] | None = request.user
+        if not user:
+            raise NotAuthorizedException()
+
+        return await home_feed_service.get_home_feed(
+            int(user["id"]), limit=limit, cursor=cursor
+        )
@@ -0,0 +1,82 @@
+from litestar import Controller, get
+from litestar.di import Provide
+from app.guards import require_ops_token
+from app.services.health_service import HealthService
+from app.dtos.health import (
+    HashingStatsDTO,
+    PoolStatsDTO,
+    ReplicaStatsDTO,
+    StartupStatsDTO,
+)
+
+
+def provide_health_service() -> HealthService:
+    return HealthService()
+
+
+class HealthController(Controller):
+    """
+    Controller exposing runtime health and saturation statistics.
+    """
+
+    path = "/api/health"
+    # Operational data, not user data: guarded by `OPS_TOKEN` instead of a
+    # user's JWT, which the authentication middleware would ask for.
+    guards = [require_ops_token]
+    opt = {"exclude_from_auth": True}
+    dependencies = {"health_service": Provide(lambda: provide_health_service())}
+
+    @get("/hashing")
+    async def get_hashing_stats(self, health_service: HealthService) -> HashingStatsDTO:
+        """
+        Get the password hashing pool statistics.
+
+        Args:
+            health_service: The injected health service.
+
+        Returns:
+            HashingStatsDTO: Queue depth, throughput and latency of the pool.
+        """
+        return await health_service.get_hashing_stats()
+
+    @get("/db")
+    async def get_pool_stats(self, health_service: HealthService) -> PoolStatsDTO:
+        """
+        Get this worker's database connection pool statistics.
+
+        Args:
+            health_service: The injected health service.
+
+        Returns:
+            PoolStatsDTO: Pool size, idle and in-use connections, and acquire waits.
+        """
+        return await health_service.get_pool_stats()
+
+    @get("/replicas")
+    async def get_replica_stats(
+        self, health_service: HealthService
+    ) -> list[ReplicaStatsDTO]:
+        """
+        Get the lag, health and pool statistics of every read replica.
+
+        Args:
+            health_service: The injected health service.
+
+        Returns:
+            list[ReplicaStatsDTO]: One entry per configured replica.
+        """
+        return await health_service.get_replica_stats()
+
+    @get("/startup")
+    async def get_startup_stats(self, health_service: HealthService) -> StartupStatsDTO:
+        """
+        Get this worker's startup breakdown, for measuring cold starts.
+
+        Args:
+            health_service: The injected health service.
+
+        Returns:
+            StartupStatsDTO: The duration of each startup phase, when the worker
+            was ready and when it served its first successful response.
+        """
+        return await health_service.get_startup_stats()
@@ -0,0 +1,36 @@
+from litestar import Controller, Response, get
+from litestar.di import Provide
+from app.guards import require_ops_token
+from app.services.metrics import MetricsService, PROMETHEUS_CONTENT_TYPE
+
+
+def provide_metrics_service() -> MetricsService:
+    return MetricsService()
+
+
+class MetricsController(Controller):
+    """
+    Controller exposing this worker's metrics to Prometheus.
+    """
+
+    path = "/metrics"
+    # Operational data, not user data: guarded by `OPS_TOKEN` instead of a
+    # user's JWT, which the authentication middleware would ask for.
+    guards = [require_ops_token]
+    opt = {"exclude_from_auth": True}
+    dependencies = {"metrics_service": Provide(lambda: provide_metrics_service())}
+
+    @get("/", include_in_schema=False)
+    async def get_metrics(self, metrics_service: MetricsService) -> Response[str]:
+        """
+        Get request, database and hashing pool metrics.
+
+        Args:
+            metrics_service: The injected metrics service.
+
+        Returns:
+            Response[str]: The metrics in the Prometheus text format.
+        """
+        return Response(
+            await metrics_service.render(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
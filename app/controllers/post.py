@@ -1,9 +1,20 @@
-from typing import Any
-from litestar import Controller, get, post, Request
+from typing import Annotated, Any
+from litestar import Controller, delete, get, post, Request
 from litestar.di import Provide
 from litestar.exceptions import NotAuthorizedException, NotFoundException
+from litestar.params import Parameter
+from litestar.response import Stream
+from litestar.status_codes import HTTP_200_OK
 from app.services.post_service import PostService
-from app.dtos.post import PostCreateDTO, PostResponseDTO
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.streaming import NDJSON_MEDIA_TYPE, stream_response, wants_ndjson
+from app.dtos.post import (
+    FeedSort,
+    PostBulkResultDTO,
+    PostCreateDTO,
+    PostPageDTO,
+    PostResponseDTO,
+)
 
 
 
@@ -52,6 +63,63 @@ class PostController(Controller):
 
         return await post_service.create_post(data, author_id=int(user["id"]))
 
+    @post("/posts/bulk", status_code=HTTP_200_OK)
+    async def bulk_create_posts(
+        self, request: Request, post_service: PostService
+    ) -> PostBulkResultDTO:
+        """
+        Create many posts in one request, as the current user.
+
+        The body is a JSON array of `PostCreateDTO` objects, or one object per
+        line when sent as `application/x-ndjson`. Invalid rows are reported
+        by index and skipped; the rest are inserted together.
+
+        The body is read raw rather than bound to `data` so each row can be
+        decoded, and fail, on its own.
+
+        Args:
+            request: The request object.
+            post_service: The injected post service.
+
+        Returns:
+            PostBulkResultDTO: The new post IDs and the per-row errors.
+
+        Raises:
+            NotAuthorizedException: If not authenticated.
+            ClientException: If the body is malformed or too large.
+        """
+        user: dict[str, Any] | None = request.user
+        if not user:
+            raise NotAuthorizedException()
+
+        return await post_service.bulk_create_posts(
+            await request.body(),
+            ndjson=request.content_type[0] == NDJSON_MEDIA_TYPE,
+            author_id=int(user["id"]),
+        )
+
+    @get("/posts/feed")
+    async def get_feed(
+        self,
+        post_service: PostService,
+        sort: FeedSort = FeedSort.HOT,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> PostPageDTO:
+        """
+        Get the global feed across all subreddits.
+
+        Args:
+            post_service: The injected post service.
+            sort: The feed ordering (hot, new or top).
+            limit: The maximum number of posts to return.
+            cursor: The `next_cursor` value from the previous page.
+
+        Returns:
+            PostPageDTO: The page of posts and the cursor for the next page.
+        """
+        return await post_service.get_feed(sort=sort, limit=limit, cursor=cursor)
+
     @get("/posts/{post_id:int}")
     async def get_post(
         self, post_id: int, post_service: PostService
@@ -68,18 +136,65 @@ class PostController(Controller):
         """
         return await post_service.get_post(post_id)
 
+    @delete("/posts/{post_id:int}")
+    async def delete_post(
+        self, post_id: int, request: Request, post_service: PostService
+    ) -> None:
+        """
+        Delete a post as its author.
+
+        Args:
+            post_id: The ID of the post.
+            request: The request object.
+            post_service: The injected post service.
+
+        Raises:
+            NotAuthorizedException: If not authenticated.
+            NotFoundException: If the post does not exist.
+            PermissionDeniedException: If the user is not the post's author.
+        """
+        user: dict[str, Any] | None = request.user
+        if not user:
+            raise NotAuthorizedException()
+
+        await post_service.delete_post(post_id, user_id=int(user["id"]))
+
     @get("/r/{subreddit:str}/posts")
     async def list_posts(
-        self, subreddit: str, post_service: PostService
-    ) -> list[PostResponseDTO]:
+        self,
+        subreddit: str,
+        request: Request,
+        post_service: PostService,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        stream: bool = False,
+    ) -> PostPageDTO | Stream:
         """
-        List posts in a subreddit.
+        List posts in a subreddit, newest first, one page at a time.
+
+        With `stream=true` every post is streamed from a server-side cursor
+        instead of paged (`limit` and `cursor` are ignored), as NDJSON if the
+        client accepts `application/x-ndjson`.
 
         Args:
             subreddit: The name of the subreddit.
+            request: The request object to read `Accept` from.
             post_service: The injected post service.
+            limit: The maximum number of posts to return.
+            cursor: The `next_cursor` value from the previous page.
+            stream: Stream all posts instead of returning one page.
 
         Returns:
-            list[PostResponseDTO]: List of posts.
+            PostPageDTO | Stream: The page of posts and the cursor for the next
+            page, or the streamed list.
         """
-        return await post_service.get_posts_by_subreddit(subreddit)
+        if stream:
+            ndjson: bool = wants_ndjson(request.headers.get("Accept"))
+            return stream_response(
+                await post_service.stream_posts_by_subreddit(subreddit, ndjson=ndjson),
+                ndjson=ndjson,
+            )
+
+        return await post_service.get_posts_by_subreddit(
+            subreddit, limit=limit, cursor=cursor
+        )
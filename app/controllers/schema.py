@@ -0,0 +1,35 @@
+from functools import cache
+from litestar import Controller, MediaType, Response, get
+from app.services.startup import OPENAPI_SCHEMA_PATH
+
+
+@cache
+def load_schema() -> bytes:
+    """
+    Read the pre-generated OpenAPI schema, once.
+
+    Returns:
+        bytes: The schema as JSON.
+    """
+    with open(OPENAPI_SCHEMA_PATH, "rb") as schema_file:
+        return schema_file.read()
+
+
+class SchemaController(Controller):
+    """
+    Controller serving the OpenAPI schema generated at build time by
+    `python -m app.openapi`, used in `FAST_START` mode instead of Litestar's
+    own schema endpoints.
+    """
+
+    path = "/schema"
+
+    @get("/openapi.json", include_in_schema=False)
+    async def get_openapi_schema(self) -> Response[bytes]:
+        """
+        Get the pre-generated OpenAPI schema.
+
+        Returns:
+            Response[bytes]: The schema as JSON.
+        """
+        return Response(load_schema(), media_type=MediaType.JSON)
@@ -0,0 +1,46 @@
+from typing import Annotated
+from litestar import Controller, get
+from litestar.di import Provide
+from litestar.params import Parameter
+from app.services.search_service import SearchService
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.dtos.post import PostPageDTO
+
+
+def provide_search_service() -> SearchService:
+    return SearchService()
+
+
+class SearchController(Controller):
+    """
+    Controller for full-text search.
+    """
+
+    path = "/api/search"
+    dependencies = {"search_service": Provide(lambda: provide_search_service())}
+
+    @get("/posts")
+    async def search_posts(
+        self,
+        search_service: SearchService,
+        q: Annotated[str, Parameter(min_length=1, max_length=256)],
+        subreddit: str | None = None,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> PostPageDTO:
+        """
+        Search posts by title and content, best match first.
+
+        Args:
+            search_service: The injected search service.
+            q: The search terms, in web search syntax.
+            subreddit: Only search this subreddit, if given.
+            limit: The maximum number of posts to return.
+            cursor: The `next_cursor` value from the previous page.
+
+        Returns:
+            PostPageDTO: The page of matching posts and the cursor for the next page.
+        """
+        return await search_service.search_posts(
+            q, subreddit_name=subreddit, limit=limit, cursor=cursor
+        )
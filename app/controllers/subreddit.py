@@ -1,9 +1,21 @@
-from typing import Any
-from litestar import Controller, get, post, Request
+from typing import Annotated, Any
+from litestar import Controller, MediaType, Response, delete, get, post, Request
 from litestar.di import Provide
 from litestar.exceptions import NotFoundException, NotAuthorizedException
+from litestar.openapi.datastructures import ResponseSpec
+from litestar.params import Parameter
+from litestar.response import Stream
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 from app.services.subreddit_service import SubredditService
-from app.dtos.subreddit import SubredditCreateDTO, SubredditResponseDTO
+from app.services.response_cache import CachedResponse, etag_matches
+from app.services.streaming import stream_response, wants_ndjson
+from app.dtos.subreddit import (
+    SubredditCreateDTO,
+    SubredditResponseDTO,
+    SubredditSuggestionDTO,
+)
+
+MAX_SUGGESTIONS: int = 20
 
 
 
@@ -46,20 +58,71 @@ class SubredditController(Controller):
 
         return await subreddit_service.create_subreddit(data, owner_id=int(user["id"]))
 
-    @get("/")
+    @get(
+        "/",
+        responses={
+            HTTP_200_OK: ResponseSpec(
+                data_container=list[SubredditResponseDTO],
+                description="A list of all subreddits",
+            )
+        },
+    )
     async def get_all_subreddits(
-        self, subreddit_service: SubredditService
-    ) -> list[SubredditResponseDTO]:
+        self,
+        request: Request,
+        subreddit_service: SubredditService,
+        stream: bool = False,
+    ) -> Response[bytes] | Stream:
         """
         List all subreddits.
 
+        The body is served pre-encoded with a strong ETag; a matching
+        `If-None-Match` header gets an empty 304 response. With `stream=true`
+        the list is streamed from a server-side cursor instead, as NDJSON if
+        the client accepts `application/x-ndjson`.
+
         Args:
+            request: The request object to read `If-None-Match` and `Accept` from.
             subreddit_service: The injected subreddit service.
+            stream: Stream the list instead of serving the cached body.
 
         Returns:
-            list[SubredditResponseDTO]: A list of all subreddits.
+            Response[bytes] | Stream: The encoded list of subreddits, or a 304.
         """
-        return await subreddit_service.get_all()
+        if stream:
+            ndjson: bool = wants_ndjson(request.headers.get("Accept"))
+            return stream_response(
+                await subreddit_service.stream_all(ndjson=ndjson), ndjson=ndjson
+            )
+
+        cached: CachedResponse = await subreddit_service.get_all_encoded()
+        headers: dict[str, str] = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("If-None-Match"), cached.etag):
+            return Response(
+                content=b"", status_code=HTTP_304_NOT_MODIFIED, headers=headers
+            )
+
+        return Response(content=cached.body, media_type=MediaType.JSON, headers=headers)
+
+    @get("/suggest")
+    async def suggest_subreddits(
+        self,
+        subreddit_service: SubredditService,
+        prefix: Annotated[str, Parameter(min_length=1, max_length=50)],
+        limit: Annotated[int, Parameter(ge=1, le=MAX_SUGGESTIONS)] = 10,
+    ) -> list[SubredditSuggestionDTO]:
+        """
+        Suggest subreddits whose name starts with a prefix, for typeahead.
+
+        Args:
+            subreddit_service: The injected subreddit service.
+            prefix: The typed prefix, matched case-insensitively.
+            limit: The maximum number of suggestions.
+
+        Returns:
+            list[SubredditSuggestionDTO]: The matching subreddits, most popular first.
+        """
+        return await subreddit_service.suggest(prefix, limit)
 
     @get("/{name:str}")
     async def get_subreddit(
@@ -76,3 +139,51 @@ class SubredditController(Controller):
             SubredditResponseDTO: The requested subreddit.
         """
         return await subreddit_service.get_by_name(name)
+
+    @post("/{name:str}/subscription", status_code=HTTP_200_OK)
+    async def subscribe(
+        self, name: str, request: Request, subreddit_service: SubredditService
+    ) -> SubredditResponseDTO:
+        """
+        Join a subreddit.
+
+        Args:
+            name: The name of the subreddit.
+            request: The request object to retrieve the authenticated user.
+            subreddit_service: The injected subreddit service.
+
+        Returns:
+            SubredditResponseDTO: The subreddit, with its updated member count.
+
+        Raises:
+            NotAuthorizedException: If the user is not authenticated.
+        """
+        user: dict[str, Any] | None = request.user
+        if not user:
+            raise NotAuthorizedException()
+
+        return await subreddit_service.subscribe(name, user_id=int(user["id"]))
+
+    @delete("/{name:str}/subscription", status_code=HTTP_200_OK)
+    async def unsubscribe(
+        self, name: str, request: Request, subreddit_service: SubredditService
+    ) -> SubredditResponseDTO:
+        """
+        Leave a subreddit.
+
+        Args:
+            name: The name of the subreddit.
+            request: The request object to retrieve the authenticated user.
+            subreddit_service: The injected subreddit service.
+
+        Returns:
+            SubredditResponseDTO: The subreddit, with its updated member count.
+
+        Raises:
+            NotAuthorizedException: If the user is not authenticated.
+        """
+        user: dict[str, Any] | None = request.user
+        if not user:
+            raise NotAuthorizedException()
+
+        return await subreddit_service.unsubscribe(name, user_id=int(user["id"]))
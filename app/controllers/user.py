@@ -1,17 +1,28 @@
 from datetime import datetime
 from litestar import Controller, get, post, Request
 from litestar.di import Provide
-from litestar.exceptions import NotFoundException, NotAuthorizedException
-from app.dtos.user import UserRegisterDTO, UserLoginDTO, UserResponseDTO
+from litestar.exceptions import (
+    ClientException,
+    NotFoundException,
+    NotAuthorizedException,
+)
+from app.dtos.user import (
+    UserAvailabilityDTO,
+    UserRegisterDTO,
+    UserLoginDTO,
+    UserResponseDTO,
+)
 from app.dtos.auth import UserLoginResponseDTO
 from app.services.user_service import UserService
-from app.models.user import User
-
+from app.services.availability import availability_index
+from app.services.rate_limiter import client_address, rate_limiter
+from app.queries import USER_BY_USERNAME
 
 
 def provide_user_service() -> UserService:
     return UserService()
 
+
 class UserController(Controller):
     """
     Controller for handling user-related operations such as registration, login, and profile retrieval.
@@ -22,35 +33,45 @@ class UserController(Controller):
 
     @post("/register")
     async def register(
-        self, data: UserRegisterDTO, user_service: UserService
+        self, data: UserRegisterDTO, request: Request, user_service: UserService
     ) -> UserResponseDTO:
         """
         Register a new user.
 
         Args:
             data: The user registration data.
+            request: The request object, for the client address.
             user_service: The injected user service.
 
         Returns:
             UserResponseDTO: The created user's profile.
+
+        Raises:
+            TooManyRequestsException: If the client is rate limited.
         """
-        return await user_service.create_user(data)
+        return await user_service.create_user(data, client_ip=client_address(request))
 
     @post("/login")
     async def login(
-        self, data: UserLoginDTO, user_service: UserService
+        self, data: UserLoginDTO, request: Request, user_service: UserService
     ) -> UserLoginResponseDTO:
         """
         Authenticate a user and return a JWT token.
 
         Args:
             data: The user login credentials.
+            request: The request object, for the client address.
             user_service: The injected user service.
 
         Returns:
             UserLoginResponseDTO: The authentication response containing the access token.
+
+        Raises:
+            TooManyRequestsException: If the client or username is rate limited.
         """
-        return await user_service.authenticate_user(data)
+        return await user_service.authenticate_user(
+            data, client_ip=client_address(request)
+        )
 
     @get("/me")
     async def get_me(self, request: Request) -> UserResponseDTO:
@@ -80,6 +101,38 @@ class UserController(Controller):
             is_verified=user["is_verified"],
         )
 
+    @get("/available")
+    async def check_availability(
+        self,
+        request: Request,
+        username: str | None = None,
+        email: str | None = None,
+    ) -> UserAvailabilityDTO:
+        """
+        Check whether a username and/or email are free to register.
+
+        Answered from an in-memory filter for values no one has; only likely
+        matches are confirmed against the database. Rate limited per client
+        IP, so the endpoint cannot be used to enumerate accounts quickly.
+
+        Args:
+            request: The request, for the client IP.
+            username: The username to check.
+            email: The email address to check.
+
+        Returns:
+            UserAvailabilityDTO: Availability of each value given.
+
+        Raises:
+            ClientException: If neither a username nor an email is given.
+            TooManyRequestsException: If the client IP is over its limit.
+        """
+        if username is None and email is None:
+            raise ClientException("Provide a username or an email")
+        await rate_limiter.check_availability(client_address(request))
+
+        return await availability_index.check(username=username, email=email)
+
     @get("/{username:str}")
     async def get_user(self, username: str) -> UserResponseDTO:
         """
@@ -94,20 +147,10 @@ class UserController(Controller):
         Raises:
             NotFoundException: If the user does not exist.
         """
-        user: dict[str, str | int | bool | datetime | None] | None = (
-            await User.select().where(User.username == username).first()
-        )
-        if not user:
+        user: UserResponseDTO | None = await USER_BY_USERNAME.fetchrow(username)
+        if user is None:
             raise NotFoundException("User not found")
 
-        return UserResponseDTO(
-            id=user["id"],
-            username=user["username"],
-            email=user["email"],
-            avatar_url=user["avatar_url"],
-            bio=user["bio"],
-            is_active=user["is_active"],
-            is_verified=user["is_verified"],
-        )
+        return user
 
     # TODO: Helper to map User model to DTO if service methods aren't used for simple queries
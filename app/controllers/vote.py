@@ -0,0 +1,50 @@
+from typing import Any
+from litestar import Controller, post, Request
+from litestar.di import Provide
+from litestar.exceptions import NotAuthorizedException
+from litestar.status_codes import HTTP_200_OK
+from app.services.vote_service import VoteService
+from app.dtos.vote import VoteCreateDTO, VoteResponseDTO
+
+
+def provide_vote_service() -> VoteService:
+    return VoteService()
+
+
+class VoteController(Controller):
+    """
+    Controller for voting on posts.
+    """
+
+    path = "/api/posts"
+    dependencies = {"vote_service": Provide(lambda: provide_vote_service())}
+
+    @post("/{post_id:int}/vote", status_code=HTTP_200_OK)
+    async def cast_vote(
+        self,
+        post_id: int,
+        data: VoteCreateDTO,
+        request: Request,
+        vote_service: VoteService,
+    ) -> VoteResponseDTO:
+        """
+        Upvote (1), downvote (-1) or clear (0) the current user's vote on a post.
+
+        Args:
+            post_id: The ID of the post.
+            data: The vote value.
+            request: The request object.
+            vote_service: The injected vote service.
+
+        Returns:
+            VoteResponseDTO: The user's vote as now stored.
+
+        Raises:
+            NotAuthorizedException: If not authenticated.
+            NotFoundException: If the post does not exist.
+        """
+        user: dict[str, Any] | None = request.user
+        if not user:
+            raise NotAuthorizedException()
+
+        return await vote_service.cast_vote(post_id, data, user_id=int(user["id"]))
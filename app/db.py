@@ -0,0 +1,720 @@
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, Generic, TypeVar
+import asyncpg
+from asyncpg import Connection, Record
+from asyncpg.pool import Pool, PoolAcquireContext
+from litestar.exceptions import ServiceUnavailableException
+from piccolo.engine import engine_finder
+from piccolo.engine.postgres import PostgresEngine
+from piccolo.query.base import Query
+from piccolo.querystring import QueryString
+from piccolo.utils.warnings import colored_warning
+from app.dtos.health import PoolStatsDTO, ReplicaStatsDTO
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DB_POOL_MIN_SIZE: int = int(os.environ.get("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE: int = int(os.environ.get("DB_POOL_MAX_SIZE", "10"))
+DB_POOL_MAX_QUERIES: int = int(os.environ.get("DB_POOL_MAX_QUERIES", "50000"))
+DB_POOL_MAX_INACTIVE_LIFETIME: float = float(
+    os.environ.get("DB_POOL_MAX_INACTIVE_LIFETIME", "300")
+)
+DB_POOL_ACQUIRE_TIMEOUT: float = float(os.environ.get("DB_POOL_ACQUIRE_TIMEOUT", "5"))
+DB_STATEMENT_CACHE_SIZE: int = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "100"))
+DB_POOL_WARM_SIZE: int = int(os.environ.get("DB_POOL_WARM_SIZE", str(DB_POOL_MIN_SIZE)))
+DB_REPLICA_MAX_LAG: float = float(os.environ.get("DB_REPLICA_MAX_LAG", "5"))
+DB_REPLICA_LAG_CHECK_INTERVAL: float = float(
+    os.environ.get("DB_REPLICA_LAG_CHECK_INTERVAL", "2")
+)
+
+# Seconds a replica is behind the primary; 0 when it has replayed everything
+# it received, so an idle primary does not look like lag. NULL when the
+# replica is not streaming from the primary, since then its own receive and
+# replay positions say nothing about how far behind it is. Reading the WAL
+# receiver status needs the pg_read_all_stats (or pg_monitor) role.
+REPLICA_LAG_QUERY: str = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+"""
+
+
+class RequestRouting:
+    """
+    Per-request read routing state, shared by every task the request spawns.
+    """
+
+    def __init__(self, pinned: bool) -> None:
+        """
+        Args:
+            pinned: Whether reads must go to the primary from the start.
+        """
+        self.pinned: bool = pinned
+
+
+_request_routing: ContextVar[RequestRouting | None] = ContextVar(
+    "request_routing", default=None
+)
+
+
+def begin_request_routing(pinned: bool) -> Token[RequestRouting | None]:
+    """
+    Start tracking read routing for a request.
+
+    Args:
+        pinned: Whether every read in the request must use the primary.
+
+    Returns:
+        Token[RequestRouting | None]: The token to pass to `end_request_routing`.
+    """
+    return _request_routing.set(RequestRouting(pinned))
+
+
+def end_request_routing(token: Token[RequestRouting | None]) -> None:
+    """
+    Stop tracking read routing for a request.
+
+    Args:
+        token: The token returned by `begin_request_routing`.
+    """
+    _request_routing.reset(token)
+
+
+def pin_to_primary() -> None:
+    """
+    Send the rest of the current request's reads to the primary, after a write.
+    """
+    routing: RequestRouting | None = _request_routing.get()
+    if routing is not None:
+        routing.pinned = True
+
+
+def reads_pinned() -> bool:
+    """
+    Returns:
+        bool: True if the current request must read from the primary.
+    """
+    routing: RequestRouting | None = _request_routing.get()
+    return routing is not None and routing.pinned
+
+
+class QueryStats:
+    """
+    Query count and database time accumulated by one request.
+    """
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.seconds: float = 0.0
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def track_queries(stats: QueryStats) -> Token[QueryStats | None]:
+    """
+    Accumulate the queries run in the current context into `stats`.
+
+    Args:
+        stats: The stats to update.
+
+    Returns:
+        Token[QueryStats | None]: The token to pass to `stop_tracking_queries`.
+    """
+    return _query_stats.set(stats)
+
+
+def stop_tracking_queries(token: Token[QueryStats | None]) -> None:
+    """
+    Stop accumulating query stats.
+
+    Args:
+        token: The token returned by `track_queries`.
+    """
+    _query_stats.reset(token)
+
+
+def record_query(seconds: float) -> None:
+    """
+    Count one query against the current context, if it is being tracked.
+
+    Args:
+        seconds: How long the query took, including the connection acquire.
+    """
+    stats: QueryStats | None = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += seconds
+
+
+def is_read_only(querystring: QueryString) -> bool:
+    """
+    Check whether a Piccolo query is a plain SELECT that a replica can serve.
+
+    Anything else, including CTEs that may write, counts as a write.
+
+    Args:
+        querystring: The query to classify.
+
+    Returns:
+        bool: True for SELECT statements.
+    """
+    return querystring.template.lstrip()[:6].upper() == "SELECT"
+
+
+class TimedAcquire:
+    """
+    Wraps an asyncpg acquire context to record how long the caller waited.
+
+    Supports both forms Piccolo and asyncpg use: ``async with pool.acquire()``
+    and ``await pool.acquire()``.
+    """
+
+    def __init__(self, context: PoolAcquireContext, pool: "InstrumentedPool") -> None:
+        """
+        Args:
+            context: The underlying asyncpg acquire context.
+            pool: The pool that records the measurements.
+        """
+        self._context: PoolAcquireContext = context
+        self._pool: InstrumentedPool = pool
+
+    async def __aenter__(self) -> Connection:
+        return await self._pool.measure(self._context.__aenter__())
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self._context.__aexit__(exc_type, exc_val, exc_tb)
+
+    def __await__(self) -> Generator[Any, None, Connection]:
+        return self._pool.measure(self._context).__await__()
+
+
+class InstrumentedPool:
+    """
+    An asyncpg pool wrapper that applies an acquire timeout and tracks saturation.
+
+    Every other attribute is delegated to the wrapped pool, so Piccolo and
+    `acquire_connection` use it like a plain `asyncpg.Pool`.
+    """
+
+    def __init__(self, pool: Pool, acquire_timeout: float) -> None:
+        """
+        Args:
+            pool: The asyncpg pool to wrap.
+            acquire_timeout: Seconds to wait for a free connection before failing.
+        """
+        self.pool: Pool = pool
+        self.acquire_timeout: float = acquire_timeout
+        self.waiting: int = 0
+        self.acquired: int = 0
+        self.timeouts: int = 0
+        self.total_wait_seconds: float = 0.0
+        self.max_wait_seconds: float = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pool, name)
+
+    def acquire(self, *, timeout: float | None = None) -> TimedAcquire:
+        """
+        Acquire a connection, timing the wait.
+
+        Args:
+            timeout: Overrides the pool's acquire timeout.
+
+        Returns:
+            TimedAcquire: An awaitable / async context manager yielding the connection.
+        """
+        return TimedAcquire(
+            self.pool.acquire(
+                timeout=self.acquire_timeout if timeout is None else timeout
+            ),
+            self,
+        )
+
+    async def measure(self, acquiring: Awaitable[Connection]) -> Connection:
+        """
+        Await a connection acquisition and record the wait.
+
+        Args:
+            acquiring: The pending acquisition.
+
+        Returns:
+            Connection: The acquired connection.
+
+        Raises:
+            ServiceUnavailableException: If no connection freed up in time.
+        """
+        self.waiting += 1
+        started: float = time.perf_counter()
+        try:
+            connection: Connection = await acquiring
+        except TimeoutError:
+            self.timeouts += 1
+            raise ServiceUnavailableException(
+                "Database connection pool exhausted, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        finally:
+            self.waiting -= 1
+        waited: float = time.perf_counter() - started
+        self.acquired += 1
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return connection
+
+    def stats(self) -> PoolStatsDTO:
+        """
+        Snapshot the pool's size and acquire-wait counters.
+
+        Returns:
+            PoolStatsDTO: The current statistics.
+        """
+        size: int = self.pool.get_size()
+        idle: int = self.pool.get_idle_size()
+        return PoolStatsDTO(
+            running=True,
+            min_size=self.pool.get_min_size(),
+            max_size=self.pool.get_max_size(),
+            size=size,
+            idle=idle,
+            in_use=size - idle,
+            waiting=self.waiting,
+            acquired=self.acquired,
+            timeouts=self.timeouts,
+            avg_wait_ms=(
+                self.total_wait_seconds / self.acquired * 1000 if self.acquired else 0.0
+            ),
+            max_wait_ms=self.max_wait_seconds * 1000,
+        )
+
+
+class InstrumentedPostgresEngine(PostgresEngine):
+    """
+    A `PostgresEngine` whose pool is sized from env config and instrumented.
+
+    Configured in `piccolo_conf.py`; `start_connection_pool` applies the
+    `DB_POOL_*` settings and wraps the pool in an `InstrumentedPool`.
+
+    Read replicas are given as Piccolo `extra_nodes`. Outside a transaction,
+    SELECTs are sent round-robin to replicas that are within
+    `DB_REPLICA_MAX_LAG` seconds of the primary; any other statement runs on
+    the primary and pins the rest of the request's reads to it. With no
+    healthy replica, everything uses the primary.
+    """
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        min_size: int = DB_POOL_MIN_SIZE,
+        max_size: int = DB_POOL_MAX_SIZE,
+        max_queries: int = DB_POOL_MAX_QUERIES,
+        max_inactive_connection_lifetime: float = DB_POOL_MAX_INACTIVE_LIFETIME,
+        acquire_timeout: float = DB_POOL_ACQUIRE_TIMEOUT,
+        statement_cache_size: int = DB_STATEMENT_CACHE_SIZE,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            config: The asyncpg connection settings.
+            min_size: Connections opened when the pool starts and kept open.
+            max_size: The maximum number of connections per worker process.
+            max_queries: Queries after which a connection is replaced.
+            max_inactive_connection_lifetime: Seconds before an idle connection
+                is closed.
+            acquire_timeout: Seconds to wait for a free connection.
+            statement_cache_size: Prepared statements cached per connection.
+            **kwargs: Passed on to `PostgresEngine`.
+        """
+        super().__init__(
+            config={"statement_cache_size": statement_cache_size, **config}, **kwargs
+        )
+        self.pool_options: dict[str, Any] = {
+            "min_size": min_size,
+            "max_size": max_size,
+            "max_queries": max_queries,
+            "max_inactive_connection_lifetime": max_inactive_connection_lifetime,
+        }
+        self.acquire_timeout: float = acquire_timeout
+        self.max_replica_lag: float = DB_REPLICA_MAX_LAG
+        # Seconds behind the primary per replica; None if it is unreachable.
+        self.replica_lag: dict[str, float | None] = {
+            name: None for name in self.extra_nodes
+        }
+        self._next_replica: int = 0
+        self._lag_task: asyncio.Task[None] | None = None
+
+    async def start_connection_pool(self, **kwargs: Any) -> None:
+        """
+        Start the instrumented pool, the replica pools and the replica lag monitor.
+
+        Args:
+            **kwargs: Overrides for the pool and connection settings.
+        """
+        if self.pool:
+            colored_warning(
+                "A pool already exists - close it first if you want to create "
+                "a new pool.",
+            )
+            return
+        config: dict[str, Any] = {**self.config, **self.pool_options, **kwargs}
+        self.pool = InstrumentedPool(
+            await asyncpg.create_pool(**config), self.acquire_timeout
+        )
+
+        if self.extra_nodes:
+            for replica in self.extra_nodes.values():
+                await replica.start_connection_pool(**kwargs)
+            await self.check_replica_lag()
+            self._lag_task = asyncio.create_task(self._monitor_replicas())
+
+    async def close_connection_pool(self) -> None:
+        """
+        Stop the replica lag monitor and close every pool.
+        """
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            try:
+                await self._lag_task
+            except asyncio.CancelledError:
+                pass
+            self._lag_task = None
+        for replica in self.extra_nodes.values():
+            if replica.pool:
+                await replica.close_connection_pool()
+        await super().close_connection_pool()
+
+    async def check_replica_lag(self) -> None:
+        """
+        Measure every replica's lag; unreachable replicas, and replicas that
+        are not streaming from the primary, are marked down.
+        """
+        for name, replica in self.extra_nodes.items():
+            try:
+                async with acquire_connection(replica) as connection:
+                    lag: float | None = await connection.fetchval(REPLICA_LAG_QUERY)
+            except Exception:
+                logger.warning("Read replica %s is unreachable", name, exc_info=True)
+                self.replica_lag[name] = None
+                continue
+            if lag is None:
+                logger.warning("Read replica %s is not streaming WAL", name)
+            self.replica_lag[name] = None if lag is None else float(lag)
+
+    async def _monitor_replicas(self) -> None:
+        """
+        Background loop that re-checks replica lag every few seconds.
+        """
+        while True:
+            await asyncio.sleep(DB_REPLICA_LAG_CHECK_INTERVAL)
+            await self.check_replica_lag()
+
+    def healthy_replicas(self) -> list[PostgresEngine]:
+        """
+        Returns:
+            list[PostgresEngine]: The replicas that are reachable and within
+            `max_replica_lag` of the primary.
+        """
+        return [
+            replica
+            for name, replica in self.extra_nodes.items()
+            if (lag := self.replica_lag.get(name)) is not None
+            and lag <= self.max_replica_lag
+        ]
+
+    def read_engine(self) -> PostgresEngine:
+        """
+        Choose the engine for a read in the current context.
+
+        Returns:
+            PostgresEngine: A healthy replica, or this (primary) engine if the
+            request is pinned or no replica is healthy.
+        """
+        if not self.extra_nodes or reads_pinned():
+            return self
+        replicas: list[PostgresEngine] = self.healthy_replicas()
+        if not replicas:
+            return self
+        self._next_replica = (self._next_replica + 1) % len(replicas)
+        return replicas[self._next_replica]
+
+    async def run_querystring(
+        self, querystring: QueryString, in_pool: bool = True
+    ) -> Any:
+        """
+        Run a Piccolo query, routing plain SELECTs to a read replica.
+
+        The engine that finally runs the query records its time with
+        `record_query`.
+
+        Args:
+            querystring: The query.
+            in_pool: Whether to use the connection pool.
+
+        Returns:
+            Any: The query response.
+        """
+        if self.extra_nodes:
+            if not is_read_only(querystring):
+                pin_to_primary()
+            elif self.current_transaction.get() is None:
+                engine: PostgresEngine = self.read_engine()
+                if engine is not self:
+                    return await engine.run_querystring(querystring, in_pool=in_pool)
+        started: float = time.perf_counter()
+        try:
+            return await super().run_querystring(querystring, in_pool=in_pool)
+        finally:
+            record_query(time.perf_counter() - started)
+
+    def replica_stats(self) -> list[ReplicaStatsDTO]:
+        """
+        Snapshot the health and pool statistics of every replica.
+
+        Returns:
+            list[ReplicaStatsDTO]: One entry per configured replica.
+        """
+        return [
+            ReplicaStatsDTO(
+                name=name,
+                healthy=(lag := self.replica_lag.get(name)) is not None
+                and lag <= self.max_replica_lag,
+                lag_seconds=lag,
+                pool=(
+                    replica.pool_stats()
+                    if isinstance(replica, InstrumentedPostgresEngine)
+                    else None
+                ),
+            )
+            for name, replica in self.extra_nodes.items()
+        ]
+
+    async def warm_pool(self, connections: int = DB_POOL_WARM_SIZE) -> None:
+        """
+        Open and check pooled connections before the first request.
+
+        The connections are acquired concurrently and held together, which makes
+        the pool open up to `connections` of them (more than `min_size`, if
+        asked) instead of on demand. A round trip on each one checks it works.
+        Replica pools are warmed too. Failures are logged, not raised.
+
+        Args:
+            connections: How many connections to have open, capped at `max_size`.
+        """
+        for replica in self.extra_nodes.values():
+            if isinstance(replica, InstrumentedPostgresEngine):
+                await replica.warm_pool(connections)
+        if self.pool is None or connections <= 0:
+            return
+
+        count: int = min(connections, self.pool_options["max_size"])
+        acquired: list[Connection | BaseException] = await asyncio.gather(
+            *(self.pool.acquire() for _ in range(count)), return_exceptions=True
+        )
+        held: list[Connection] = [
+            connection
+            for connection in acquired
+            if not isinstance(connection, BaseException)
+        ]
+        try:
+            await asyncio.gather(
+                *(connection.fetchval("SELECT 1") for connection in held)
+            )
+        except Exception:
+            logger.warning("Connection pool warm-up failed", exc_info=True)
+        finally:
+            for connection in held:
+                await self.pool.release(connection)
+        if len(held) < count:
+            logger.warning("Warmed %s of %s pool connections", len(held), count)
+
+    def pool_stats(self) -> PoolStatsDTO:
+        """
+        Snapshot the pool statistics, or an empty one if no pool is running.
+
+        Returns:
+            PoolStatsDTO: The current statistics.
+        """
+        if isinstance(self.pool, InstrumentedPool):
+            return self.pool.stats()
+        return PoolStatsDTO(
+            running=False,
+            min_size=self.pool_options["min_size"],
+            max_size=self.pool_options["max_size"],
+            size=0,
+            idle=0,
+            in_use=0,
+            waiting=0,
+            acquired=0,
+            timeouts=0,
+            avg_wait_ms=0.0,
+            max_wait_ms=0.0,
+        )
+
+
+def get_engine() -> PostgresEngine:
+    """
+    Get the configured Piccolo Postgres engine.
+
+    Returns:
+        PostgresEngine: The engine from `piccolo_conf`.
+
+    Raises:
+        RuntimeError: If no engine is configured.
+    """
+    engine: PostgresEngine | None = engine_finder()
+    if engine is None:
+        raise RuntimeError("No Piccolo engine is configured")
+    return engine
+
+
+def get_read_engine() -> PostgresEngine:
+    """
+    Get the engine a read in the current context should use.
+
+    Returns:
+        PostgresEngine: A healthy read replica, or the primary engine.
+    """
+    engine: PostgresEngine = get_engine()
+    if isinstance(engine, InstrumentedPostgresEngine):
+        return engine.read_engine()
+    return engine
+
+
+@asynccontextmanager
+async def acquire_connection(
+    engine: PostgresEngine | None = None,
+) -> AsyncIterator[Connection]:
+    """
+    Borrow a raw asyncpg connection, from the pool when one is running.
+
+    Used for the asyncpg features Piccolo does not wrap (server-side cursors,
+    COPY, prepared statements).
+
+    Args:
+        engine: The engine to use, defaults to the configured one.
+
+    Yields:
+        Connection: The asyncpg connection.
+    """
+    engine = engine or get_engine()
+    if engine.pool is not None:
+        async with engine.pool.acquire() as connection:
+            yield connection
+    else:
+        connection: Connection = await engine.get_new_connection()
+        try:
+            yield connection
+        finally:
+            await connection.close()
+
+
+def compile_query(query: Query) -> tuple[str, list[Any]]:
+    """
+    Compile a Piccolo query into SQL and positional arguments for asyncpg.
+
+    Args:
+        query: The Piccolo query.
+
+    Returns:
+        tuple[str, list[Any]]: The SQL string and its arguments.
+    """
+    return query.querystrings[0].compile_string(engine_type="postgres")
+
+
+Row = TypeVar("Row")
+
+
+class PreparedQuery(Generic[Row]):
+    """
+    A fixed SQL statement for a hot read path, bypassing the Piccolo query builder.
+
+    Statements run on a read replica when the request allows it (see
+    `get_read_engine`), so they must not write.
+
+    The SQL text never changes, so asyncpg's per-connection statement cache
+    parses and plans it once per pooled connection and reuses the prepared
+    statement on every later call. Records are handed to `decode` as is,
+    typically to build a DTO positionally (see `positional`).
+    """
+
+    def __init__(self, sql: str, decode: Callable[[Record], Row]) -> None:
+        """
+        Args:
+            sql: The statement, with asyncpg ``$n`` placeholders.
+            decode: Maps one record to the returned row type.
+        """
+        self.sql: str = sql
+        self.decode: Callable[[Record], Row] = decode
+
+    async def fetch(self, *args: Any) -> list[Row]:
+        """
+        Run the statement and decode every record.
+
+        Args:
+            *args: The statement parameters.
+
+        Returns:
+            list[Row]: The decoded rows.
+        """
+        started: float = time.perf_counter()
+        async with acquire_connection(get_read_engine()) as connection:
+            records: list[Record] = await connection.fetch(self.sql, *args)
+        record_query(time.perf_counter() - started)
+        decode: Callable[[Record], Row] = self.decode
+        return [decode(record) for record in records]
+
+    async def fetchrow(self, *args: Any) -> Row | None:
+        """
+        Run the statement and decode the first record.
+
+        Args:
+            *args: The statement parameters.
+
+        Returns:
+            Row | None: The decoded row, or None if there was none.
+        """
+        started: float = time.perf_counter()
+        async with acquire_connection(get_read_engine()) as connection:
+            record: Record | None = await connection.fetchrow(self.sql, *args)
+        record_query(time.perf_counter() - started)
+        return None if record is None else self.decode(record)
+
+
+def positional(struct_type: Callable[..., Row]) -> Callable[[Record], Row]:
+    """
+    Build a decoder that passes a record's values to a struct positionally.
+
+    The statement must select its columns in the struct's field order.
+
+    Args:
+        struct_type: The msgspec struct (or any callable) to build.
+
+    Returns:
+        Callable[[Record], Row]: The record decoder.
+    """
+
+    def decode(record: Record) -> Row:
+        return struct_type(*record)
+
+    return decode
@@ -0,0 +1,33 @@
+from msgspec import Struct
+from datetime import datetime
+
+
+class CommentCreateDTO(Struct):
+    content: str
+    parent_id: int | None = None
+
+
+class CommentResponseDTO(Struct):
+    id: int
+    content: str
+    author_id: int
+    post_id: int
+    parent_id: int | None
+    depth: int
+    created_at: datetime
+
+
+class CommentNodeDTO(Struct):
+    id: int
+    content: str
+    author_id: int
+    parent_id: int | None
+    depth: int
+    reply_count: int
+    created_at: datetime
+    replies: list["CommentNodeDTO"] = []
+
+
+class CommentTreeDTO(Struct):
+    items: list[CommentNodeDTO]
+    next_cursor: str | None = None
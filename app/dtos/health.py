@@ -0,0 +1,48 @@
+from msgspec import Struct
+
+
+class HashingStatsDTO(Struct):
+    kind: str
+    workers: int
+    max_queue: int
+    in_flight: int
+    queue_depth: int
+    completed: int
+    rejected: int
+    avg_latency_ms: float
+    max_latency_ms: float
+
+
+class PoolStatsDTO(Struct):
+    running: bool
+    min_size: int
+    max_size: int
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    acquired: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class ReplicaStatsDTO(Struct):
+    name: str
+    healthy: bool
+    lag_seconds: float | None
+    pool: PoolStatsDTO | None
+
+
+class StartupPhaseDTO(Struct):
+    name: str
+    duration_ms: float
+    background: bool
+
+
+class StartupStatsDTO(Struct):
+    fast_start: bool
+    interpreter_ms: float | None
+    phases: list[StartupPhaseDTO]
+    ready_ms: float | None
+    first_response_ms: float | None
@@ -1,7 +1,14 @@
+from enum import Enum
 from msgspec import Struct
 from datetime import datetime
 
 
+class FeedSort(str, Enum):
+    HOT = "hot"
+    NEW = "new"
+    TOP = "top"
+
+
 class PostCreateDTO(Struct):
     title: str
     subreddit_name: str
@@ -17,3 +24,30 @@ class PostResponseDTO(Struct):
     created_at: datetime
     author_id: int
     subreddit_id: int
+    score: int = 0
+
+
+class PostSummaryDTO(Struct):
+    id: int
+    title: str
+    url: str | None
+    created_at: datetime
+    author_id: int
+    subreddit_id: int
+    preview: str | None
+    score: int = 0
+
+
+class PostPageDTO(Struct):
+    items: list[PostSummaryDTO]
+    next_cursor: str | None = None
+
+
+class PostBulkErrorDTO(Struct):
+    index: int
+    error: str
+
+
+class PostBulkResultDTO(Struct):
+    ids: list[int | None]
+    errors: list[PostBulkErrorDTO]
@@ -14,3 +14,11 @@ class SubredditResponseDTO(Struct):
     description: str | None
     created_at: datetime
     owner_id: int
+    post_count: int = 0
+    member_count: int = 0
+    last_activity_at: datetime | None = None
+
+
+class SubredditSuggestionDTO(Struct):
+    name: str
+    post_count: int
@@ -22,3 +22,9 @@ class UserResponseDTO(Struct):
     is_verified: bool
     avatar_url: str | None = None
     bio: str | None = None
+
+
+class UserAvailabilityDTO(Struct):
+    # None for values that were not asked about.
+    username_available: bool | None = None
+    email_available: bool | None = None
@@ -0,0 +1,11 @@
+from typing import Literal
+from msgspec import Struct
+
+
+class VoteCreateDTO(Struct):
+    value: Literal[-1, 0, 1]
+
+
+class VoteResponseDTO(Struct):
+    post_id: int
+    value: int
@@ -0,0 +1,29 @@
+import hmac
+import os
+from litestar.connection import ASGIConnection
+from litestar.exceptions import NotAuthorizedException
+from litestar.handlers.base import BaseRouteHandler
+
+# Bearer token required by the operational endpoints (`/metrics`,
+# `/api/health/*`). Unset, they are open and must only be reachable on an
+# internal network.
+OPS_TOKEN: str = os.environ.get("OPS_TOKEN", "")
+
+
+def require_ops_token(connection: ASGIConnection, _: BaseRouteHandler) -> None:
+    """
+    Guard the operational endpoints with `OPS_TOKEN`, when one is configured.
+
+    Args:
+        connection: The ASGI connection object.
+        _: The route handler being guarded.
+
+    Raises:
+        NotAuthorizedException: If a token is configured and the request does
+            not carry it as ``Authorization: Bearer <token>``.
+    """
+    if not OPS_TOKEN:
+        return
+    auth_header: str = connection.headers.get("Authorization", "")
+    if not hmac.compare_digest(auth_header.encode(), f"Bearer {OPS_TOKEN}".encode()):
+        raise NotAuthorizedException("Invalid operations token")
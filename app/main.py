@@ -1,10 +1,29 @@
+# Imported first, so startup phases are timed from the start of the app import.
+from app.services.startup import FAST_START, OPENAPI_SCHEMA_PATH, startup_timer
 from litestar.openapi import OpenAPIConfig
 from litestar import Litestar
 from piccolo.engine import engine_finder
 from app.controllers.user import UserController
 from app.controllers.subreddit import SubredditController
 from app.controllers.post import PostController
+from app.controllers.health import HealthController
+from app.controllers.vote import VoteController
+from app.controllers.comment import CommentController
+from app.controllers.search import SearchController
+from app.controllers.feed import FeedController
+from app.controllers.metrics import MetricsController
+from app.controllers.schema import SchemaController
+from app.services.availability import availability_index
+from app.services.feed_index import feed_index
+from app.services.hashing_pool import hashing_pool
+from app.services.rate_limiter import rate_limiter
+from app.services.score_counters import score_counters
+from app.services.subreddit_counters import subreddit_counters
+from app.services.subreddit_directory import subreddit_directory
+from app.services.timeline import timeline_fanout
 from litestar.openapi.plugins import SwaggerRenderPlugin, StoplightRenderPlugin
+from app.db import InstrumentedPostgresEngine
+import os
 
 
 # Piccolo connection management
@@ -14,6 +33,12 @@ async def on_startup():
         await engine.start_connection_pool()
 
 
+async def warm_pool():
+    engine = engine_finder()
+    if isinstance(engine, InstrumentedPostgresEngine):
+        await engine.warm_pool()
+
+
 async def on_shutdown():
     engine = engine_finder()
     if engine:
@@ -21,6 +46,8 @@ async def on_shutdown():
 
 
 from app.middleware.auth import JWTAuthenticationMiddleware
+from app.middleware.db_routing import ReplicaRoutingMiddleware
+from app.middleware.metrics import MetricsMiddleware
 
 api_config = OpenAPIConfig(
     title="Reddit Clone API",
@@ -28,11 +55,61 @@ api_config = OpenAPIConfig(
     render_plugins=[SwaggerRenderPlugin()],
 )
 
+route_handlers = [
+    UserController,
+    SubredditController,
+    PostController,
+    HealthController,
+    VoteController,
+    CommentController,
+    SearchController,
+    FeedController,
+    MetricsController,
+]
+
+# In cold start mode, serve the schema generated at build time
+# (`python -m app.openapi`) rather than generating it in the worker.
+serve_prebuilt_schema = FAST_START and os.path.exists(OPENAPI_SCHEMA_PATH)
+if serve_prebuilt_schema:
+    route_handlers.append(SchemaController)
+
+startup_timer.mark("imports")
+
 app = Litestar(
-    route_handlers=[UserController, SubredditController, PostController],
-    on_startup=[on_startup],
-    on_shutdown=[on_shutdown],
+    route_handlers=route_handlers,
+    on_startup=[
+        startup_timer.timed("db_pool", on_startup),
+        startup_timer.timed("db_pool_warm", warm_pool),
+        # Directory misses fall back to the database, so in FAST_START mode
+        # the first requests need not wait for it.
+        startup_timer.deferrable("subreddit_directory", subreddit_directory.warm),
+        subreddit_directory.start,
+        feed_index.start,
+        availability_index.start,
+        score_counters.start,
+        subreddit_counters.start,
+        timeline_fanout.start,
+        startup_timer.ready,
+    ],
+    # Counters flush one last time, so they must stop before the pool.
+    on_shutdown=[
+        feed_index.stop,
+        availability_index.stop,
+        subreddit_directory.stop,
+        score_counters.stop,
+        subreddit_counters.stop,
+        timeline_fanout.stop,
+        hashing_pool.shutdown,
+        rate_limiter.close,
+        on_shutdown,
+    ],
     debug=True,
-    openapi_config=api_config,
-    middleware=[JWTAuthenticationMiddleware],
+    openapi_config=None if serve_prebuilt_schema else api_config,
+    middleware=[
+        ReplicaRoutingMiddleware(),
+        MetricsMiddleware(),
+        JWTAuthenticationMiddleware,
+    ],
 )
+
+startup_timer.mark("build_app")
@@ -0,0 +1,123 @@
+import time
+from collections.abc import Collection, Iterable, Mapping
+from operator import itemgetter
+from typing import Any, Generic, TypeVar
+import msgspec
+from asyncpg import Connection, Record
+from piccolo.query.base import Query
+from app.db import acquire_connection, compile_query, get_read_engine, record_query
+
+Row = TypeVar("Row", bound=msgspec.Struct)
+
+
+class RowMapper(Generic[Row]):
+    """
+    Maps database rows to a msgspec struct by column name, without a kwargs dict.
+
+    The column names for the struct's fields are resolved once, into an
+    `itemgetter` that pulls a row's values out as a tuple in field order; the
+    struct is then built positionally. Works on asyncpg `Record`s and on
+    Piccolo's dict rows alike, and ignores extra columns.
+    """
+
+    def __init__(
+        self,
+        struct_type: type[Row],
+        renames: Mapping[str, str] | None = None,
+        skip: Collection[str] = (),
+    ) -> None:
+        """
+        Args:
+            struct_type: The struct to build.
+            renames: Column names for fields that are named differently, as
+                ``{field: column}``, e.g. ``{"author_id": "author"}``.
+            skip: Trailing fields with defaults that are not read from the row.
+
+        Raises:
+            ValueError: If a skipped field is not a trailing field with a default.
+        """
+        renames = renames or {}
+        fields: tuple[msgspec.structs.FieldInfo, ...] = msgspec.structs.fields(
+            struct_type
+        )
+        mapped: list[str] = [field.name for field in fields if field.name not in skip]
+        if mapped != [field.name for field in fields[: len(mapped)]] or any(
+            field.required for field in fields[len(mapped) :]
+        ):
+            raise ValueError(
+                f"{struct_type.__name__}: only trailing fields with defaults can be skipped"
+            )
+        self.struct_type: type[Row] = struct_type
+        self.columns: tuple[str, ...] = tuple(
+            renames.get(name, name) for name in mapped
+        )
+        # itemgetter returns a bare value, not a tuple, for a single key.
+        self._values: itemgetter = (
+            itemgetter(*self.columns)
+            if len(self.columns) > 1
+            else lambda row: (row[self.columns[0]],)
+        )
+
+    def __call__(self, row: Mapping[str, Any]) -> Row:
+        """
+        Map one row.
+
+        Args:
+            row: The row, as an asyncpg record or a dict.
+
+        Returns:
+            Row: The struct.
+        """
+        return self.struct_type(*self._values(row))
+
+    def many(self, rows: Iterable[Mapping[str, Any]]) -> list[Row]:
+        """
+        Map a list of rows.
+
+        Args:
+            rows: The rows, as asyncpg records or dicts.
+
+        Returns:
+            list[Row]: The structs, in row order.
+        """
+        struct_type: type[Row] = self.struct_type
+        values: itemgetter = self._values
+        return [struct_type(*values(row)) for row in rows]
+
+
+async def fetch_records(query: Query) -> list[Record]:
+    """
+    Run a read-only Piccolo query on asyncpg directly, returning the raw records.
+
+    Skips the dict Piccolo builds for every row. The query runs on a read
+    replica when the request allows it, so it must not write.
+
+    Args:
+        query: The Piccolo select (or raw SELECT) query.
+
+    Returns:
+        list[Record]: The records, which support lookup by column name.
+    """
+    sql: str
+    args: list[Any]
+    sql, args = compile_query(query)
+    started: float = time.perf_counter()
+    connection: Connection
+    async with acquire_connection(get_read_engine()) as connection:
+        records: list[Record] = await connection.fetch(sql, *args)
+    record_query(time.perf_counter() - started)
+    return records
+
+
+async def fetch_mapped(query: Query, mapper: RowMapper[Row]) -> list[Row]:
+    """
+    Run a read-only Piccolo query and map the records straight to structs.
+
+    Args:
+        query: The Piccolo select (or raw SELECT) query.
+        mapper: Maps each record to the response struct.
+
+    Returns:
+        list[Row]: The mapped rows.
+    """
+    return mapper.many(await fetch_records(query))
@@ -1,12 +1,12 @@
-from datetime import datetime
 from litestar.connection import ASGIConnection
 from litestar.middleware.authentication import (
     AuthenticationResult,
     AbstractAuthenticationMiddleware,
 )
 from litestar.exceptions import NotAuthorizedException
-from app.services.auth_service import AuthService
-from app.models.user import User
+from app.services.auth_service import AUTH_TRUST_TOKEN_CLAIMS, AuthService
+from app.services.principal_cache import Principal, principal_cache
+from app.queries import PRINCIPAL_BY_ID
 
 
 class JWTAuthenticationMiddleware(AbstractAuthenticationMiddleware):
@@ -15,6 +15,8 @@ class JWTAuthenticationMiddleware(AbstractAuthenticationMiddleware):
 
     This middleware extracts the Bearer token from the Authorization header,
     validates it, and attaches the authenticated user to the request scope.
+    Principals are served from `principal_cache`, so the database is only
+    queried on a cache miss (or never, with `AUTH_TRUST_TOKEN_CLAIMS`).
     """
 
     async def authenticate_request(
@@ -46,17 +48,25 @@ class JWTAuthenticationMiddleware(AbstractAuthenticationMiddleware):
             raise NotAuthorizedException("Invalid authorization header format")
 
         auth_service: AuthService = AuthService()
-        user_id: int | None = auth_service.decode_token(token)
+        user_id: int | None
+        if AUTH_TRUST_TOKEN_CLAIMS:
+            # One decode yields both the claim and, for older tokens without
+            # one, the subject to look up.
+            claimed: Principal | None
+            user_id, claimed = auth_service.decode_claims(token)
+            if claimed:
+                return AuthenticationResult(user=claimed, auth=token)
+        else:
+            user_id = auth_service.decode_token(token)
 
         if not user_id:
             raise NotAuthorizedException("Invalid or expired token")
 
-        # We return a simple user object or dictionary.
-        # For performance, maybe just ID, but fetching user ensures existence.
-        user: dict[str, str | int | bool | datetime | None] | None = (
-            await User.select().where(User.id == user_id).first()
-        )
-        if not user:
-            raise NotAuthorizedException("User not found")
+        user: Principal | None = principal_cache.get(user_id)
+        if user is None:
+            user = await PRINCIPAL_BY_ID.fetchrow(user_id)
+            if not user:
+                raise NotAuthorizedException("User not found")
+            principal_cache.set(user_id, user)
 
         return AuthenticationResult(user=user, auth=token)
@@ -0,0 +1,38 @@
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Receive, Scope, Send
+from app.db import begin_request_routing, end_request_routing
+
+# Methods whose reads may be served by a read replica.
+REPLICA_SAFE_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+
+
+class ReplicaRoutingMiddleware(ASGIMiddleware):
+    """
+    Middleware that scopes read-replica routing to one request.
+
+    GET and HEAD requests may read from replicas until they write. Every other
+    method reads from the primary, so a handler sees its own writes. Runs
+    before authentication, so the principal lookup is routed too.
+    """
+
+    scopes = ("http",)
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        """
+        Track routing state for the request, then call the next app.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+            next_app: The next ASGI application in the stack.
+        """
+        token = begin_request_routing(
+            pinned=scope.get("method") not in REPLICA_SAFE_METHODS
+        )
+        try:
+            await next_app(scope, receive, send)
+        finally:
+            end_request_routing(token)
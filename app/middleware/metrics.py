@@ -0,0 +1,54 @@
+import time
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, Message, Receive, Scope, Send
+from app.db import QueryStats, stop_tracking_queries, track_queries
+from app.services.metrics import RouteMetrics, metrics
+from app.services.startup import startup_timer
+
+
+class MetricsMiddleware(ASGIMiddleware):
+    """
+    Middleware recording per-route latency, status codes, in-flight requests
+    and database query time into `metrics`, and the worker's first successful
+    response into `startup_timer`.
+
+    Runs before authentication, so the principal lookup counts towards the
+    request's queries.
+    """
+
+    scopes = ("http",)
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        """
+        Time the request and record it against its route.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive function.
+            send: The ASGI send function.
+            next_app: The next ASGI application in the stack.
+        """
+        route: RouteMetrics = metrics.route(scope["method"], scope["path_template"])
+        queries: QueryStats = QueryStats()
+        # Unhandled exceptions are turned into a 500 further out.
+        status: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = track_queries(queries)
+        route.in_flight += 1
+        started: float = time.perf_counter()
+        try:
+            await next_app(scope, receive, send_with_status)
+        finally:
+            route.in_flight -= 1
+            route.observe(time.perf_counter() - started, status, queries)
+            if startup_timer.first_response_seconds is None and status < 400:
+                startup_timer.first_response()
+            stop_tracking_queries(token)
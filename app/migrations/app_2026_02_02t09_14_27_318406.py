@@ -0,0 +1,29 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-02-02T09:14:27:318406"
+VERSION = "1.30.0"
+DESCRIPTION = "Composite index for keyset pagination of subreddit posts"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def run():
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS post_subreddit_created_at_id_idx "
+            "ON post (subreddit, created_at DESC, id DESC)"
+        )
+
+    async def run_backwards():
+        await RawTable.raw("DROP INDEX IF EXISTS post_subreddit_created_at_id_idx")
+
+    manager.add_raw(run)
+    manager.add_raw_backwards(run_backwards)
+
+    return manager
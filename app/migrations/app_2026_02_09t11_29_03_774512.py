@@ -0,0 +1,30 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-02-09T11:29:03:774512"
+VERSION = "1.30.0"
+DESCRIPTION = "Backfill post content previews"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def backfill():
+        # Mirrors `make_preview` in app/services/post_service.py.
+        await RawTable.raw(
+            "UPDATE post SET preview = CASE "
+            # Strips all trailing whitespace, like `str.rstrip`, not just spaces.
+            "WHEN length(content) > 200 "
+            r"THEN regexp_replace(left(content, 199), '\s+$', '') || '…' "
+            "ELSE content END "
+            "WHERE content IS NOT NULL"
+        )
+
+    manager.add_raw(backfill)
+
+    return manager
@@ -0,0 +1,32 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-02-14T16:05:21:093846"
+VERSION = "1.30.0"
+DESCRIPTION = "Index votes per user and posts by score"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def run():
+        await RawTable.raw(
+            'CREATE UNIQUE INDEX IF NOT EXISTS vote_user_post_key ON vote ("user", post)'
+        )
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS post_score_id_idx ON post (score DESC, id DESC)"
+        )
+
+    async def run_backwards():
+        await RawTable.raw("DROP INDEX IF EXISTS post_score_id_idx")
+        await RawTable.raw("DROP INDEX IF EXISTS vote_user_post_key")
+
+    manager.add_raw(run)
+    manager.add_raw_backwards(run_backwards)
+
+    return manager
@@ -0,0 +1,33 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-02-17T10:42:36:618290"
+VERSION = "1.30.0"
+DESCRIPTION = "Collate and index comment paths"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def run():
+        # Byte-wise ordering keeps "/" below every digit, so a path sorts
+        # right before its descendants regardless of the database locale.
+        await RawTable.raw(
+            'ALTER TABLE comment ALTER COLUMN path TYPE text COLLATE "C"'
+        )
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS comment_post_path_idx ON comment (post, path)"
+        )
+
+    async def run_backwards():
+        await RawTable.raw("DROP INDEX IF EXISTS comment_post_path_idx")
+
+    manager.add_raw(run)
+    manager.add_raw_backwards(run_backwards)
+
+    return manager
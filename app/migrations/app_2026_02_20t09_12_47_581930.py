@@ -0,0 +1,39 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-02-20T09:12:47:581930"
+VERSION = "1.30.0"
+DESCRIPTION = "Full-text search vector on posts"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def run():
+        # A generated column is kept out of the `Post` model so Piccolo never
+        # tries to write it; see app/services/search_service.py.
+        await RawTable.raw(
+            "ALTER TABLE post ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            "GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+            ") STORED"
+        )
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS post_search_vector_idx "
+            "ON post USING GIN (search_vector)"
+        )
+
+    async def run_backwards():
+        await RawTable.raw("DROP INDEX IF EXISTS post_search_vector_idx")
+        await RawTable.raw("ALTER TABLE post DROP COLUMN IF EXISTS search_vector")
+
+    manager.add_raw(run)
+    manager.add_raw_backwards(run_backwards)
+
+    return manager
@@ -0,0 +1,57 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.columns.column_types import Integer
+from piccolo.columns.column_types import Timestamp
+from piccolo.columns.indexes import IndexMethod
+
+
+ID = "2026-02-23T14:05:19:402716"
+VERSION = "1.30.0"
+DESCRIPTION = "Denormalized subreddit post count and last activity"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    manager.add_column(
+        table_class_name="Subreddit",
+        tablename="subreddit",
+        column_name="post_count",
+        db_column_name="post_count",
+        column_class_name="Integer",
+        column_class=Integer,
+        params={
+            "default": 0,
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.add_column(
+        table_class_name="Subreddit",
+        tablename="subreddit",
+        column_name="last_activity_at",
+        db_column_name="last_activity_at",
+        column_class_name="Timestamp",
+        column_class=Timestamp,
+        params={
+            "default": None,
+            "null": True,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    return manager
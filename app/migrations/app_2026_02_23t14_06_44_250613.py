@@ -0,0 +1,30 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-02-23T14:06:44:250613"
+VERSION = "1.30.0"
+DESCRIPTION = "Backfill subreddit post counts and last activity"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def run():
+        # Backfill from the existing posts; the counters keep them current
+        # from here on.
+        await RawTable.raw(
+            "UPDATE subreddit SET post_count = stats.post_count, "
+            "last_activity_at = stats.last_activity_at "
+            "FROM (SELECT subreddit, count(*) AS post_count, "
+            "max(created_at) AS last_activity_at FROM post GROUP BY subreddit) AS stats "
+            "WHERE subreddit.id = stats.subreddit"
+        )
+
+    manager.add_raw(run)
+
+    return manager
@@ -0,0 +1,54 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-02-26T10:20:07:845126"
+VERSION = "1.30.0"
+DESCRIPTION = "Index subscriptions and home timelines"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def run():
+        # Backs idempotent joins, and the fan-out join from a subreddit to
+        # its members.
+        await RawTable.raw(
+            "CREATE UNIQUE INDEX IF NOT EXISTS subscription_user_subreddit_key "
+            'ON subscription ("user", subreddit)'
+        )
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS subscription_subreddit_idx "
+            "ON subscription (subreddit)"
+        )
+        # Makes fan-out idempotent; a timeline page is a range scan on the second.
+        await RawTable.raw(
+            "CREATE UNIQUE INDEX IF NOT EXISTS timeline_entry_user_post_key "
+            'ON timeline_entry ("user", post)'
+        )
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS timeline_entry_user_created_at_post_idx "
+            'ON timeline_entry ("user", created_at DESC, post DESC)'
+        )
+        # Deleting a post cascades to its timeline entries.
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS timeline_entry_post_idx ON timeline_entry (post)"
+        )
+
+    async def run_backwards():
+        await RawTable.raw("DROP INDEX IF EXISTS timeline_entry_post_idx")
+        await RawTable.raw(
+            "DROP INDEX IF EXISTS timeline_entry_user_created_at_post_idx"
+        )
+        await RawTable.raw("DROP INDEX IF EXISTS timeline_entry_user_post_key")
+        await RawTable.raw("DROP INDEX IF EXISTS subscription_subreddit_idx")
+        await RawTable.raw("DROP INDEX IF EXISTS subscription_user_subreddit_key")
+
+    manager.add_raw(run)
+    manager.add_raw_backwards(run_backwards)
+
+    return manager
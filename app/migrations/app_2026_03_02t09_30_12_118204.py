@@ -0,0 +1,50 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.columns.column_types import Boolean
+from piccolo.columns.indexes import IndexMethod
+
+
+ID = "2026-03-02T09:30:12:118204"
+VERSION = "1.30.0"
+DESCRIPTION = "Track which posts are included in subreddit post counts"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    # Existing posts were counted by the stats backfill, so the column is
+    # added as TRUE for them (a metadata-only change) and new posts then
+    # default to FALSE until the counters flush them.
+    manager.add_column(
+        table_class_name="Post",
+        tablename="post",
+        column_name="counted",
+        db_column_name="counted",
+        column_class_name="Boolean",
+        column_class=Boolean,
+        params={
+            "default": True,
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    manager.alter_column(
+        table_class_name="Post",
+        tablename="post",
+        column_name="counted",
+        db_column_name="counted",
+        params={"default": False},
+        old_params={"default": True},
+        column_class=Boolean,
+        old_column_class=Boolean,
+        schema=None,
+    )
+
+    return manager
@@ -0,0 +1,31 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.table import Table
+
+
+class RawTable(Table):
+    pass
+
+
+ID = "2026-03-02T09:31:40:562917"
+VERSION = "1.30.0"
+DESCRIPTION = "Index posts not yet included in subreddit post counts"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    async def run():
+        # Only posts awaiting a counter flush are indexed, so the index stays
+        # tiny; the reconciliation scans it for posts whose flush was lost.
+        await RawTable.raw(
+            "CREATE INDEX IF NOT EXISTS post_uncounted_created_at_idx "
+            "ON post (created_at) WHERE NOT counted"
+        )
+
+    async def run_backwards():
+        await RawTable.raw("DROP INDEX IF EXISTS post_uncounted_created_at_idx")
+
+    manager.add_raw(run)
+    manager.add_raw_backwards(run_backwards)
+
+    return manager
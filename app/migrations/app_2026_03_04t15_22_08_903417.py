@@ -0,0 +1,37 @@
+from piccolo.apps.migrations.auto.migration_manager import MigrationManager
+from piccolo.columns.column_types import Boolean
+from piccolo.columns.indexes import IndexMethod
+
+
+ID = "2026-03-04T15:22:08:903417"
+VERSION = "1.30.0"
+DESCRIPTION = "Track subreddits with posts missing from home timelines"
+
+
+async def forwards():
+    manager = MigrationManager(migration_id=ID, app_name="app", description=DESCRIPTION)
+
+    # No backfill: subreddits at the fan-out threshold are pulled by their
+    # member count, and the flag is cleared by the first post skipped.
+    manager.add_column(
+        table_class_name="Subreddit",
+        tablename="subreddit",
+        column_name="fanned_out",
+        db_column_name="fanned_out",
+        column_class_name="Boolean",
+        column_class=Boolean,
+        params={
+            "default": True,
+            "null": False,
+            "primary_key": False,
+            "unique": False,
+            "index": False,
+            "index_method": IndexMethod.btree,
+            "choices": None,
+            "db_column_name": None,
+            "secret": False,
+        },
+        schema=None,
+    )
+
+    return manager
@@ -0,0 +1,32 @@
+from piccolo.table import Table
+from piccolo.columns import Text, Serial, SmallInt, Integer, Timestamp, ForeignKey
+from datetime import datetime
+from app.models.user import User
+from app.models.post import Post
+
+# Each path segment is a comment ID zero-padded to this width, so paths sort
+# in thread order (parents before children, siblings oldest first).
+PATH_SEGMENT_WIDTH: int = 10
+PATH_SEPARATOR: str = "/"
+
+
+class Comment(Table):
+    """
+    Model representing a comment on a post, optionally replying to another comment.
+
+    `path` is the materialized path of comment IDs from the top-level comment
+    down to this one (e.g. ``0000000004/0000000019``). It uses the "C"
+    collation and is indexed together with `post`, so a whole thread, or any
+    subtree, is a single range scan in display order.
+    """
+
+    id = Serial(primary_key=True)
+    content = Text()
+    author = ForeignKey(references=User)
+    post = ForeignKey(references=Post)
+    parent = ForeignKey(references="self", null=True)
+    path = Text()
+    depth = SmallInt(default=0)
+    # Number of direct replies, maintained when a reply is inserted.
+    reply_count = Integer(default=0)
+    created_at = Timestamp(default=datetime.now)
@@ -1,9 +1,19 @@
 from piccolo.table import Table
-from piccolo.columns import Varchar, Timestamp, Text, Serial, ForeignKey
+from piccolo.columns import (
+    Boolean,
+    ForeignKey,
+    Integer,
+    Serial,
+    Text,
+    Timestamp,
+    Varchar,
+)
 from datetime import datetime
 from app.models.user import User
 from app.models.subreddit import Subreddit
 
+PREVIEW_LENGTH: int = 200
+
 
 class Post(Table):
     """
@@ -13,7 +23,14 @@ class Post(Table):
     id = Serial(primary_key=True)
     title = Varchar(length=300)
     content = Text(null=True)
+    # Short excerpt of `content` computed at write time, used by list endpoints.
+    preview = Varchar(length=PREVIEW_LENGTH, null=True, default=None)
     url = Varchar(length=1000, null=True)
     created_at = Timestamp(default=datetime.now)
     author = ForeignKey(references=User)
     subreddit = ForeignKey(references=Subreddit)
+    # Net vote score, maintained by the write-behind counters in VoteService.
+    score = Integer(default=0)
+    # Whether the post is included in `Subreddit.post_count`; set when the
+    # write-behind subreddit counters flush it.
+    counted = Boolean(default=False)
@@ -1,5 +1,13 @@
 from piccolo.table import Table
-from piccolo.columns import Varchar, Timestamp, Text, Serial, ForeignKey
+from piccolo.columns import (
+    Boolean,
+    ForeignKey,
+    Integer,
+    Serial,
+    Text,
+    Timestamp,
+    Varchar,
+)
 from datetime import datetime
 from app.models.user import User
 
@@ -14,3 +22,12 @@ class Subreddit(Table):
     description = Text(null=True)
     created_at = Timestamp(default=datetime.now)
     owner = ForeignKey(references=User)
+    # Denormalized stats, maintained by the write-behind counters in
+    # PostService and repaired by a periodic reconciliation.
+    post_count = Integer(default=0)
+    # Kept exact by the subscribe/unsubscribe statements in SubredditService.
+    member_count = Integer(default=0)
+    # Cleared for good once the timeline fan-out skips one of its posts, so
+    # home feeds keep pulling those posts even if the subreddit shrinks.
+    fanned_out = Boolean(default=True)
+    last_activity_at = Timestamp(null=True, default=None)
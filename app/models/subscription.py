@@ -0,0 +1,20 @@
+from piccolo.table import Table
+from piccolo.columns import Serial, Timestamp, ForeignKey
+from datetime import datetime
+from app.models.user import User
+from app.models.subreddit import Subreddit
+
+
+class Subscription(Table):
+    """
+    Model representing a user's membership of a subreddit.
+
+    A unique index on (user, subreddit), added in a raw migration, makes
+    joining idempotent. `Subreddit.member_count` is kept in step in the same
+    statement.
+    """
+
+    id = Serial(primary_key=True)
+    user = ForeignKey(references=User)
+    subreddit = ForeignKey(references=Subreddit)
+    created_at = Timestamp(default=datetime.now)
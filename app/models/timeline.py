@@ -0,0 +1,21 @@
+from piccolo.table import Table
+from piccolo.columns import Serial, Timestamp, ForeignKey
+from app.models.user import User
+from app.models.post import Post
+from app.models.subreddit import Subreddit
+
+
+class TimelineEntry(Table, tablename="timeline_entry"):
+    """
+    Model representing a post fanned out to a subscriber's home timeline.
+
+    Written for posts in subreddits below the fan-out threshold; see
+    app/services/timeline.py. `created_at` is copied from the post so a
+    timeline page is one range scan on the (user, created_at, post) index.
+    """
+
+    id = Serial(primary_key=True)
+    user = ForeignKey(references=User)
+    post = ForeignKey(references=Post)
+    subreddit = ForeignKey(references=Subreddit)
+    created_at = Timestamp()
@@ -0,0 +1,20 @@
+from piccolo.table import Table
+from piccolo.columns import Serial, SmallInt, Timestamp, ForeignKey
+from datetime import datetime
+from app.models.user import User
+from app.models.post import Post
+
+
+class Vote(Table):
+    """
+    Model representing a user's up- or down-vote on a post.
+
+    A unique index on (user, post), added in a raw migration, backs the vote
+    upsert. Scores are not aggregated from this table; see `Post.score`.
+    """
+
+    id = Serial(primary_key=True)
+    user = ForeignKey(references=User)
+    post = ForeignKey(references=Post)
+    value = SmallInt()
+    created_at = Timestamp(default=datetime.now)
@@ -0,0 +1,33 @@
+"""
+Write the app's OpenAPI schema to a file at build time.
+
+Usage:
+    python -m app.openapi [PATH]
+
+In `FAST_START` mode the app serves this file at ``/schema/openapi.json``
+instead of generating the schema in the worker. PATH defaults to
+`OPENAPI_SCHEMA_PATH`.
+"""
+
+import sys
+import msgspec
+from app.services.startup import FAST_START, OPENAPI_SCHEMA_PATH
+
+
+def export_schema(path: str) -> None:
+    """
+    Generate the OpenAPI schema and write it as JSON.
+
+    Args:
+        path: The file to write.
+    """
+    if FAST_START:
+        raise SystemExit("Unset FAST_START to generate the OpenAPI schema")
+    from app.main import app
+
+    with open(path, "wb") as schema_file:
+        schema_file.write(msgspec.json.encode(app.openapi_schema.to_schema()))
+
+
+if __name__ == "__main__":
+    export_schema(sys.argv[1] if len(sys.argv) > 1 else OPENAPI_SCHEMA_PATH)
@@ -3,13 +3,25 @@ from piccolo.conf.apps import AppConfig
 from app.models.user import User
 from app.models.subreddit import Subreddit
 from app.models.post import Post
+from app.models.vote import Vote
+from app.models.comment import Comment
+from app.models.subscription import Subscription
+from app.models.timeline import TimelineEntry
 
 CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 
 APP_CONFIG = AppConfig(
     app_name="app",
     migrations_folder_path=os.path.join(CURRENT_DIRECTORY, "migrations"),
-    table_classes=[User, Subreddit, Post],
+    table_classes=[
+        User,
+        Subreddit,
+        Post,
+        Vote,
+        Comment,
+        Subscription,
+        TimelineEntry,
+    ],
     migration_dependencies=[],
     commands=[],
 )
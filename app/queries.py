@@ -0,0 +1,118 @@
+from app.db import PreparedQuery, positional
+from app.dtos.post import PostResponseDTO, PostSummaryDTO
+from app.dtos.subreddit import SubredditResponseDTO
+from app.dtos.user import UserResponseDTO
+from app.services.principal_cache import PRINCIPAL_COLUMNS, Principal
+
+# Fixed SQL for the hottest read paths. Each statement selects its columns in
+# the field order of the DTO it decodes into, so records map positionally
+# without building a dict per row; keep the column lists in sync with the DTOs.
+
+POST_BY_ID: PreparedQuery[PostResponseDTO] = PreparedQuery(
+    """
+    SELECT id, title, content, url, created_at, author, subreddit, score
+    FROM post WHERE id = $1
+    """,
+    positional(PostResponseDTO),
+)
+
+# The first page of a subreddit listing: ``(subreddit_id, limit)``.
+POSTS_BY_SUBREDDIT: PreparedQuery[PostSummaryDTO] = PreparedQuery(
+    """
+    SELECT id, title, url, created_at, author, subreddit, preview, score
+    FROM post WHERE subreddit = $1
+    ORDER BY created_at DESC, id DESC
+    LIMIT $2
+    """,
+    positional(PostSummaryDTO),
+)
+
+# A later page of a subreddit listing:
+# ``(subreddit_id, after_created_at, after_id, limit)``.
+POSTS_BY_SUBREDDIT_AFTER: PreparedQuery[PostSummaryDTO] = PreparedQuery(
+    """
+    SELECT id, title, url, created_at, author, subreddit, preview, score
+    FROM post
+    WHERE subreddit = $1
+        AND created_at <= $2 AND (created_at < $2 OR id < $3)
+    ORDER BY created_at DESC, id DESC
+    LIMIT $4
+    """,
+    positional(PostSummaryDTO),
+)
+
+PRINCIPAL_BY_ID: PreparedQuery[Principal] = PreparedQuery(
+    "SELECT {} FROM users WHERE id = $1".format(
+        ", ".join(column._meta.db_column_name for column in PRINCIPAL_COLUMNS)
+    ),
+    dict,
+)
+
+USER_BY_USERNAME: PreparedQuery[UserResponseDTO] = PreparedQuery(
+    """
+    SELECT id, username, email, is_active, is_verified, avatar_url, bio
+    FROM users WHERE username = $1
+    """,
+    positional(UserResponseDTO),
+)
+
+# Confirms a username or email hit in the availability filter; a row if taken.
+USERNAME_TAKEN: PreparedQuery[bool] = PreparedQuery(
+    "SELECT TRUE FROM users WHERE username = $1",
+    positional(bool),
+)
+
+EMAIL_TAKEN: PreparedQuery[bool] = PreparedQuery(
+    "SELECT TRUE FROM users WHERE email = $1",
+    positional(bool),
+)
+
+SUBREDDIT_BY_NAME: PreparedQuery[SubredditResponseDTO] = PreparedQuery(
+    """
+    SELECT id, name, description, created_at, owner, post_count, member_count,
+        last_activity_at
+    FROM subreddit WHERE name = $1
+    """,
+    positional(SubredditResponseDTO),
+)
+
+# A page of a user's fanned-out home timeline, newest first:
+# ``(user_id, before_created_at, before_post_id, limit)``.
+HOME_TIMELINE: PreparedQuery[PostSummaryDTO] = PreparedQuery(
+    """
+    SELECT post.id, post.title, post.url, post.created_at, post.author,
+        post.subreddit, post.preview, post.score
+    FROM timeline_entry
+    JOIN post ON post.id = timeline_entry.post
+    WHERE timeline_entry."user" = $1
+        AND (timeline_entry.created_at, timeline_entry.post) < ($2, $3)
+    ORDER BY timeline_entry.created_at DESC, timeline_entry.post DESC
+    LIMIT $4
+    """,
+    positional(PostSummaryDTO),
+)
+
+# The newest posts of each subreddit a user belongs to that is too large to
+# fan out, or ever was and so has posts in no timeline, one index range scan
+# per subreddit, grouped by subreddit and newest first within each:
+# ``(user_id, before_created_at, before_post_id, limit, min_members)``.
+HOME_PULLED_POSTS: PreparedQuery[PostSummaryDTO] = PreparedQuery(
+    """
+    SELECT recent.id, recent.title, recent.url, recent.created_at,
+        recent.author, recent.subreddit, recent.preview, recent.score
+    FROM subscription
+    JOIN subreddit ON subreddit.id = subscription.subreddit
+    CROSS JOIN LATERAL (
+        SELECT id, title, url, created_at, author, subreddit, preview, score
+        FROM post
+        WHERE post.subreddit = subscription.subreddit
+            AND (post.created_at, post.id) < ($2, $3)
+        ORDER BY post.created_at DESC, post.id DESC
+        LIMIT $4
+    ) AS recent
+    WHERE subscription."user" = $1
+        AND (subreddit.member_count >= $5 OR NOT subreddit.fanned_out)
+    ORDER BY recent.subreddit, recent.created_at DESC, recent.id DESC
+    """,
+    positional(PostSummaryDTO),
+)
@@ -1,12 +1,51 @@
+import os
 import jwt
 import datetime
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from litestar.exceptions import PermissionDeniedException
+from app.services.hashing_pool import hashing_pool
 
 ph = PasswordHasher()
 SECRET_KEY = "super-secret-key-change-me"  # TODO: Move to env var
 ALGORITHM = "HS256"
+# When enabled, tokens embed the user's principal and the auth middleware
+# trusts it instead of looking the user up (profile changes show up on re-login).
+AUTH_TRUST_TOKEN_CLAIMS: bool = os.environ.get(
+    "AUTH_TRUST_TOKEN_CLAIMS", "false"
+).lower() in ("1", "true", "yes")
+PRINCIPAL_CLAIM = "usr"
+
+
+def _hash_password(password: str) -> str:
+    """
+    Hash a plaintext password with Argon2 (module-level so process pools can pickle it).
+
+    Args:
+        password: The plaintext password to hash.
+
+    Returns:
+        str: The hashed password string.
+    """
+    return ph.hash(password)
+
+
+def _verify_password(hashed: str, password: str) -> bool:
+    """
+    Verify a password against an Argon2 hash (module-level so process pools can pickle it).
+
+    Args:
+        hashed: The stored password hash.
+        password: The plaintext password to verify.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+    """
+    try:
+        ph.verify(hashed, password)
+        return True
+    except VerifyMismatchError:
+        return False
 
 
 class AuthService:
@@ -25,7 +64,22 @@ class AuthService:
         Returns:
             str: The hashed password string.
         """
-        return ph.hash(password)
+        return _hash_password(password)
+
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a plaintext password on the hashing pool, off the event loop.
+
+        Args:
+            password: The plaintext password to hash.
+
+        Returns:
+            str: The hashed password string.
+
+        Raises:
+            ServiceUnavailableException: If the hashing pool is saturated.
+        """
+        return await hashing_pool.run(_hash_password, password)
 
     def verify_password(self, hashed: str, password: str) -> bool:
         """
@@ -38,11 +92,23 @@ class AuthService:
         Returns:
             bool: True if the password matches the hash, False otherwise.
         """
-        try:
-            ph.verify(hashed, password)
-            return True
-        except VerifyMismatchError:
-            return False
+        return _verify_password(hashed, password)
+
+    async def verify_password_async(self, hashed: str, password: str) -> bool:
+        """
+        Verify a password against its hash on the hashing pool, off the event loop.
+
+        Args:
+            hashed: The stored password hash.
+            password: The plaintext password to verify.
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise.
+
+        Raises:
+            ServiceUnavailableException: If the hashing pool is saturated.
+        """
+        return await hashing_pool.run(_verify_password, hashed, password)
 
     def needs_rehash(self, hashed: str) -> bool:
         """
@@ -56,24 +122,47 @@ class AuthService:
         """
         return ph.check_needs_rehash(hashed)
 
-    def create_token(self, user_id: int) -> str:
+    def create_token(
+        self,
+        user_id: int,
+        principal: dict[str, str | int | bool | None] | None = None,
+    ) -> str:
         """
         Create a new JWT access token for a user.
 
         Args:
             user_id: The ID of the user to encode in the token.
+            principal: The user's principal, embedded as a signed claim when
+                `AUTH_TRUST_TOKEN_CLAIMS` is enabled.
 
         Returns:
             str: The encoded JWT token string.
         """
-        payload: dict[str, str | float | int | datetime.datetime] = {
+        payload: dict[str, str | float | int | datetime.datetime | dict] = {
             "sub": str(user_id),
             "exp": datetime.datetime.now(datetime.timezone.utc)
             + datetime.timedelta(hours=24),
             "iat": datetime.datetime.now(datetime.timezone.utc),
         }
+        if AUTH_TRUST_TOKEN_CLAIMS and principal is not None:
+            payload[PRINCIPAL_CLAIM] = principal
         return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
+    def _decode_payload(self, token: str) -> dict | None:
+        """
+        Decode and validate a JWT token into its payload.
+
+        Args:
+            token: The JWT token string to decode.
+
+        Returns:
+            dict | None: The token payload if valid, None otherwise.
+        """
+        try:
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
+            return None
+
     def decode_token(self, token: str) -> int | None:
         """
         Decode and validate a JWT token.
@@ -84,10 +173,26 @@ class AuthService:
         Returns:
             int | None: The user ID from the token subject if valid, None otherwise.
         """
-        try:
-            payload: dict[str, str | float | int] = jwt.decode(
-                token, SECRET_KEY, algorithms=[ALGORITHM]
-            )
-            return int(payload["sub"])
-        except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
+        payload: dict | None = self._decode_payload(token)
+        if payload is None:
             return None
+        return int(payload["sub"])
+
+    def decode_claims(
+        self, token: str
+    ) -> tuple[int | None, dict[str, str | int | bool | None] | None]:
+        """
+        Decode a JWT token once into its subject and signed principal claim.
+
+        Args:
+            token: The JWT token string to decode.
+
+        Returns:
+            tuple[int | None, dict[str, str | int | bool | None] | None]: The user
+            ID and the embedded principal; the principal is None if the token
+            carries none, and both are None if the token is invalid.
+        """
+        payload: dict | None = self._decode_payload(token)
+        if payload is None:
+            return None, None
+        return int(payload["sub"]), payload.get(PRINCIPAL_CLAIM)
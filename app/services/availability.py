@@ -0,0 +1,256 @@
+import asyncio
+import hashlib
+import logging
+import math
+import os
+from asyncpg import Connection
+from app.db import PreparedQuery, acquire_connection
+from app.dtos.user import UserAvailabilityDTO
+from app.models.user import User
+from app.queries import EMAIL_TAKEN, USERNAME_TAKEN
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+AVAILABILITY_FALSE_POSITIVE_RATE: float = float(
+    os.environ.get("AVAILABILITY_FALSE_POSITIVE_RATE", "0.01")
+)
+# The filter is sized for this many times the current users, so sign-ups
+# between rebuilds do not push the false positive rate up.
+AVAILABILITY_HEADROOM: float = float(os.environ.get("AVAILABILITY_HEADROOM", "2"))
+AVAILABILITY_MIN_CAPACITY: int = int(
+    os.environ.get("AVAILABILITY_MIN_CAPACITY", "100000")
+)
+# Rebuilds pick up users registered through other workers and resize the filter.
+AVAILABILITY_REFRESH_INTERVAL: float = float(
+    os.environ.get("AVAILABILITY_REFRESH_INTERVAL", "300")
+)
+AVAILABILITY_SCAN_CHUNK_SIZE: int = int(
+    os.environ.get("AVAILABILITY_SCAN_CHUNK_SIZE", "5000")
+)
+
+
+class BloomFilter:
+    """
+    A fixed-size set membership filter with no false negatives.
+
+    `might_contain` is False only for keys that were never added; for keys
+    that were, it is always True, and for others it is True with roughly the
+    configured false positive rate while no more than `capacity` keys are
+    added. Bit positions come from one BLAKE2b digest per key, split into two
+    64-bit hashes and combined (Kirsch-Mitzenmacher double hashing).
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        """
+        Args:
+            capacity: The number of keys the filter is sized for.
+            false_positive_rate: The target false positive rate at `capacity`.
+        """
+        capacity = max(capacity, 1)
+        self.size: int = math.ceil(
+            -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+        )
+        self.hash_count: int = max(1, round(self.size / capacity * math.log(2)))
+        self._bits: bytearray = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        """
+        Args:
+            key: The key.
+
+        Returns:
+            list[int]: The bit positions of the key.
+        """
+        digest: bytes = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8], "little")
+        second: int = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> None:
+        """
+        Args:
+            key: The key to add.
+        """
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        """
+        Args:
+            key: The key to look up.
+
+        Returns:
+            bool: False if the key was definitely never added.
+        """
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class AvailabilityIndex:
+    """
+    Answers "is this username or email taken?" mostly without the database.
+
+    Every username and email is kept in a `BloomFilter`, built by a streaming
+    scan of `users` and updated when this process registers a user. A miss
+    means the name is free; only hits, which are real users or rare false
+    positives, are checked against the database. The filter is rebuilt every
+    `AVAILABILITY_REFRESH_INTERVAL` seconds to pick up users registered by
+    other workers; until the first build finishes, every check goes to the
+    database.
+
+    The answer is advisory: registration itself relies on the unique
+    constraints, so a name taken on another worker since the last rebuild is
+    still rejected there.
+    """
+
+    def __init__(
+        self,
+        false_positive_rate: float = AVAILABILITY_FALSE_POSITIVE_RATE,
+        refresh_interval: float = AVAILABILITY_REFRESH_INTERVAL,
+        chunk_size: int = AVAILABILITY_SCAN_CHUNK_SIZE,
+    ) -> None:
+        """
+        Args:
+            false_positive_rate: The target false positive rate of the filter.
+            refresh_interval: Seconds between background rebuilds.
+            chunk_size: The number of users read per round trip while scanning.
+        """
+        self.false_positive_rate: float = false_positive_rate
+        self.refresh_interval: float = refresh_interval
+        self.chunk_size: int = chunk_size
+        self.filter: BloomFilter | None = None
+        self.checks: int = 0
+        self.database_checks: int = 0
+        # Keys added while a rebuild is scanning, which its snapshot may miss.
+        self._pending: list[str] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def rebuild(self) -> None:
+        """
+        Build a new filter from every user, sized for the current user count.
+
+        The scan reads the primary: a lagging replica could miss users who
+        registered just before the rebuild, and the new filter would then
+        report their names as free.
+        """
+        users: int = await User.count()
+        capacity: int = max(
+            AVAILABILITY_MIN_CAPACITY, math.ceil(users * 2 * AVAILABILITY_HEADROOM)
+        )
+        bloom: BloomFilter = BloomFilter(capacity, self.false_positive_rate)
+        self._pending = []
+        try:
+            connection: Connection
+            async with acquire_connection() as connection:
+                # asyncpg cursors only exist inside a transaction.
+                async with connection.transaction(readonly=True):
+                    async for username, email in connection.cursor(
+                        "SELECT username, email FROM users", prefetch=self.chunk_size
+                    ):
+                        bloom.add(f"username:{username}")
+                        bloom.add(f"email:{email}")
+            for key in self._pending:
+                bloom.add(key)
+        finally:
+            self._pending = None
+        self.filter = bloom
+
+    def _add(self, key: str) -> None:
+        """
+        Args:
+            key: The prefixed key to add.
+        """
+        if self.filter is not None:
+            self.filter.add(key)
+        if self._pending is not None:
+            self._pending.append(key)
+
+    def add_user(self, username: str, email: str) -> None:
+        """
+        Mark a newly registered user's username and email as taken.
+
+        Args:
+            username: The username.
+            email: The email address.
+        """
+        self._add(f"username:{username}")
+        self._add(f"email:{email}")
+
+    async def _is_taken(self, kind: str, value: str) -> bool:
+        """
+        Check one username or email, asking the database only on a filter hit.
+
+        Args:
+            kind: ``"username"`` or ``"email"``.
+            value: The value to check.
+
+        Returns:
+            bool: True if a user already has it.
+        """
+        self.checks += 1
+        if self.filter is not None and not self.filter.might_contain(f"{kind}:{value}"):
+            return False
+        self.database_checks += 1
+        query: PreparedQuery[bool] = (
+            USERNAME_TAKEN if kind == "username" else EMAIL_TAKEN
+        )
+        return await query.fetchrow(value) is not None
+
+    async def check(
+        self, username: str | None = None, email: str | None = None
+    ) -> UserAvailabilityDTO:
+        """
+        Check whether a username and/or email are free to register.
+
+        Args:
+            username: The username to check, if any.
+            email: The email address to check, if any.
+
+        Returns:
+            UserAvailabilityDTO: Availability of each value given.
+        """
+        return UserAvailabilityDTO(
+            username_available=(
+                None
+                if username is None
+                else not await self._is_taken("username", username)
+            ),
+            email_available=(
+                None if email is None else not await self._is_taken("email", email)
+            ),
+        )
+
+    async def _refresh_forever(self) -> None:
+        """
+        Background loop that rebuilds the filter every `refresh_interval` seconds.
+        """
+        while True:
+            try:
+                await self.rebuild()
+            except Exception:
+                logger.exception("Availability filter rebuild failed")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def start(self) -> None:
+        """
+        Start the background rebuilds, the first of them immediately.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        """
+        Stop the background rebuilds.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+availability_index: AvailabilityIndex = AvailabilityIndex()
@@ -0,0 +1,226 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+from asyncpg import Record
+from asyncpg.exceptions import ForeignKeyViolationError
+from litestar.exceptions import NotFoundException
+from piccolo.columns import Column
+from piccolo.query import Select
+from app.mapping import RowMapper, fetch_records
+from app.models.comment import PATH_SEGMENT_WIDTH, PATH_SEPARATOR, Comment
+from app.models.post import Post
+from app.dtos.comment import (
+    CommentCreateDTO,
+    CommentNodeDTO,
+    CommentResponseDTO,
+    CommentTreeDTO,
+)
+from app.services.pagination import decode_cursor, encode_cursor
+
+DEFAULT_COMMENT_PAGE_SIZE: int = 200
+MAX_COMMENT_PAGE_SIZE: int = 500
+DEFAULT_COMMENT_DEPTH: int = 6
+MAX_COMMENT_DEPTH: int = 20
+
+# Inserts a comment, computing its path and depth from the parent (if any)
+# and bumping the parent's reply count, in a single statement. Returns no
+# rows if the parent does not exist or belongs to another post.
+INSERT_COMMENT: str = """
+    WITH parent AS (
+        SELECT id, path, depth FROM comment
+        WHERE id = {}::integer AND post = {}::integer
+    ), new_comment AS (
+        SELECT nextval(pg_get_serial_sequence('comment', 'id')) AS id
+    ), inserted AS (
+        INSERT INTO comment (
+            id, content, author, post, parent, path, depth, reply_count, created_at
+        )
+        SELECT new_comment.id, {}::text, {}::integer, {}::integer, parent.id,
+            COALESCE(parent.path || {}::text, '')
+                || lpad(new_comment.id::text, {}::integer, '0'),
+            COALESCE(parent.depth + 1, 0), 0, {}::timestamp
+        FROM new_comment LEFT JOIN parent ON true
+        WHERE {}::integer IS NULL OR parent.id IS NOT NULL
+        RETURNING id, depth, parent
+    ), counted AS (
+        UPDATE comment SET reply_count = comment.reply_count + 1
+        FROM inserted WHERE comment.id = inserted.parent
+    )
+    SELECT id, depth FROM inserted
+"""
+
+# The columns needed to build a `CommentNodeDTO`.
+NODE_COLUMNS: tuple[Column, ...] = (
+    Comment.id,
+    Comment.content,
+    Comment.author,
+    Comment.parent,
+    Comment.path,
+    Comment.depth,
+    Comment.reply_count,
+    Comment.created_at,
+)
+
+
+# Builds a comment tree node, without replies, from a row selected with
+# `NODE_COLUMNS`.
+comment_node_from_row: RowMapper[CommentNodeDTO] = RowMapper(
+    CommentNodeDTO,
+    {"author_id": "author", "parent_id": "parent"},
+    skip=("replies",),
+)
+
+
+def build_comment_tree(rows: list[Mapping[str, Any]]) -> list[CommentNodeDTO]:
+    """
+    Assemble comment rows into a forest in a single pass.
+
+    Rows must be in path order, which guarantees every parent is seen before
+    its replies. A row whose parent is not in `rows` becomes a root.
+
+    Args:
+        rows: The comment rows, ordered by path.
+
+    Returns:
+        list[CommentNodeDTO]: The top-level nodes, with replies nested.
+    """
+    nodes: dict[int, CommentNodeDTO] = {}
+    roots: list[CommentNodeDTO] = []
+    for row in rows:
+        node: CommentNodeDTO = comment_node_from_row(row)
+        nodes[node.id] = node
+        parent: CommentNodeDTO | None = (
+            nodes.get(node.parent_id) if node.parent_id is not None else None
+        )
+        if parent is None:
+            roots.append(node)
+        else:
+            parent.replies.append(node)
+    return roots
+
+
+class CommentService:
+    """
+    Service for handling threaded comments on posts.
+    """
+
+    async def create_comment(
+        self, post_id: int, data: CommentCreateDTO, author_id: int
+    ) -> CommentResponseDTO:
+        """
+        Create a comment on a post, or a reply to another comment.
+
+        Args:
+            post_id: The ID of the post.
+            data: The comment content and optional parent comment ID.
+            author_id: The ID of the author.
+
+        Returns:
+            CommentResponseDTO: The created comment.
+
+        Raises:
+            NotFoundException: If the post or the parent comment does not exist.
+        """
+        created_at: datetime = datetime.now()
+        try:
+            rows: list[dict[str, Any]] = await Comment.raw(
+                INSERT_COMMENT,
+                data.parent_id,
+                post_id,
+                data.content,
+                author_id,
+                post_id,
+                PATH_SEPARATOR,
+                PATH_SEGMENT_WIDTH,
+                created_at,
+                data.parent_id,
+            )
+        except ForeignKeyViolationError:
+            raise NotFoundException("Post not found")
+        if not rows:
+            raise NotFoundException("Parent comment not found")
+
+        return CommentResponseDTO(
+            id=rows[0]["id"],
+            content=data.content,
+            author_id=author_id,
+            post_id=post_id,
+            parent_id=data.parent_id,
+            depth=rows[0]["depth"],
+            created_at=created_at,
+        )
+
+    async def get_comment_tree(
+        self,
+        post_id: int,
+        depth: int = DEFAULT_COMMENT_DEPTH,
+        limit: int = DEFAULT_COMMENT_PAGE_SIZE,
+        cursor: str | None = None,
+        parent_id: int | None = None,
+    ) -> CommentTreeDTO:
+        """
+        Get the comments of a post, or the replies below one comment, as a tree.
+
+        The comments are read in thread order with a single range scan on the
+        ``(post, path)`` index and assembled in one pass. A node whose
+        `reply_count` exceeds its loaded `replies` was cut off by `depth` or
+        `limit`; its replies can be loaded with `parent_id` set to its ID.
+        Nodes on a `next_cursor` page whose parent was on an earlier page are
+        returned as roots and attach by `parent_id`.
+
+        Args:
+            post_id: The ID of the post.
+            depth: How many levels below the starting point to load.
+            limit: The maximum number of comments to return.
+            cursor: The opaque cursor from the previous page, if any.
+            parent_id: Load only the replies below this comment.
+
+        Returns:
+            CommentTreeDTO: The comment tree and the cursor for the next page.
+
+        Raises:
+            NotFoundException: If the post or the parent comment does not exist.
+            ClientException: If the cursor is malformed.
+        """
+        query: Select = Comment.select(*NODE_COLUMNS).where(Comment.post == post_id)
+        base_depth: int = 0
+        if parent_id is not None:
+            parent: dict[str, Any] | None = (
+                await Comment.select(Comment.path, Comment.depth)
+                .where(Comment.id == parent_id, Comment.post == post_id)
+                .first()
+            )
+            if not parent:
+                raise NotFoundException("Parent comment not found")
+            # Descendants are exactly the paths between "<path>/" and the
+            # next separator value after it.
+            query = query.where(
+                Comment.path > parent["path"] + PATH_SEPARATOR,
+                Comment.path < parent["path"] + chr(ord(PATH_SEPARATOR) + 1),
+            )
+            base_depth = parent["depth"] + 1
+
+        if cursor:
+            query = query.where(Comment.path > decode_cursor(cursor, str))
+
+        comments: list[Record] = await fetch_records(
+            query.where(Comment.depth < base_depth + depth)
+            .order_by(Comment.path)
+            .limit(limit + 1)
+        )
+
+        if (
+            not comments
+            and parent_id is None
+            and not await Post.exists().where(Post.id == post_id)
+        ):
+            raise NotFoundException("Post not found")
+
+        next_cursor: str | None = None
+        if len(comments) > limit:
+            comments = comments[:limit]
+            next_cursor = encode_cursor(comments[-1]["path"])
+
+        return CommentTreeDTO(
+            items=build_comment_tree(comments), next_cursor=next_cursor
+        )
@@ -0,0 +1,254 @@
+import asyncio
+import bisect
+import logging
+import math
+import os
+from datetime import datetime
+from typing import Any
+from app.dtos.post import FeedSort
+from app.models.post import Post
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+FEED_SIZE: int = int(os.environ.get("FEED_SIZE", "1000"))
+FEED_CANDIDATE_WINDOW: int = int(os.environ.get("FEED_CANDIDATE_WINDOW", "5000"))
+FEED_REFRESH_INTERVAL: float = float(os.environ.get("FEED_REFRESH_INTERVAL", "30"))
+
+HOT_EPOCH: datetime = datetime(2026, 1, 1)
+HOT_DECAY_SECONDS: float = 45000.0
+
+
+def hot_rank(score: int, created_at: datetime) -> float:
+    """
+    Compute the "hot" rank of a post: log-scaled score plus a time bonus.
+
+    Args:
+        score: The net vote score of the post.
+        created_at: When the post was created.
+
+    Returns:
+        float: The rank; higher is hotter.
+    """
+    order: float = math.log10(max(abs(score), 1))
+    sign: int = 1 if score > 0 else -1 if score < 0 else 0
+    age_seconds: float = (created_at - HOT_EPOCH).total_seconds()
+    return sign * order + age_seconds / HOT_DECAY_SECONDS
+
+
+def rank_post(sort: FeedSort, score: int, created_at: datetime) -> float:
+    """
+    Compute the rank of a post for a given feed ordering.
+
+    Args:
+        sort: The feed ordering.
+        score: The net vote score of the post.
+        created_at: When the post was created.
+
+    Returns:
+        float: The rank; higher sorts first.
+    """
+    if sort is FeedSort.HOT:
+        return hot_rank(score, created_at)
+    if sort is FeedSort.TOP:
+        return float(score)
+    return created_at.timestamp()
+
+
+class RankedFeed:
+    """
+    The top-N post IDs for one feed ordering, kept sorted by descending rank.
+
+    Entries are stored as ``(-rank, -post_id)`` so the underlying list is in
+    ascending order and `bisect` can be used for incremental inserts.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Args:
+            capacity: The maximum number of post IDs to keep.
+        """
+        self.capacity: int = capacity
+        self._entries: list[tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: The number of post IDs currently held.
+        """
+        return len(self._entries)
+
+    def replace(self, ranked_posts: list[tuple[float, int]]) -> None:
+        """
+        Replace the contents with a freshly computed ranking.
+
+        Args:
+            ranked_posts: ``(rank, post_id)`` pairs in any order.
+        """
+        entries: list[tuple[float, int]] = sorted(
+            (-rank, -post_id) for rank, post_id in ranked_posts
+        )
+        self._entries = entries[: self.capacity]
+
+    def insert(self, rank: float, post_id: int) -> None:
+        """
+        Insert a single post, dropping the lowest ranked one if over capacity.
+
+        Args:
+            rank: The rank of the post.
+            post_id: The ID of the post.
+        """
+        entry: tuple[float, int] = (-rank, -post_id)
+        if len(self._entries) >= self.capacity and entry >= self._entries[-1]:
+            return
+        bisect.insort(self._entries, entry)
+        del self._entries[self.capacity :]
+
+    def slice(self, offset: int, limit: int) -> list[int]:
+        """
+        Get a page of post IDs in rank order.
+
+        Args:
+            offset: The number of entries to skip.
+            limit: The maximum number of IDs to return.
+
+        Returns:
+            list[int]: The post IDs, highest ranked first.
+        """
+        return [-post_id for _, post_id in self._entries[offset : offset + limit]]
+
+
+class FeedIndex:
+    """
+    Memory-resident, periodically refreshed ranking of the global post feed.
+
+    A background task recomputes the top `FEED_SIZE` posts for every
+    `FeedSort` from the most recent `FEED_CANDIDATE_WINDOW` posts (and, for
+    "top", from the score index) using the denormalized `Post.score`, so
+    serving the feed never sorts the `Post` table or counts votes.
+    """
+
+    def __init__(
+        self,
+        capacity: int = FEED_SIZE,
+        candidate_window: int = FEED_CANDIDATE_WINDOW,
+        refresh_interval: float = FEED_REFRESH_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            capacity: The number of post IDs kept per ordering.
+            candidate_window: How many recent posts are considered when ranking.
+            refresh_interval: Seconds between background refreshes.
+        """
+        self.candidate_window: int = candidate_window
+        self.refresh_interval: float = refresh_interval
+        self.feeds: dict[FeedSort, RankedFeed] = {
+            sort: RankedFeed(capacity) for sort in FeedSort
+        }
+        self.loaded: bool = False
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def _rebuild(self) -> None:
+        """
+        Recompute every ranking from the most recent posts.
+        """
+        candidates: list[dict[str, Any]] = (
+            await Post.select(Post.id, Post.created_at, Post.score)
+            .order_by(Post.created_at, Post.id, ascending=False)
+            .limit(self.candidate_window)
+        )
+        # "Top" is not limited to recent posts: read it straight off the
+        # (score, id) index rather than aggregating votes.
+        top: list[dict[str, Any]] = (
+            await Post.select(Post.id, Post.created_at, Post.score)
+            .order_by(Post.score, Post.id, ascending=False)
+            .limit(self.feeds[FeedSort.TOP].capacity)
+        )
+        for sort, feed in self.feeds.items():
+            feed.replace(
+                [
+                    (
+                        rank_post(sort, post["score"], post["created_at"]),
+                        post["id"],
+                    )
+                    for post in (top if sort is FeedSort.TOP else candidates)
+                ]
+            )
+        self.loaded = True
+
+    async def refresh(self) -> None:
+        """
+        Rebuild the index, serialised with any concurrent rebuild.
+        """
+        async with self._lock:
+            await self._rebuild()
+
+    async def ensure_loaded(self) -> None:
+        """
+        Load the index on first use if the background refresher has not yet run.
+        """
+        if self.loaded:
+            return
+        async with self._lock:
+            if not self.loaded:
+                await self._rebuild()
+
+    def add_post(self, post_id: int, created_at: datetime) -> None:
+        """
+        Insert a newly created post without waiting for the next refresh.
+
+        Args:
+            post_id: The ID of the new post.
+            created_at: When the post was created.
+        """
+        if not self.loaded:
+            return
+        for sort, feed in self.feeds.items():
+            feed.insert(rank_post(sort, 0, created_at), post_id)
+
+    def page(self, sort: FeedSort, offset: int, limit: int) -> list[int]:
+        """
+        Get a page of post IDs for a feed ordering.
+
+        Args:
+            sort: The feed ordering.
+            offset: The number of entries to skip.
+            limit: The maximum number of IDs to return.
+
+        Returns:
+            list[int]: The post IDs, highest ranked first.
+        """
+        return self.feeds[sort].slice(offset, limit)
+
+    async def _refresh_forever(self) -> None:
+        """
+        Background loop that refreshes the index every `refresh_interval` seconds.
+        """
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Feed index refresh failed")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def start(self) -> None:
+        """
+        Start the background refresher.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        """
+        Stop the background refresher.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+feed_index: FeedIndex = FeedIndex()
@@ -0,0 +1,161 @@
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import TypeVar
+from litestar.exceptions import ServiceUnavailableException
+from app.dtos.health import HashingStatsDTO
+
+HASH_POOL_KIND: str = os.environ.get("HASH_POOL_KIND", "thread")
+HASH_POOL_WORKERS: int = int(
+    os.environ.get("HASH_POOL_WORKERS", str(os.cpu_count() or 2))
+)
+HASH_POOL_MAX_QUEUE: int = int(os.environ.get("HASH_POOL_MAX_QUEUE", "32"))
+
+HashResult = TypeVar("HashResult")
+
+
+class HashingPool:
+    """
+    Bounded executor for CPU-heavy password hashing.
+
+    Argon2 runs in a thread pool (argon2-cffi releases the GIL) or a process
+    pool, keeping the event loop free. At most `workers + max_queue` jobs may
+    be in flight; beyond that, callers get a 503 immediately instead of
+    queueing behind work that will not finish in time.
+    """
+
+    def __init__(
+        self,
+        kind: str = HASH_POOL_KIND,
+        workers: int = HASH_POOL_WORKERS,
+        max_queue: int = HASH_POOL_MAX_QUEUE,
+    ) -> None:
+        """
+        Args:
+            kind: Either "thread" or "process".
+            workers: The number of worker threads or processes.
+            max_queue: How many jobs may wait for a free worker.
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown hashing pool kind '{kind}'")
+        self.kind: str = kind
+        self.workers: int = workers
+        self.max_queue: int = max_queue
+        self.in_flight: int = 0
+        self.completed: int = 0
+        self.rejected: int = 0
+        self.total_seconds: float = 0.0
+        self.max_seconds: float = 0.0
+        self._executor: Executor | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Returns:
+            int: The number of jobs waiting for a free worker.
+        """
+        return max(0, self.in_flight - self.workers)
+
+    def _get_executor(self) -> Executor:
+        """
+        Create the executor on first use.
+
+        Returns:
+            Executor: The thread or process pool executor.
+        """
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="argon2"
+                )
+        return self._executor
+
+    async def run(self, function: Callable[..., HashResult], *args: str) -> HashResult:
+        """
+        Run a hashing function on the pool.
+
+        Args:
+            function: A module-level (picklable) hashing function.
+            *args: The arguments to pass to it.
+
+        Returns:
+            HashResult: The function's return value.
+
+        Raises:
+            ServiceUnavailableException: If the pool and its queue are full.
+        """
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise ServiceUnavailableException(
+                "Password hashing is saturated, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self.in_flight += 1
+        started: float = time.perf_counter()
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        try:
+            job: Future[HashResult] = self._get_executor().submit(function, *args)
+        except BaseException:
+            self.in_flight -= 1
+            raise
+        # The slot is freed when the job finishes, not when the caller stops
+        # waiting: a cancelled request leaves its job running on a worker.
+        job.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(self._release, started)
+        )
+        return await asyncio.wrap_future(job)
+
+    def _release(self, started: float) -> None:
+        """
+        Free the slot of a finished job and record its latency.
+
+        Args:
+            started: When the job was admitted, from `time.perf_counter`.
+        """
+        elapsed: float = time.perf_counter() - started
+        self.in_flight -= 1
+        self.completed += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+
+    def stats(self) -> HashingStatsDTO:
+        """
+        Snapshot the pool's saturation and latency counters.
+
+        Returns:
+            HashingStatsDTO: The current statistics.
+        """
+        return HashingStatsDTO(
+            kind=self.kind,
+            workers=self.workers,
+            max_queue=self.max_queue,
+            in_flight=self.in_flight,
+            queue_depth=self.queue_depth,
+            completed=self.completed,
+            rejected=self.rejected,
+            avg_latency_ms=(
+                self.total_seconds / self.completed * 1000 if self.completed else 0.0
+            ),
+            max_latency_ms=self.max_seconds * 1000,
+        )
+
+    async def shutdown(self) -> None:
+        """
+        Shut the executor down, waiting for running jobs.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_pool: HashingPool = HashingPool()
@@ -0,0 +1,78 @@
+from litestar.exceptions import ImproperlyConfiguredException
+from piccolo.engine.postgres import PostgresEngine
+from app.db import InstrumentedPostgresEngine, get_engine
+from app.dtos.health import (
+    HashingStatsDTO,
+    PoolStatsDTO,
+    ReplicaStatsDTO,
+    StartupStatsDTO,
+)
+from app.services.hashing_pool import hashing_pool
+from app.services.startup import startup_timer
+
+
+def instrumented_engine() -> InstrumentedPostgresEngine:
+    """
+    Get the configured engine, which must be instrumented.
+
+    Returns:
+        InstrumentedPostgresEngine: The engine from `piccolo_conf`.
+
+    Raises:
+        ImproperlyConfiguredException: If the engine is not instrumented.
+    """
+    engine: PostgresEngine = get_engine()
+    if not isinstance(engine, InstrumentedPostgresEngine):
+        raise ImproperlyConfiguredException(
+            "piccolo_conf.DB must be an InstrumentedPostgresEngine"
+        )
+    return engine
+
+
+class HealthService:
+    """
+    Service for reporting runtime health and saturation statistics.
+    """
+
+    async def get_hashing_stats(self) -> HashingStatsDTO:
+        """
+        Get the password hashing pool statistics.
+
+        Returns:
+            HashingStatsDTO: Queue depth, throughput and latency of the pool.
+        """
+        return hashing_pool.stats()
+
+    async def get_pool_stats(self) -> PoolStatsDTO:
+        """
+        Get this worker's database connection pool statistics.
+
+        Returns:
+            PoolStatsDTO: Pool size, idle and in-use connections, and acquire waits.
+
+        Raises:
+            ImproperlyConfiguredException: If the engine is not instrumented.
+        """
+        return instrumented_engine().pool_stats()
+
+    async def get_replica_stats(self) -> list[ReplicaStatsDTO]:
+        """
+        Get the lag, health and pool statistics of every read replica.
+
+        Returns:
+            list[ReplicaStatsDTO]: One entry per configured replica.
+
+        Raises:
+            ImproperlyConfiguredException: If the engine is not instrumented.
+        """
+        return instrumented_engine().replica_stats()
+
+    async def get_startup_stats(self) -> StartupStatsDTO:
+        """
+        Get this worker's startup breakdown.
+
+        Returns:
+            StartupStatsDTO: The duration of each startup phase, when the worker
+            was ready and when it served its first successful response.
+        """
+        return startup_timer.stats()
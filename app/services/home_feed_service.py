@@ -0,0 +1,91 @@
+import asyncio
+import heapq
+from datetime import datetime
+from itertools import groupby
+from app.dtos.post import PostPageDTO, PostSummaryDTO
+from app.queries import HOME_PULLED_POSTS, HOME_TIMELINE
+from app.services.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from app.services.timeline import timeline_fanout
+
+# The keyset position before the newest possible post.
+FEED_START: tuple[datetime, int] = (datetime.max, 2**31 - 1)
+
+
+def feed_key(post: PostSummaryDTO) -> tuple[datetime, int]:
+    """
+    Args:
+        post: A post in a feed.
+
+    Returns:
+        tuple[datetime, int]: Its ``(created_at, id)`` keyset position.
+    """
+    return post.created_at, post.id
+
+
+class HomeFeedService:
+    """
+    Service for the personalized home feed of a user's subreddits.
+    """
+
+    async def get_home_feed(
+        self,
+        user_id: int,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> PostPageDTO:
+        """
+        Get a page of the posts of every subreddit a user has joined, newest first.
+
+        Posts from subreddits below the fan-out threshold were already copied
+        to the user's timeline, so they are one range scan however many of
+        them the user joined. Posts from the few huge subreddits, and from
+        those that were huge once and so missed the fan-out, are read from
+        each subreddit's own index; both streams, each already sorted,
+        are merged with a k-way heap merge. Pagination is keyset-based on
+        ``(created_at, id)``.
+
+        Args:
+            user_id: The ID of the user.
+            limit: The maximum number of posts to return.
+            cursor: The opaque cursor from the previous page, if any.
+
+        Returns:
+            PostPageDTO: The page of posts and the cursor for the next page.
+
+        Raises:
+            ClientException: If the cursor is malformed.
+        """
+        before: tuple[datetime, int] = (
+            decode_cursor(cursor, tuple[datetime, int]) if cursor else FEED_START
+        )
+        timeline: list[PostSummaryDTO]
+        pulled: list[PostSummaryDTO]
+        timeline, pulled = await asyncio.gather(
+            HOME_TIMELINE.fetch(user_id, before[0], before[1], limit + 1),
+            HOME_PULLED_POSTS.fetch(
+                user_id, before[0], before[1], limit + 1, timeline_fanout.max_members
+            ),
+        )
+
+        streams: list[list[PostSummaryDTO]] = [timeline]
+        streams.extend(
+            list(posts)
+            for _, posts in groupby(pulled, key=lambda post: post.subreddit_id)
+        )
+        items: list[PostSummaryDTO] = []
+        seen: set[int] = set()
+        # A subreddit that crossed the threshold has posts in both streams.
+        for post in heapq.merge(*streams, key=feed_key, reverse=True):
+            if post.id in seen:
+                continue
+            seen.add(post.id)
+            items.append(post)
+            if len(items) > limit:
+                break
+
+        next_cursor: str | None = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(feed_key(items[-1]))
+
+        return PostPageDTO(items=items, next_cursor=next_cursor)
@@ -0,0 +1,281 @@
+from bisect import bisect_left
+from piccolo.engine.postgres import PostgresEngine
+from app.db import InstrumentedPostgresEngine, QueryStats, get_engine
+from app.dtos.health import HashingStatsDTO, PoolStatsDTO
+from app.services.hashing_pool import hashing_pool
+from app.services.availability import availability_index
+from app.services.rate_limiter import rate_limiter
+
+# Upper bounds, in seconds, of the request latency histogram buckets; the
+# implicit last bucket is +Inf.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+BUCKET_LABELS: tuple[str, ...] = (*(repr(bound) for bound in LATENCY_BUCKETS), "+Inf")
+
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def escape_label(value: str) -> str:
+    """
+    Escape a Prometheus label value.
+
+    Args:
+        value: The raw label value.
+
+    Returns:
+        str: The value with backslashes, quotes and newlines escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RouteMetrics:
+    """
+    Latency, status and database counters for one route.
+
+    Buckets are allocated once when the route is first seen; recording a
+    request only increments counters.
+    """
+
+    __slots__ = (
+        "buckets",
+        "count",
+        "db_queries",
+        "db_seconds",
+        "in_flight",
+        "labels",
+        "seconds",
+        "statuses",
+    )
+
+    def __init__(self, method: str, route: str) -> None:
+        """
+        Args:
+            method: The HTTP method.
+            route: The route's path template, e.g. ``/api/posts/{post_id:int}``.
+        """
+        self.labels: str = f'method="{method}",route="{escape_label(route)}"'
+        self.in_flight: int = 0
+        # Non-cumulative counts per bucket; summed when rendered.
+        self.buckets: list[int] = [0] * len(BUCKET_LABELS)
+        self.count: int = 0
+        self.seconds: float = 0.0
+        self.statuses: dict[int, int] = {}
+        self.db_queries: int = 0
+        self.db_seconds: float = 0.0
+
+    def observe(self, seconds: float, status: int, queries: QueryStats) -> None:
+        """
+        Record one finished request.
+
+        Args:
+            seconds: The request latency.
+            status: The response status code.
+            queries: The queries the request ran.
+        """
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.seconds += seconds
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.db_queries += queries.count
+        self.db_seconds += queries.seconds
+
+
+class MetricsRegistry:
+    """
+    In-process registry of per-route request metrics for this worker.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+
+    def route(self, method: str, route: str) -> RouteMetrics:
+        """
+        Get the metrics of a route, creating them the first time it is seen.
+
+        Args:
+            method: The HTTP method.
+            route: The route's path template.
+
+        Returns:
+            RouteMetrics: The route's metrics.
+        """
+        key: tuple[str, str] = (method, route)
+        metrics: RouteMetrics | None = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics(method, route)
+        return metrics
+
+    def render(self) -> list[str]:
+        """
+        Render the route metrics in the Prometheus text format.
+
+        Returns:
+            list[str]: The exposition lines.
+        """
+        routes: list[RouteMetrics] = list(self.routes.values())
+        lines: list[str] = [
+            "# HELP http_requests_in_flight Requests currently being handled.",
+            "# TYPE http_requests_in_flight gauge",
+        ]
+        lines.extend(
+            f"http_requests_in_flight{{{route.labels}}} {route.in_flight}"
+            for route in routes
+        )
+
+        lines.append("# HELP http_request_duration_seconds Request latency by route.")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for route in routes:
+            cumulative: int = 0
+            for label, count in zip(BUCKET_LABELS, route.buckets):
+                cumulative += count
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{route.labels},le="{label}"}} {cumulative}'
+                )
+            lines.append(
+                f"http_request_duration_seconds_sum{{{route.labels}}} {route.seconds}"
+            )
+            lines.append(
+                f"http_request_duration_seconds_count{{{route.labels}}} {route.count}"
+            )
+
+        lines.append("# HELP http_responses_total Responses by route and status.")
+        lines.append("# TYPE http_responses_total counter")
+        for route in routes:
+            for status, count in sorted(route.statuses.items()):
+                lines.append(
+                    f'http_responses_total{{{route.labels},status="{status}"}} {count}'
+                )
+
+        lines.append("# HELP db_queries_total Database queries run by route.")
+        lines.append("# TYPE db_queries_total counter")
+        lines.extend(
+            f"db_queries_total{{{route.labels}}} {route.db_queries}" for route in routes
+        )
+        lines.append(
+            "# HELP db_query_seconds_total Time spent in database queries by route."
+        )
+        lines.append("# TYPE db_query_seconds_total counter")
+        lines.extend(
+            f"db_query_seconds_total{{{route.labels}}} {route.db_seconds}"
+            for route in routes
+        )
+        return lines
+
+
+metrics: MetricsRegistry = MetricsRegistry()
+
+
+def gauge(name: str, help_text: str, value: float, kind: str = "gauge") -> list[str]:
+    """
+    Render a single unlabelled metric.
+
+    Args:
+        name: The metric name.
+        help_text: The HELP text.
+        value: The current value.
+        kind: The metric type, "gauge" or "counter".
+
+    Returns:
+        list[str]: The exposition lines.
+    """
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+
+
+class MetricsService:
+    """
+    Service for exporting this worker's metrics to Prometheus.
+    """
+
+    async def render(self) -> str:
+        """
+        Render request, rate limiter, availability, database pool and hashing pool
+        metrics.
+
+        Returns:
+            str: The metrics in the Prometheus text exposition format.
+        """
+        lines: list[str] = metrics.render()
+
+        hashing: HashingStatsDTO = hashing_pool.stats()
+        lines += gauge(
+            "hashing_pool_in_flight",
+            "Hashing jobs running or queued.",
+            hashing.in_flight,
+        )
+        lines += gauge(
+            "hashing_pool_queue_depth",
+            "Hashing jobs waiting for a worker.",
+            hashing.queue_depth,
+        )
+        lines += gauge(
+            "hashing_pool_completed_total",
+            "Hashing jobs completed.",
+            hashing.completed,
+            "counter",
+        )
+        lines += gauge(
+            "hashing_pool_rejected_total",
+            "Hashing jobs rejected because the pool was saturated.",
+            hashing.rejected,
+            "counter",
+        )
+
+        lines += gauge(
+            "rate_limit_rejected_total",
+            "Login and registration attempts rejected by the rate limiter.",
+            rate_limiter.rejected,
+            "counter",
+        )
+        lines += gauge(
+            "availability_checks_total",
+            "Username and email availability checks.",
+            availability_index.checks,
+            "counter",
+        )
+        lines += gauge(
+            "availability_database_checks_total",
+            "Availability checks that hit the filter and went to the database.",
+            availability_index.database_checks,
+            "counter",
+        )
+
+        engine: PostgresEngine = get_engine()
+        if isinstance(engine, InstrumentedPostgresEngine):
+            pool: PoolStatsDTO = engine.pool_stats()
+            lines += gauge("db_pool_size", "Open connections.", pool.size)
+            lines += gauge("db_pool_idle", "Idle connections.", pool.idle)
+            lines += gauge("db_pool_in_use", "Connections in use.", pool.in_use)
+            lines += gauge(
+                "db_pool_waiting", "Requests waiting for a connection.", pool.waiting
+            )
+            lines += gauge(
+                "db_pool_acquired_total",
+                "Connections acquired.",
+                pool.acquired,
+                "counter",
+            )
+            lines += gauge(
+                "db_pool_timeouts_total",
+                "Connection acquires that timed out.",
+                pool.timeouts,
+                "counter",
+            )
+            lines.append("# HELP db_replica_lag_seconds Replay lag per read replica.")
+            lines.append("# TYPE db_replica_lag_seconds gauge")
+            for name, lag in engine.replica_lag.items():
+                if lag is not None:
+                    lines.append(f'db_replica_lag_seconds{{replica="{name}"}} {lag}')
+
+        lines.append("")
+        return "\n".join(lines)
@@ -0,0 +1,45 @@
+import base64
+from typing import TypeVar
+import msgspec
+from litestar.exceptions import ClientException
+
+DEFAULT_PAGE_SIZE: int = 25
+MAX_PAGE_SIZE: int = 100
+
+CursorPosition = TypeVar("CursorPosition")
+
+
+def encode_cursor(position: object) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor string.
+
+    Args:
+        position: The sort key of the last row on the page, e.g. ``(created_at, id)``.
+
+    Returns:
+        str: The opaque cursor to hand back to the client.
+    """
+    raw: bytes = msgspec.json.encode(position)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, position_type: type[CursorPosition]) -> CursorPosition:
+    """
+    Decode a cursor produced by `encode_cursor` back into its keyset position.
+
+    Args:
+        cursor: The opaque cursor received from the client.
+        position_type: The expected type of the position, e.g. ``tuple[datetime, int]``.
+
+    Returns:
+        CursorPosition: The decoded position.
+
+    Raises:
+        ClientException: If the cursor is malformed or does not match the expected type.
+    """
+    padded: str = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw: bytes = base64.urlsafe_b64decode(padded)
+        return msgspec.json.decode(raw, type=position_type)
+    except (ValueError, msgspec.DecodeError):
+        raise ClientException("Invalid pagination cursor")
@@ -1,8 +1,202 @@
+import os
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
-from litestar.exceptions import NotFoundException
-from app.models.post import Post
-from app.models.subreddit import Subreddit
-from app.dtos.post import PostCreateDTO, PostResponseDTO
+import msgspec
+from asyncpg import Record
+from litestar.exceptions import (
+    ClientException,
+    NotFoundException,
+    PermissionDeniedException,
+)
+from piccolo.columns import Column
+from piccolo.query import Select
+from app.models.post import PREVIEW_LENGTH, Post
+from app.db import acquire_connection
+from app.mapping import RowMapper, fetch_mapped, fetch_records
+from app.queries import POST_BY_ID, POSTS_BY_SUBREDDIT, POSTS_BY_SUBREDDIT_AFTER
+from app.dtos.post import (
+    FeedSort,
+    PostBulkErrorDTO,
+    PostBulkResultDTO,
+    PostCreateDTO,
+    PostPageDTO,
+    PostResponseDTO,
+    PostSummaryDTO,
+)
+from app.dtos.subreddit import SubredditResponseDTO
+from app.services.feed_index import feed_index
+from app.services.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from app.services.streaming import stream_query
+from app.services.subreddit_counters import subreddit_counters
+from app.services.subreddit_directory import subreddit_directory, subreddit_from_row
+from app.services.timeline import timeline_fanout
+
+BULK_MAX_POSTS: int = int(os.environ.get("BULK_MAX_POSTS", "10000"))
+
+
+# Builds a post DTO from a `Post` row (a Piccolo dict or an asyncpg record).
+post_from_row: RowMapper[PostResponseDTO] = RowMapper(
+    PostResponseDTO, {"author_id": "author", "subreddit_id": "subreddit"}
+)
+
+
+# The columns loaded by list endpoints; `content` is only read by `get_post`.
+SUMMARY_COLUMNS: tuple[Column, ...] = (
+    Post.id,
+    Post.title,
+    Post.url,
+    Post.created_at,
+    Post.author,
+    Post.subreddit,
+    Post.preview,
+    Post.score,
+)
+
+
+# Builds a post summary DTO from a row selected with `SUMMARY_COLUMNS`.
+post_summary_from_row: RowMapper[PostSummaryDTO] = RowMapper(
+    PostSummaryDTO, {"author_id": "author", "subreddit_id": "subreddit"}
+)
+
+
+def make_preview(content: str | None) -> str | None:
+    """
+    Compute the short content excerpt stored alongside a post.
+
+    Args:
+        content: The full post content.
+
+    Returns:
+        str | None: The content, truncated with an ellipsis to `PREVIEW_LENGTH`.
+    """
+    if content is None or len(content) <= PREVIEW_LENGTH:
+        return content
+    return content[: PREVIEW_LENGTH - 1].rstrip() + "…"
+
+
+# Inserts a post into the subreddit named by the first parameter and returns
+# the new post ID together with the subreddit row, in a single statement.
+INSERT_POST_BY_SUBREDDIT_NAME: str = """
+    WITH target AS (
+        SELECT id, name, description, created_at, owner, post_count,
+            member_count, last_activity_at
+        FROM subreddit WHERE name = {}
+    ), inserted AS (
+        INSERT INTO post (
+            title, content, preview, url, created_at, author, subreddit
+        )
+        SELECT {}::varchar, {}::text, {}::varchar, {}::varchar, {}::timestamp,
+            {}::integer, target.id
+        FROM target
+        RETURNING id
+    )
+    SELECT inserted.id AS post_id, target.*
+    FROM inserted, target
+"""
+
+
+# Deletes a post as its author and, if it was already counted, takes it off
+# its subreddit's post count in the same statement; an uncounted post is
+# skipped by the pending counter flush instead.
+DELETE_POST: str = """
+    WITH deleted AS (
+        DELETE FROM post WHERE id = {} AND author = {}
+        RETURNING subreddit, counted
+    ), decremented AS (
+        UPDATE subreddit SET post_count = subreddit.post_count - 1
+        FROM deleted
+        WHERE subreddit.id = deleted.subreddit AND deleted.counted
+    )
+    SELECT subreddit FROM deleted
+"""
+
+
+# Reserves one post ID per bulk row, since COPY cannot return generated IDs.
+ALLOCATE_POST_IDS: str = (
+    "SELECT nextval(pg_get_serial_sequence('post', 'id')) FROM generate_series(1, $1)"
+)
+
+# The `post` columns written by a bulk insert, in record order.
+BULK_COPY_COLUMNS: tuple[str, ...] = (
+    "id",
+    "title",
+    "content",
+    "preview",
+    "url",
+    "created_at",
+    "author",
+    "subreddit",
+)
+
+
+def validate_post(data: PostCreateDTO) -> str | None:
+    """
+    Check a post against the column limits the database would enforce.
+
+    Args:
+        data: The post data.
+
+    Returns:
+        str | None: The validation error, or None if the post is valid.
+    """
+    if not data.title or len(data.title) > Post.title.length:
+        return f"title must be 1 to {Post.title.length} characters"
+    if data.url is not None and len(data.url) > Post.url.length:
+        return f"url must be at most {Post.url.length} characters"
+    return None
+
+
+def decode_post_batch(
+    body: bytes, ndjson: bool
+) -> tuple[list[tuple[int, PostCreateDTO]], list[PostBulkErrorDTO], int]:
+    """
+    Decode and validate every row of a bulk post upload.
+
+    A row that fails to decode or validate is reported and skipped without
+    rejecting the rest of the batch.
+
+    Args:
+        body: A JSON array, or one JSON object per line if `ndjson` is set.
+        ndjson: Whether the body is newline-delimited JSON.
+
+    Returns:
+        tuple[list[tuple[int, PostCreateDTO]], list[PostBulkErrorDTO], int]:
+            The valid rows with their index, the errors, and the row count.
+
+    Raises:
+        ClientException: If the body is not a JSON array or has too many rows.
+    """
+    rows: list[bytes] | list[msgspec.Raw]
+    if ndjson:
+        rows = body.splitlines()
+    else:
+        try:
+            rows = msgspec.json.decode(body, type=list[msgspec.Raw])
+        except msgspec.DecodeError as e:
+            raise ClientException(f"Expected a JSON array of posts: {e}")
+    # Blank NDJSON lines are skipped but still count towards the row index.
+    items: list[tuple[int, bytes | msgspec.Raw]] = [
+        (index, row) for index, row in enumerate(rows) if bytes(row).strip()
+    ]
+    if len(items) > BULK_MAX_POSTS:
+        raise ClientException(f"At most {BULK_MAX_POSTS} posts can be uploaded at once")
+
+    posts: list[tuple[int, PostCreateDTO]] = []
+    errors: list[PostBulkErrorDTO] = []
+    for index, item in items:
+        try:
+            data: PostCreateDTO = msgspec.json.decode(item, type=PostCreateDTO)
+        except msgspec.DecodeError as e:
+            errors.append(PostBulkErrorDTO(index=index, error=str(e)))
+            continue
+        error: str | None = validate_post(data)
+        if error is not None:
+            errors.append(PostBulkErrorDTO(index=index, error=error))
+            continue
+        posts.append((index, data))
+    return posts, errors, len(rows)
 
 
 class PostService:
@@ -24,33 +218,141 @@ class PostService:
         Raises:
             NotFoundException: If the subreddit does not exist.
         """
-        # Find subreddit (using dict for type safety if needed, but Piccolo returns Row/dict)
-        subreddit: dict[str, Any] | None = (
-            await Subreddit.select()
-            .where(Subreddit.name == data.subreddit_name)
-            .first()
+        created_at: datetime = datetime.now()
+        subreddit: SubredditResponseDTO | None = subreddit_directory.get(
+            data.subreddit_name
         )
-        if not subreddit:
-            raise NotFoundException(f"Subreddit '{data.subreddit_name}' not found")
+        if subreddit is not None:
+            new_post: Post = Post(
+                title=data.title,
+                content=data.content,
+                preview=make_preview(data.content),
+                url=data.url,
+                created_at=created_at,
+                author=author_id,
+                subreddit=subreddit.id,
+            )
+            await new_post.save()
+            post_id: int = new_post.id
+        else:
+            # Directory miss: resolve the name inside the INSERT so it is still
+            # one round trip, and warm the directory from the returned row.
+            rows: list[dict[str, Any]] = await Post.raw(
+                INSERT_POST_BY_SUBREDDIT_NAME,
+                data.subreddit_name,
+                data.title,
+                data.content,
+                make_preview(data.content),
+                data.url,
+                created_at,
+                author_id,
+            )
+            if not rows:
+                raise NotFoundException(f"Subreddit '{data.subreddit_name}' not found")
+            post_id = rows[0]["post_id"]
+            subreddit = subreddit_from_row(rows[0])
+            subreddit_directory.add(subreddit)
+
+        feed_index.add_post(post_id, created_at)
+        subreddit_counters.record_posts(subreddit.id, [post_id], created_at)
+        timeline_fanout.add_post(post_id, subreddit.id, created_at)
 
-        new_post: Post = Post(
+        return PostResponseDTO(
+            id=post_id,
             title=data.title,
             content=data.content,
             url=data.url,
-            author=author_id,
-            subreddit=subreddit["id"],
+            created_at=created_at,
+            author_id=author_id,
+            subreddit_id=subreddit.id,
         )
-        await new_post.save()
 
-        return PostResponseDTO(
-            id=new_post.id,
-            title=new_post.title,
-            content=new_post.content,
-            url=new_post.url,
-            created_at=new_post.created_at,
-            author_id=new_post.author,
-            subreddit_id=new_post.subreddit,
+    async def bulk_create_posts(
+        self, body: bytes, ndjson: bool, author_id: int
+    ) -> PostBulkResultDTO:
+        """
+        Create many posts at once with a single COPY.
+
+        The whole batch is decoded and validated first, and the subreddit
+        names are resolved together through the directory. The valid rows are
+        then written with `copy_records_to_table` in one transaction. Rows
+        that fail are reported by index and not inserted.
+
+        Args:
+            body: A JSON array of posts, or one post per line if `ndjson` is set.
+            ndjson: Whether the body is newline-delimited JSON.
+            author_id: The ID of the author of every post.
+
+        Returns:
+            PostBulkResultDTO: The new post ID for each input row (None where
+            the row was rejected) and the per-row errors.
+
+        Raises:
+            ClientException: If the body is not a JSON array or has too many rows.
+        """
+        posts: list[tuple[int, PostCreateDTO]]
+        errors: list[PostBulkErrorDTO]
+        count: int
+        posts, errors, count = decode_post_batch(body, ndjson)
+
+        subreddits: dict[
+            str, SubredditResponseDTO
+        ] = await subreddit_directory.resolve_many(
+            {data.subreddit_name for _, data in posts}
         )
+        accepted: list[tuple[int, PostCreateDTO, int]] = []
+        for index, data in posts:
+            subreddit: SubredditResponseDTO | None = subreddits.get(data.subreddit_name)
+            if subreddit is None:
+                errors.append(
+                    PostBulkErrorDTO(
+                        index=index,
+                        error=f"Subreddit '{data.subreddit_name}' not found",
+                    )
+                )
+                continue
+            accepted.append((index, data, subreddit.id))
+        errors.sort(key=lambda error: error.index)
+
+        ids: list[int | None] = [None] * count
+        if not accepted:
+            return PostBulkResultDTO(ids=ids, errors=errors)
+
+        created_at: datetime = datetime.now()
+        async with acquire_connection() as connection:
+            async with connection.transaction():
+                post_ids: list[int] = [
+                    row[0]
+                    for row in await connection.fetch(ALLOCATE_POST_IDS, len(accepted))
+                ]
+                await connection.copy_records_to_table(
+                    "post",
+                    records=[
+                        (
+                            post_id,
+                            data.title,
+                            data.content,
+                            make_preview(data.content),
+                            data.url,
+                            created_at,
+                            author_id,
+                            subreddit_id,
+                        )
+                        for post_id, (_, data, subreddit_id) in zip(post_ids, accepted)
+                    ],
+                    columns=BULK_COPY_COLUMNS,
+                )
+
+        posts_per_subreddit: defaultdict[int, list[int]] = defaultdict(list)
+        for post_id, (index, _, subreddit_id) in zip(post_ids, accepted):
+            ids[index] = post_id
+            feed_index.add_post(post_id, created_at)
+            timeline_fanout.add_post(post_id, subreddit_id, created_at)
+            posts_per_subreddit[subreddit_id].append(post_id)
+        for subreddit_id, created in posts_per_subreddit.items():
+            subreddit_counters.record_posts(subreddit_id, created, created_at)
+
+        return PostBulkResultDTO(ids=ids, errors=errors)
 
     async def get_post(self, post_id: int) -> PostResponseDTO:
         """
@@ -65,58 +367,228 @@ class PostService:
         Raises:
             NotFoundException: If the post does not exist.
         """
-        post: dict[str, Any] | None = (
-            await Post.select().where(Post.id == post_id).first()
-        )
-        if not post:
+        post: PostResponseDTO | None = await POST_BY_ID.fetchrow(post_id)
+        if post is None:
             raise NotFoundException("Post not found")
 
-        return PostResponseDTO(
-            id=post["id"],
-            title=post["title"],
-            content=post["content"],
-            url=post["url"],
-            created_at=post["created_at"],
-            author_id=post["author"],
-            subreddit_id=post["subreddit"],
-        )
+        return post
+
+    async def delete_post(self, post_id: int, user_id: int) -> None:
+        """
+        Delete a post, with its votes and comments, as its author.
+
+        Args:
+            post_id: The ID of the post.
+            user_id: The ID of the user deleting it.
+
+        Raises:
+            NotFoundException: If the post does not exist.
+            PermissionDeniedException: If the user is not the post's author.
+        """
+        deleted: list[dict[str, int]] = await Post.raw(DELETE_POST, post_id, user_id)
+        if not deleted:
+            if await Post.exists().where(Post.id == post_id):
+                raise PermissionDeniedException("Only the author can delete a post")
+            raise NotFoundException("Post not found")
+
+        subreddit_counters.record_deletion(deleted[0]["subreddit"])
 
     async def get_posts_by_subreddit(
-        self, subreddit_name: str
-    ) -> list[PostResponseDTO]:
+        self,
+        subreddit_name: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> PostPageDTO:
         """
-        Get all posts for a given subreddit.
+        Get a page of posts for a given subreddit, newest first.
+
+        Pagination is keyset-based on ``(created_at, id)`` so every page is a
+        bounded range scan on the ``(subreddit, created_at, id)`` index,
+        regardless of how deep the client has paged.
 
         Args:
             subreddit_name: The name of the subreddit.
+            limit: The maximum number of posts to return.
+            cursor: The opaque cursor from the previous page, if any.
 
         Returns:
-             list[PostResponseDTO]: List of posts.
+            PostPageDTO: The page of posts and the cursor for the next page.
 
         Raises:
             NotFoundException: If subreddit not found.
+            ClientException: If the cursor is malformed.
         """
-        subreddit: dict[str, Any] | None = (
-            await Subreddit.select().where(Subreddit.name == subreddit_name).first()
+        after: tuple[datetime, int] | None = (
+            decode_cursor(cursor, tuple[datetime, int]) if cursor else None
         )
-        if not subreddit:
-            raise NotFoundException(f"Subreddit '{subreddit_name}' not found")
+        subreddit: SubredditResponseDTO | None = subreddit_directory.get(subreddit_name)
+        items: list[PostSummaryDTO]
+        if subreddit is not None:
+            # Hot path: fixed, already prepared statements decoded positionally.
+            if after is None:
+                items = await POSTS_BY_SUBREDDIT.fetch(subreddit.id, limit + 1)
+            else:
+                items = await POSTS_BY_SUBREDDIT_AFTER.fetch(
+                    subreddit.id, after[0], after[1], limit + 1
+                )
+        else:
+            items = await self._get_posts_by_subreddit_name(
+                subreddit_name, limit, after
+            )
+
+        next_cursor: str | None = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor((items[-1].created_at, items[-1].id))
+
+        return PostPageDTO(items=items, next_cursor=next_cursor)
+
+    async def _get_posts_by_subreddit_name(
+        self,
+        subreddit_name: str,
+        limit: int,
+        after: tuple[datetime, int] | None,
+    ) -> list[PostSummaryDTO]:
+        """
+        Load a listing page for a subreddit missing from the directory.
 
-        posts: list[dict[str, Any]] = (
-            await Post.select()
-            .where(Post.subreddit == subreddit["id"])
-            .order_by(Post.created_at, ascending=False)
+        The subreddit is filtered through the join in the same query, and its
+        columns are carried along to warm the directory.
+
+        Args:
+            subreddit_name: The name of the subreddit.
+            limit: The page size; one extra post is loaded to detect a next page.
+            after: The ``(created_at, id)`` keyset position to continue from.
+
+        Returns:
+            list[PostSummaryDTO]: Up to ``limit + 1`` posts, newest first.
+
+        Raises:
+            NotFoundException: If subreddit not found.
+        """
+        query: Select = Post.select(
+            *SUMMARY_COLUMNS,
+            Post.subreddit.name.as_alias("subreddit_name"),
+            Post.subreddit.description.as_alias("subreddit_description"),
+            Post.subreddit.created_at.as_alias("subreddit_created_at"),
+            Post.subreddit.owner.as_alias("subreddit_owner"),
+            Post.subreddit.post_count.as_alias("subreddit_post_count"),
+            Post.subreddit.member_count.as_alias("subreddit_member_count"),
+            Post.subreddit.last_activity_at.as_alias("subreddit_last_activity_at"),
+        ).where(Post.subreddit.name == subreddit_name)
+
+        if after is not None:
+            after_created_at: datetime
+            after_id: int
+            after_created_at, after_id = after
+            # The first condition is the index seek bound; the second one only
+            # trims rows sharing the boundary timestamp.
+            query = query.where(
+                Post.created_at <= after_created_at,
+                (Post.created_at < after_created_at) | (Post.id < after_id),
+            )
+
+        posts: list[Record] = await fetch_records(
+            query.order_by(Post.created_at, Post.id, ascending=False).limit(limit + 1)
         )
 
-        return [
-            PostResponseDTO(
-                id=p["id"],
-                title=p["title"],
-                content=p["content"],
-                url=p["url"],
-                created_at=p["created_at"],
-                author_id=p["author"],
-                subreddit_id=p["subreddit"],
+        if posts:
+            subreddit_directory.add(
+                SubredditResponseDTO(
+                    id=posts[0]["subreddit"],
+                    name=posts[0]["subreddit_name"],
+                    description=posts[0]["subreddit_description"],
+                    created_at=posts[0]["subreddit_created_at"],
+                    owner_id=posts[0]["subreddit_owner"],
+                    post_count=posts[0]["subreddit_post_count"],
+                    member_count=posts[0]["subreddit_member_count"],
+                    last_activity_at=posts[0]["subreddit_last_activity_at"],
+                )
             )
-            for p in posts
-        ]
+        elif await subreddit_directory.resolve(subreddit_name) is None:
+            raise NotFoundException(f"Subreddit '{subreddit_name}' not found")
+
+        return post_summary_from_row.many(posts)
+
+    async def get_feed(
+        self,
+        sort: FeedSort = FeedSort.HOT,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> PostPageDTO:
+        """
+        Get a page of the global feed from the precomputed ranking index.
+
+        The ranking is a slice of the in-memory `feed_index`; the posts for the
+        slice are then loaded with a single batched query by ID.
+
+        Args:
+            sort: The feed ordering (hot, new or top).
+            limit: The maximum number of posts to return.
+            cursor: The opaque cursor from the previous page, if any.
+
+        Returns:
+            PostPageDTO: The page of posts and the cursor for the next page.
+
+        Raises:
+            ClientException: If the cursor is malformed.
+        """
+        offset: int = decode_cursor(cursor, int) if cursor else 0
+        if offset < 0:
+            raise ClientException("Invalid pagination cursor")
+        await feed_index.ensure_loaded()
+
+        post_ids: list[int] = feed_index.page(sort, offset, limit + 1)
+        next_cursor: str | None = None
+        if len(post_ids) > limit:
+            post_ids = post_ids[:limit]
+            next_cursor = encode_cursor(offset + limit)
+        if not post_ids:
+            return PostPageDTO(items=[], next_cursor=None)
+
+        posts: list[PostSummaryDTO] = await fetch_mapped(
+            Post.select(*SUMMARY_COLUMNS).where(Post.id.is_in(post_ids)),
+            post_summary_from_row,
+        )
+        posts_by_id: dict[int, PostSummaryDTO] = {p.id: p for p in posts}
+
+        return PostPageDTO(
+            items=[
+                p
+                for p in (posts_by_id.get(post_id) for post_id in post_ids)
+                if p is not None
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def stream_posts_by_subreddit(
+        self, subreddit_name: str, ndjson: bool = False
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream every post summary in a subreddit, newest first, from a server-side cursor.
+
+        The subreddit is resolved before streaming starts so a missing one
+        still produces a 404 rather than a truncated body.
+
+        Args:
+            subreddit_name: The name of the subreddit.
+            ndjson: Emit newline-delimited JSON instead of a JSON array.
+
+        Returns:
+            AsyncIterator[bytes]: The encoded response body, chunk by chunk.
+
+        Raises:
+            NotFoundException: If subreddit not found.
+        """
+        subreddit: SubredditResponseDTO | None = await subreddit_directory.resolve(
+            subreddit_name
+        )
+        if subreddit is None:
+            raise NotFoundException(f"Subreddit '{subreddit_name}' not found")
+
+        query: Select = (
+            Post.select(*SUMMARY_COLUMNS)
+            .where(Post.subreddit == subreddit.id)
+            .order_by(Post.created_at, Post.id, ascending=False)
+        )
+        return stream_query(query, post_summary_from_row, ndjson=ndjson)
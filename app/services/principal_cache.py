@@ -0,0 +1,109 @@
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from piccolo.columns import Column
+from app.models.user import User
+
+PRINCIPAL_CACHE_TTL: float = float(os.environ.get("AUTH_PRINCIPAL_CACHE_TTL", "60"))
+PRINCIPAL_CACHE_SIZE: int = int(os.environ.get("AUTH_PRINCIPAL_CACHE_SIZE", "10000"))
+
+Principal = dict[str, str | int | bool | datetime | None]
+
+# The columns needed to build `request.user`; `password_hash` is never loaded.
+PRINCIPAL_COLUMNS: tuple[Column, ...] = (
+    User.id,
+    User.username,
+    User.email,
+    User.avatar_url,
+    User.bio,
+    User.is_active,
+    User.is_verified,
+)
+
+
+def to_principal(user: Principal) -> Principal:
+    """
+    Reduce a full user row to the fields exposed as the authenticated principal.
+
+    Args:
+        user: A user row, possibly including sensitive columns.
+
+    Returns:
+        Principal: A new dict with only the principal fields.
+    """
+    return {column._meta.name: user[column._meta.name] for column in PRINCIPAL_COLUMNS}
+
+
+class PrincipalCache:
+    """
+    In-process LRU cache of authenticated user principals with a TTL.
+
+    The TTL bounds how long another worker's write to `User` can go unseen;
+    writes made by this process call `invalidate` directly.
+    """
+
+    def __init__(
+        self, max_size: int = PRINCIPAL_CACHE_SIZE, ttl: float = PRINCIPAL_CACHE_TTL
+    ) -> None:
+        """
+        Args:
+            max_size: The maximum number of principals kept.
+            ttl: Seconds an entry stays valid after being stored.
+        """
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self._entries: OrderedDict[int, tuple[float, Principal]] = OrderedDict()
+
+    def get(self, user_id: int) -> Principal | None:
+        """
+        Get a cached principal if present and not expired.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            Principal | None: The cached principal, or None on a miss.
+        """
+        entry: tuple[float, Principal] | None = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at: float
+        principal: Principal
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def set(self, user_id: int, principal: Principal) -> None:
+        """
+        Store a principal, evicting the least recently used entry if full.
+
+        Args:
+            user_id: The ID of the user.
+            principal: The principal to cache.
+        """
+        self._entries[user_id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(user_id)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's cached principal after a write to their `User` row.
+
+        Args:
+            user_id: The ID of the user.
+        """
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """
+        Drop every cached principal.
+        """
+        self._entries.clear()
+
+
+principal_cache: PrincipalCache = PrincipalCache()
@@ -0,0 +1,495 @@
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Protocol
+from urllib.parse import urlparse
+from litestar.connection import ASGIConnection
+from litestar.exceptions import TooManyRequestsException
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RATE_LIMIT_ENABLED: bool = (
+    os.environ.get("RATE_LIMIT_ENABLED", "true").lower() == "true"
+)
+# Burst size and sustained attempts per minute, per client IP and per username.
+RATE_LIMIT_IP_BURST: int = int(os.environ.get("RATE_LIMIT_IP_BURST", "20"))
+RATE_LIMIT_IP_PER_MINUTE: float = float(
+    os.environ.get("RATE_LIMIT_IP_PER_MINUTE", "20")
+)
+RATE_LIMIT_USERNAME_BURST: int = int(os.environ.get("RATE_LIMIT_USERNAME_BURST", "5"))
+RATE_LIMIT_USERNAME_PER_MINUTE: float = float(
+    os.environ.get("RATE_LIMIT_USERNAME_PER_MINUTE", "5")
+)
+# Availability checks run as the user types, so they get a larger bucket.
+RATE_LIMIT_AVAILABILITY_BURST: int = int(
+    os.environ.get("RATE_LIMIT_AVAILABILITY_BURST", "60")
+)
+RATE_LIMIT_AVAILABILITY_PER_MINUTE: float = float(
+    os.environ.get("RATE_LIMIT_AVAILABILITY_PER_MINUTE", "60")
+)
+# Buckets kept in memory per worker; the least recently used are dropped.
+RATE_LIMIT_MAX_KEYS: int = int(os.environ.get("RATE_LIMIT_MAX_KEYS", "100000"))
+# Shared buckets across workers, e.g. redis://localhost:6379/0. Any server
+# speaking the Redis protocol with Lua scripting works.
+RATE_LIMIT_REDIS_URL: str = os.environ.get("RATE_LIMIT_REDIS_URL", "")
+# Take the client IP from the last X-Forwarded-For entry, as appended by a
+# trusted load balancer (Cloud Run). Only enable behind such a proxy.
+RATE_LIMIT_TRUST_FORWARDED: bool = (
+    os.environ.get("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+)
+RATE_LIMIT_KEY_PREFIX: str = "ratelimit:"
+
+
+class TokenBucket:
+    """
+    A token bucket limit: `capacity` attempts at once, refilled continuously.
+    """
+
+    def __init__(self, capacity: int, per_minute: float) -> None:
+        """
+        Args:
+            capacity: The burst size.
+            per_minute: Tokens added per minute.
+        """
+        self.capacity: float = float(capacity)
+        self.refill_per_second: float = per_minute / 60
+
+
+class RateLimitBackend(Protocol):
+    async def take(self, key: str, bucket: TokenBucket) -> float:
+        """
+        Take one token from a bucket.
+
+        Args:
+            key: The bucket key.
+            bucket: The bucket's limit.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available.
+        """
+        ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryRateLimitBackend:
+    """
+    In-process token buckets, private to this worker.
+
+    Each bucket is stored as ``(tokens, updated_at)`` and refilled lazily when
+    it is next used, so idle buckets cost nothing but memory, which is capped
+    at `max_keys` by dropping the least recently used ones.
+    """
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS) -> None:
+        """
+        Args:
+            max_keys: The maximum number of buckets kept.
+        """
+        self.max_keys: int = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, bucket: TokenBucket) -> float:
+        """
+        Take one token from a bucket.
+
+        Args:
+            key: The bucket key.
+            bucket: The bucket's limit.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available.
+        """
+        now: float = time.monotonic()
+        state: tuple[float, float] | None = self._buckets.get(key)
+        if state is None:
+            tokens: float = bucket.capacity
+        else:
+            tokens = min(
+                bucket.capacity,
+                state[0] + (now - state[1]) * bucket.refill_per_second,
+            )
+            self._buckets.move_to_end(key)
+
+        retry_after: float = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / bucket.refill_per_second
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    async def close(self) -> None:
+        self._buckets.clear()
+
+
+# Refills and takes from a bucket atomically, on the server's clock. Returns
+# the seconds to wait as a string, since Lua numbers are truncated to integers
+# in replies.
+TAKE_TOKEN_SCRIPT: str = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(retry_after)
+"""
+
+
+class RespError(Exception):
+    """
+    An error reply from a Redis-compatible server.
+    """
+
+
+class RedisRateLimitBackend:
+    """
+    Token buckets shared by every worker through a Redis-compatible server.
+
+    Speaks the Redis protocol (RESP) over a single connection, so no client
+    library is needed; each take is one `EVALSHA` round trip. If the server is
+    unreachable, buckets fall back to this worker's `fallback` backend for
+    `retry_interval` seconds at a time, so limits degrade to per-worker
+    instead of failing open.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        fallback: RateLimitBackend,
+        timeout: float = 0.5,
+        retry_interval: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            url: The server URL, ``redis://[:password@]host[:port][/db]``.
+            fallback: The backend to use while the server is unavailable.
+            timeout: Seconds to wait for the server per request, including
+                the wait for the shared connection.
+            retry_interval: Seconds to use `fallback` after a failure before
+                trying the server again.
+        """
+        parsed = urlparse(url)
+        self.host: str = parsed.hostname or "localhost"
+        self.port: int = parsed.port or 6379
+        self.password: str | None = parsed.password
+        self.db: int = int(parsed.path.lstrip("/") or 0)
+        self.fallback: RateLimitBackend = fallback
+        self.timeout: float = timeout
+        self.retry_interval: float = retry_interval
+        self._retry_at: float = 0.0
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._script_sha: str | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        """
+        Open the connection, authenticate, select the database and load the script.
+        """
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            await self._command("AUTH", self.password)
+        if self.db:
+            await self._command("SELECT", str(self.db))
+        self._script_sha = await self._command("SCRIPT", "LOAD", TAKE_TOKEN_SCRIPT)
+
+    async def _command(self, *args: str) -> object:
+        """
+        Send one command and read its reply.
+
+        Args:
+            *args: The command and its arguments.
+
+        Returns:
+            object: The decoded reply.
+
+        Raises:
+            RespError: If the server replied with an error.
+        """
+        assert self._reader is not None and self._writer is not None
+        encoded: list[bytes] = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data: bytes = arg.encode()
+            encoded.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._writer.write(b"".join(encoded))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def _read_reply(self) -> object:
+        """
+        Read one RESP reply.
+
+        Returns:
+            object: A str, int, None or list, depending on the reply type.
+
+        Raises:
+            RespError: If the server replied with an error.
+        """
+        assert self._reader is not None
+        line: bytes = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Rate limit server closed the connection")
+        kind: bytes = line[:1]
+        body: str = line[1:-2].decode()
+        if kind == b"+":
+            return body
+        if kind == b"-":
+            raise RespError(body)
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            if body == "-1":
+                return None
+            return (await self._reader.readexactly(int(body) + 2))[:-2].decode()
+        if kind == b"*":
+            return [await self._read_reply() for _ in range(int(body))]
+        raise ConnectionError(f"Unexpected reply from rate limit server: {line!r}")
+
+    async def _take(self, key: str, bucket: TokenBucket) -> float:
+        """
+        Take one token on the server, connecting first if needed.
+
+        Args:
+            key: The bucket key.
+            bucket: The bucket's limit.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available.
+        """
+        if self._writer is None:
+            await self._connect()
+        args: tuple[str, ...] = (
+            "1",
+            RATE_LIMIT_KEY_PREFIX + key,
+            repr(bucket.capacity),
+            repr(bucket.refill_per_second),
+        )
+        try:
+            reply: object = await self._command("EVALSHA", self._script_sha, *args)
+        except RespError as error:
+            if not str(error).startswith("NOSCRIPT"):
+                raise
+            # The server restarted or flushed its script cache.
+            reply = await self._command("EVAL", TAKE_TOKEN_SCRIPT, *args)
+        return float(reply)
+
+    async def take(self, key: str, bucket: TokenBucket) -> float:
+        """
+        Take one token from a shared bucket, or a local one if the server is down.
+
+        Args:
+            key: The bucket key.
+            bucket: The bucket's limit.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available.
+        """
+        if time.monotonic() >= self._retry_at:
+            deadline: float = time.monotonic() + self.timeout
+            try:
+                await asyncio.wait_for(self._lock.acquire(), self.timeout)
+            except TimeoutError:
+                # Queued behind a slow call; that call marks the server down
+                # if it times out itself.
+                return await self.fallback.take(key, bucket)
+            try:
+                # Another call may have given up on the server while this
+                # one waited for the connection.
+                if time.monotonic() < self._retry_at:
+                    return await self.fallback.take(key, bucket)
+                return await asyncio.wait_for(
+                    self._take(key, bucket), deadline - time.monotonic()
+                )
+            except (OSError, TimeoutError, RespError, ValueError) as error:
+                logger.warning(
+                    "Rate limit server unavailable, using local buckets for %ss: %r",
+                    self.retry_interval,
+                    error,
+                )
+                self._retry_at = time.monotonic() + self.retry_interval
+                await self._disconnect()
+            finally:
+                self._lock.release()
+        return await self.fallback.take(key, bucket)
+
+    async def _disconnect(self) -> None:
+        """
+        Drop the connection, so the next take reconnects.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = self._writer = None
+
+    async def close(self) -> None:
+        await self._disconnect()
+        await self.fallback.close()
+
+
+def client_address(connection: ASGIConnection) -> str:
+    """
+    Get the client IP to rate limit by.
+
+    Args:
+        connection: The request.
+
+    Returns:
+        str: The client IP, or "unknown" if the server does not report one.
+    """
+    if RATE_LIMIT_TRUST_FORWARDED:
+        forwarded: str | None = connection.headers.get("X-Forwarded-For")
+        if forwarded:
+            return forwarded.rsplit(",", 1)[-1].strip()
+    return connection.client.host if connection.client else "unknown"
+
+
+class RateLimiter:
+    """
+    Token-bucket limits for the credential endpoints, which run Argon2, and
+    the username/email availability check, which can enumerate accounts.
+
+    Checked before any hashing or database work, so a burst of credential
+    stuffing is rejected for the cost of a dictionary lookup (or one round
+    trip to the shared backend). Buckets are keyed by client IP and, for
+    logins, by username, which also slows down distributed guessing against
+    a single account.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        ip_bucket: TokenBucket,
+        username_bucket: TokenBucket,
+        availability_bucket: TokenBucket | None = None,
+        enabled: bool = RATE_LIMIT_ENABLED,
+    ) -> None:
+        """
+        Args:
+            backend: Where the buckets are stored.
+            ip_bucket: The limit per client IP.
+            username_bucket: The limit per username.
+            availability_bucket: The limit on availability checks per client
+                IP, defaults to `ip_bucket`.
+            enabled: Whether limits are enforced at all.
+        """
+        self.backend: RateLimitBackend = backend
+        self.ip_bucket: TokenBucket = ip_bucket
+        self.username_bucket: TokenBucket = username_bucket
+        self.availability_bucket: TokenBucket = availability_bucket or ip_bucket
+        self.enabled: bool = enabled
+        self.rejected: int = 0
+
+    async def _take(self, key: str, bucket: TokenBucket) -> None:
+        """
+        Take a token, or reject the request.
+
+        Args:
+            key: The bucket key.
+            bucket: The bucket's limit.
+
+        Raises:
+            TooManyRequestsException: If the bucket is empty.
+        """
+        retry_after: float = await self.backend.take(key, bucket)
+        if retry_after > 0:
+            self.rejected += 1
+            raise TooManyRequestsException(
+                "Too many attempts, retry later",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+    async def check_login(self, client_ip: str, username: str) -> None:
+        """
+        Count a login attempt against the client IP and the username.
+
+        Args:
+            client_ip: The client's IP address.
+            username: The username being logged in to.
+
+        Raises:
+            TooManyRequestsException: If either limit is exhausted.
+        """
+        if not self.enabled:
+            return
+        await self._take(f"login:ip:{client_ip}", self.ip_bucket)
+        await self._take(f"login:user:{username.lower()}", self.username_bucket)
+
+    async def check_register(self, client_ip: str) -> None:
+        """
+        Count a registration attempt against the client IP.
+
+        Args:
+            client_ip: The client's IP address.
+
+        Raises:
+            TooManyRequestsException: If the limit is exhausted.
+        """
+        if not self.enabled:
+            return
+        await self._take(f"register:ip:{client_ip}", self.ip_bucket)
+
+    async def check_availability(self, client_ip: str) -> None:
+        """
+        Count a username/email availability check against the client IP.
+
+        Args:
+            client_ip: The client's IP address.
+
+        Raises:
+            TooManyRequestsException: If the limit is exhausted.
+        """
+        if not self.enabled:
+            return
+        await self._take(f"available:ip:{client_ip}", self.availability_bucket)
+
+    async def close(self) -> None:
+        """
+        Close the backend.
+        """
+        await self.backend.close()
+
+
+def create_backend() -> RateLimitBackend:
+    """
+    Build the configured rate limit backend.
+
+    Returns:
+        RateLimitBackend: The shared backend if `RATE_LIMIT_REDIS_URL` is set,
+        else in-process buckets.
+    """
+    memory: MemoryRateLimitBackend = MemoryRateLimitBackend()
+    if RATE_LIMIT_REDIS_URL:
+        return RedisRateLimitBackend(RATE_LIMIT_REDIS_URL, fallback=memory)
+    return memory
+
+
+rate_limiter: RateLimiter = RateLimiter(
+    create_backend(),
+    ip_bucket=TokenBucket(RATE_LIMIT_IP_BURST, RATE_LIMIT_IP_PER_MINUTE),
+    username_bucket=TokenBucket(
+        RATE_LIMIT_USERNAME_BURST, RATE_LIMIT_USERNAME_PER_MINUTE
+    ),
+    availability_bucket=TokenBucket(
+        RATE_LIMIT_AVAILABILITY_BURST, RATE_LIMIT_AVAILABILITY_PER_MINUTE
+    ),
+)
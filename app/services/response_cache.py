@@ -0,0 +1,118 @@
+import hashlib
+import os
+import time
+from msgspec import Struct
+
+RESPONSE_CACHE_TTL: float = float(os.environ.get("RESPONSE_CACHE_TTL", "30"))
+
+
+class CachedResponse(Struct):
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for an encoded response body.
+
+    Args:
+        body: The encoded response body.
+
+    Returns:
+        str: The quoted ETag value.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check whether an `If-None-Match` header matches the current ETag.
+
+    Args:
+        if_none_match: The raw header value, if sent.
+        etag: The current quoted ETag.
+
+    Returns:
+        bool: True if the client's copy is current and a 304 can be sent.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    """
+    In-process cache of pre-encoded response bodies and their ETags.
+
+    Entries are invalidated explicitly by the writes that change them; the TTL
+    bounds how long a write made by another worker can go unseen. Each key has
+    a generation counter so a fill that raced with an invalidation is dropped.
+    """
+
+    def __init__(self, ttl: float = RESPONSE_CACHE_TTL) -> None:
+        """
+        Args:
+            ttl: Seconds an entry stays valid after being stored.
+        """
+        self.ttl: float = ttl
+        self._entries: dict[str, tuple[float, CachedResponse]] = {}
+        self._generations: dict[str, int] = {}
+
+    def generation(self, key: str) -> int:
+        """
+        Get the current generation of a key, to be passed back to `set`.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            int: The number of times the key has been invalidated.
+        """
+        return self._generations.get(key, 0)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Get a cached response if present and not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            CachedResponse | None: The cached response, or None on a miss.
+        """
+        entry: tuple[float, CachedResponse] | None = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: str, body: bytes, generation: int) -> CachedResponse:
+        """
+        Store an encoded body unless the key was invalidated since `generation`.
+
+        Args:
+            key: The cache key.
+            body: The encoded response body.
+            generation: The key's generation read before building the body.
+
+        Returns:
+            CachedResponse: The body with its ETag.
+        """
+        cached: CachedResponse = CachedResponse(body=body, etag=make_etag(body))
+        if generation == self.generation(key):
+            self._entries[key] = (time.monotonic() + self.ttl, cached)
+        return cached
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop a cached response after the data behind it changed.
+
+        Args:
+            key: The cache key.
+        """
+        self._entries.pop(key, None)
+        self._generations[key] = self.generation(key) + 1
+
+
+response_cache: ResponseCache = ResponseCache()
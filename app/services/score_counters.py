@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import os
+from app.models.post import Post
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+VOTE_FLUSH_INTERVAL: float = float(os.environ.get("VOTE_FLUSH_INTERVAL", "2"))
+VOTE_COUNTER_SHARDS: int = int(os.environ.get("VOTE_COUNTER_SHARDS", "16"))
+
+# Adds every pending delta to its post's score in one statement.
+FLUSH_SCORE_DELTAS: str = """
+    UPDATE post SET score = post.score + deltas.amount
+    FROM unnest({}::integer[], {}::integer[]) AS deltas(id, amount)
+    WHERE post.id = deltas.id
+"""
+
+
+class ScoreCounters:
+    """
+    Write-behind counters for post scores.
+
+    Votes add their delta to an in-memory shard keyed by post ID, which is
+    O(1) and never touches the `post` row. A background task drains the
+    shards every `flush_interval` seconds and applies each shard's deltas to
+    `Post.score` with a single multi-row UPDATE, so a burst of votes on a hot
+    post becomes one row write per interval instead of one per vote.
+    """
+
+    def __init__(
+        self,
+        shards: int = VOTE_COUNTER_SHARDS,
+        flush_interval: float = VOTE_FLUSH_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            shards: The number of counter shards; each one is flushed as its
+                own statement, which bounds the size of a single UPDATE.
+            flush_interval: Seconds between background flushes.
+        """
+        self.flush_interval: float = flush_interval
+        self._shards: list[dict[int, int]] = [{} for _ in range(shards)]
+        self._task: asyncio.Task[None] | None = None
+
+    def add(self, post_id: int, delta: int) -> None:
+        """
+        Record a score change to be written on the next flush.
+
+        Args:
+            post_id: The ID of the post.
+            delta: The change in score.
+        """
+        shard: dict[int, int] = self._shards[post_id % len(self._shards)]
+        shard[post_id] = shard.get(post_id, 0) + delta
+
+    async def flush(self) -> None:
+        """
+        Write every pending delta to `Post.score`.
+
+        Each shard is swapped out before its UPDATE is awaited so votes keep
+        landing in a fresh dict; if the UPDATE fails, the drained deltas are
+        merged back and retried on the next flush.
+        """
+        for index, shard in enumerate(self._shards):
+            deltas: dict[int, int] = {
+                post_id: delta for post_id, delta in shard.items() if delta
+            }
+            self._shards[index] = {}
+            if not deltas:
+                continue
+            # Sorted IDs keep the row lock order stable across workers.
+            post_ids: list[int] = sorted(deltas)
+            try:
+                await Post.raw(
+                    FLUSH_SCORE_DELTAS,
+                    post_ids,
+                    [deltas[post_id] for post_id in post_ids],
+                )
+            except Exception:
+                for post_id, delta in deltas.items():
+                    self.add(post_id, delta)
+                raise
+
+    async def _flush_forever(self) -> None:
+        """
+        Background loop that flushes the counters every `flush_interval` seconds.
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Score counter flush failed")
+
+    async def start(self) -> None:
+        """
+        Start the background flusher.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_forever())
+
+    async def stop(self) -> None:
+        """
+        Stop the background flusher and write out whatever is still pending.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+score_counters: ScoreCounters = ScoreCounters()
@@ -0,0 +1,100 @@
+from asyncpg import Record
+from litestar.exceptions import NotFoundException
+from app.mapping import fetch_records
+from app.models.post import Post
+from app.dtos.post import PostPageDTO
+from app.dtos.subreddit import SubredditResponseDTO
+from app.services.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from app.services.post_service import post_summary_from_row
+from app.services.subreddit_directory import subreddit_directory
+
+SEARCH_LANGUAGE: str = "english"
+
+# Matches posts through the GIN index on the generated `post.search_vector`
+# column (title weighted above content), then orders by rank with `id` as the
+# tie-breaker so `(rank, id)` is a stable keyset. Parameters: language, query,
+# subreddit ID (twice), cursor rank (twice), cursor ID, limit.
+SEARCH_POSTS: str = """
+    SELECT id, title, url, created_at, author, subreddit, preview, score, rank
+    FROM (
+        SELECT post.id, post.title, post.url, post.created_at, post.author,
+            post.subreddit, post.preview, post.score,
+            ts_rank_cd(post.search_vector, query) AS rank
+        FROM post, websearch_to_tsquery({}::regconfig, {}::text) AS query
+        WHERE post.search_vector @@ query
+            AND ({}::integer IS NULL OR post.subreddit = {}::integer)
+    ) AS matches
+    WHERE {}::real IS NULL OR (rank, id) < ({}::real, {}::integer)
+    ORDER BY rank DESC, id DESC
+    LIMIT {}
+"""
+
+
+class SearchService:
+    """
+    Service for full-text search over posts.
+    """
+
+    async def search_posts(
+        self,
+        query: str,
+        subreddit_name: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> PostPageDTO:
+        """
+        Search post titles and content, best match first.
+
+        `query` uses web search syntax ("quoted phrases", `or`, `-excluded`).
+        Pagination is keyset-based on ``(rank, id)``.
+
+        Args:
+            query: The search terms.
+            subreddit_name: Only search this subreddit, if given.
+            limit: The maximum number of posts to return.
+            cursor: The opaque cursor from the previous page, if any.
+
+        Returns:
+            PostPageDTO: The page of matching posts and the cursor for the next page.
+
+        Raises:
+            NotFoundException: If the subreddit does not exist.
+            ClientException: If the cursor is malformed.
+        """
+        subreddit_id: int | None = None
+        if subreddit_name is not None:
+            subreddit: SubredditResponseDTO | None = await subreddit_directory.resolve(
+                subreddit_name
+            )
+            if subreddit is None:
+                raise NotFoundException(f"Subreddit '{subreddit_name}' not found")
+            subreddit_id = subreddit.id
+
+        after_rank: float | None = None
+        after_id: int | None = None
+        if cursor:
+            after_rank, after_id = decode_cursor(cursor, tuple[float, int])
+
+        posts: list[Record] = await fetch_records(
+            Post.raw(
+                SEARCH_POSTS,
+                SEARCH_LANGUAGE,
+                query,
+                subreddit_id,
+                subreddit_id,
+                after_rank,
+                after_rank,
+                after_id,
+                limit + 1,
+            )
+        )
+
+        next_cursor: str | None = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_cursor((posts[-1]["rank"], posts[-1]["id"]))
+
+        return PostPageDTO(
+            items=post_summary_from_row.many(posts),
+            next_cursor=next_cursor,
+        )
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from app.dtos.health import StartupPhaseDTO, StartupStatsDTO
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Cold start mode: serve the pre-generated OpenAPI schema instead of building
+# one, and warm non-critical caches in the background instead of before the
+# first request.
+FAST_START: bool = os.environ.get("FAST_START", "false").lower() == "true"
+OPENAPI_SCHEMA_PATH: str = os.environ.get("OPENAPI_SCHEMA_PATH", "openapi.json")
+
+StartupHook = Callable[[], Awaitable[None]]
+
+
+def process_age() -> float | None:
+    """
+    Get how long ago the interpreter process started, from ``/proc``.
+
+    Returns:
+        float | None: Seconds since the process started, or None where
+        ``/proc`` is unavailable.
+    """
+    try:
+        with open("/proc/self/stat") as stat, open("/proc/uptime") as uptime:
+            # The process name may contain spaces, so fields are counted from
+            # its closing parenthesis; starttime is field 22.
+            started_ticks: int = int(stat.read().rpartition(")")[2].split()[19])
+            uptime_seconds: float = float(uptime.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return uptime_seconds - started_ticks / os.sysconf("SC_CLK_TCK")
+
+
+class StartupTimer:
+    """
+    Records how long each phase of a worker's startup takes.
+
+    Phases are measured from the moment this module is imported, which is the
+    first thing `app.main` does: imports and app construction, then each
+    startup hook. Background phases are recorded when they finish. The time
+    to the first successful response is recorded by `MetricsMiddleware`.
+    """
+
+    def __init__(self) -> None:
+        self.started: float = time.perf_counter()
+        age: float | None = process_age()
+        # Interpreter startup and imports before `app.main`, if known.
+        self.interpreter_seconds: float | None = age
+        self.phases: list[StartupPhaseDTO] = []
+        self.ready_seconds: float | None = None
+        self.first_response_seconds: float | None = None
+        self._last_mark: float = self.started
+        self._background: set[asyncio.Task[None]] = set()
+
+    def elapsed(self) -> float:
+        """
+        Returns:
+            float: Seconds since this module was imported.
+        """
+        return time.perf_counter() - self.started
+
+    def mark(self, name: str) -> None:
+        """
+        Close a synchronous phase that ran since the previous mark.
+
+        Args:
+            name: The phase name.
+        """
+        now: float = time.perf_counter()
+        self.phases.append(
+            StartupPhaseDTO(
+                name=name, duration_ms=(now - self._last_mark) * 1000, background=False
+            )
+        )
+        self._last_mark = now
+
+    def _record(self, name: str, started: float, background: bool) -> None:
+        """
+        Record a finished startup hook.
+
+        Args:
+            name: The phase name.
+            started: When the hook started, from `time.perf_counter`.
+            background: Whether it ran after the worker was ready.
+        """
+        now: float = time.perf_counter()
+        self.phases.append(
+            StartupPhaseDTO(
+                name=name, duration_ms=(now - started) * 1000, background=background
+            )
+        )
+        self._last_mark = now
+
+    def timed(self, name: str, hook: StartupHook) -> StartupHook:
+        """
+        Wrap a startup hook so its duration is recorded.
+
+        Args:
+            name: The phase name.
+            hook: The startup hook.
+
+        Returns:
+            StartupHook: The wrapped hook.
+        """
+
+        async def run() -> None:
+            started: float = time.perf_counter()
+            await hook()
+            self._record(name, started, background=False)
+
+        return run
+
+    def background(self, name: str, hook: StartupHook) -> StartupHook:
+        """
+        Wrap a startup hook so it runs in the background, without delaying
+        readiness, and its duration is recorded when it finishes.
+
+        Args:
+            name: The phase name.
+            hook: A hook whose work is safe to finish after the first request.
+
+        Returns:
+            StartupHook: The wrapped hook, which returns immediately.
+        """
+
+        async def run_in_background() -> None:
+            started: float = time.perf_counter()
+            try:
+                await hook()
+            except Exception:
+                logger.exception("Background startup phase %s failed", name)
+            else:
+                self._record(name, started, background=True)
+
+        async def run() -> None:
+            task: asyncio.Task[None] = asyncio.create_task(run_in_background())
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+        return run
+
+    def deferrable(self, name: str, hook: StartupHook) -> StartupHook:
+        """
+        Run a hook in the background in `FAST_START` mode, else before readiness.
+
+        Args:
+            name: The phase name.
+            hook: A hook whose work is safe to finish after the first request.
+
+        Returns:
+            StartupHook: The wrapped hook.
+        """
+        return self.background(name, hook) if FAST_START else self.timed(name, hook)
+
+    async def ready(self) -> None:
+        """
+        Startup hook, registered last, that records when the worker was ready.
+        """
+        self.ready_seconds = self.elapsed()
+
+    def first_response(self) -> None:
+        """
+        Record the first successful response, once.
+        """
+        if self.first_response_seconds is None:
+            self.first_response_seconds = self.elapsed()
+
+    def stats(self) -> StartupStatsDTO:
+        """
+        Snapshot the startup breakdown.
+
+        Returns:
+            StartupStatsDTO: The phases, readiness and time to first response.
+        """
+        return StartupStatsDTO(
+            fast_start=FAST_START,
+            interpreter_ms=(
+                None
+                if self.interpreter_seconds is None
+                else self.interpreter_seconds * 1000
+            ),
+            phases=list(self.phases),
+            ready_ms=None if self.ready_seconds is None else self.ready_seconds * 1000,
+            first_response_ms=(
+                None
+                if self.first_response_seconds is None
+                else self.first_response_seconds * 1000
+            ),
+        )
+
+
+startup_timer: StartupTimer = StartupTimer()
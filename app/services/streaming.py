@@ -0,0 +1,96 @@
+import os
+from collections.abc import AsyncIterator, Callable
+import msgspec
+from asyncpg import Connection, Record
+from litestar import MediaType
+from litestar.response import Stream
+from piccolo.query.base import Query
+from app.db import acquire_connection, compile_query
+
+STREAM_CHUNK_SIZE: int = int(os.environ.get("STREAM_CHUNK_SIZE", "500"))
+NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    """
+    Check whether the client asked for newline-delimited JSON.
+
+    Args:
+        accept: The raw `Accept` header, if sent.
+
+    Returns:
+        bool: True if NDJSON should be streamed instead of a JSON array.
+    """
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept
+
+
+def stream_response(body: AsyncIterator[bytes], ndjson: bool) -> Stream:
+    """
+    Wrap a streamed body in a response with the matching content type.
+
+    Args:
+        body: The encoded response body, chunk by chunk.
+        ndjson: Whether the body is NDJSON rather than a JSON array.
+
+    Returns:
+        Stream: The streaming response.
+    """
+    media_type: str = NDJSON_MEDIA_TYPE if ndjson else MediaType.JSON.value
+    # The handler's own media type wins over `Stream(media_type=...)`, so the
+    # header is set explicitly.
+    return Stream(body, media_type=media_type, headers={"content-type": media_type})
+
+
+async def stream_query(
+    query: Query,
+    record_to_struct: Callable[[Record], msgspec.Struct],
+    ndjson: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of a query as JSON, reading them through a server-side cursor.
+
+    Rows are fetched `chunk_size` at a time and each chunk is encoded and
+    yielded before the next is read, so peak memory is bounded by the chunk
+    size rather than the result size. A pooled connection is held for the
+    duration of the stream.
+
+    Args:
+        query: The Piccolo query to run.
+        record_to_struct: Maps an asyncpg record to the response struct.
+        ndjson: Emit one JSON document per line instead of a JSON array.
+        chunk_size: The number of rows fetched and encoded per chunk.
+
+    Yields:
+        bytes: Encoded chunks of the response body.
+    """
+    sql: str
+    args: list
+    sql, args = compile_query(query)
+    encoder: msgspec.json.Encoder = msgspec.json.Encoder()
+    separator: bytes = b"\n" if ndjson else b","
+    buffer: bytearray = bytearray() if ndjson else bytearray(b"[")
+    rows_in_chunk: int = 0
+    first: bool = True
+
+    connection: Connection
+    async with acquire_connection() as connection:
+        # asyncpg cursors only exist inside a transaction.
+        async with connection.transaction(readonly=True):
+            async for record in connection.cursor(sql, *args, prefetch=chunk_size):
+                if not ndjson and not first:
+                    buffer += separator
+                encoder.encode_into(record_to_struct(record), buffer, -1)
+                if ndjson:
+                    buffer += separator
+                first = False
+                rows_in_chunk += 1
+                if rows_in_chunk >= chunk_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    rows_in_chunk = 0
+
+    if not ndjson:
+        buffer += b"]"
+    if buffer:
+        yield bytes(buffer)
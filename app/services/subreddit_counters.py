@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from asyncpg import Connection
+from app.db import acquire_connection
+from app.models.subreddit import Subreddit
+from app.services.response_cache import response_cache
+from app.services.subreddit_directory import (
+    SUBREDDIT_LIST_CACHE_KEY,
+    subreddit_directory,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SUBREDDIT_COUNTER_FLUSH_INTERVAL: float = float(
+    os.environ.get("SUBREDDIT_COUNTER_FLUSH_INTERVAL", "2")
+)
+SUBREDDIT_RECONCILE_INTERVAL: float = float(
+    os.environ.get("SUBREDDIT_RECONCILE_INTERVAL", "900")
+)
+# Posts still not counted this long after they were created are presumed lost
+# by a worker that died before flushing, and are counted by the reconciliation.
+SUBREDDIT_RECONCILE_SETTLE: float = float(
+    os.environ.get("SUBREDDIT_RECONCILE_SETTLE", "60")
+)
+
+# Held for the reconciliation transaction, so only one worker runs it at a time.
+RECONCILE_LOCK_ID: int = 0x5B_C0_01_24
+
+# Marks the pending posts as counted and adds them to their subreddits' stats
+# in one statement. Posts deleted before the flush, or already counted by a
+# reconciliation, are skipped, so no post is ever counted twice.
+FLUSH_COUNTED_POSTS: str = """
+    WITH counted AS (
+        UPDATE post SET counted = TRUE
+        WHERE id = ANY({}::integer[]) AND NOT counted
+        RETURNING subreddit, created_at
+    ), deltas AS (
+        SELECT subreddit, count(*)::integer AS amount,
+            max(created_at) AS activity_at
+        FROM counted
+        GROUP BY subreddit
+    )
+    UPDATE subreddit SET
+        post_count = subreddit.post_count + deltas.amount,
+        last_activity_at = GREATEST(subreddit.last_activity_at, deltas.activity_at)
+    FROM deltas
+    WHERE subreddit.id = deltas.subreddit
+"""
+
+# Counts the posts whose flush was lost.
+COUNT_LOST_POSTS: str = """
+    UPDATE post SET counted = TRUE
+    WHERE NOT counted AND created_at < $1
+"""
+
+# Recomputes the stats of every subreddit from its counted posts and corrects
+# the rows that drifted. The count is corrected relative to the value read,
+# so a flush or delete that commits meanwhile is kept; the last activity is
+# only replaced if no flush moved it meanwhile.
+RECONCILE_SUBREDDIT_STATS: str = """
+    UPDATE subreddit SET
+        post_count = subreddit.post_count + stats.post_count - stats.seen_post_count,
+        last_activity_at = GREATEST(
+            stats.last_activity_at,
+            CASE
+                WHEN subreddit.last_activity_at
+                    IS DISTINCT FROM stats.seen_last_activity_at
+                THEN subreddit.last_activity_at
+            END
+        )
+    FROM (
+        SELECT subreddit.id,
+            subreddit.post_count AS seen_post_count,
+            subreddit.last_activity_at AS seen_last_activity_at,
+            count(post.id)::integer AS post_count,
+            max(post.created_at) AS last_activity_at
+        FROM subreddit
+        LEFT JOIN post ON post.subreddit = subreddit.id AND post.counted
+        GROUP BY subreddit.id
+    ) AS stats
+    WHERE subreddit.id = stats.id
+        AND (stats.seen_post_count, stats.seen_last_activity_at)
+            IS DISTINCT FROM (stats.post_count, stats.last_activity_at)
+    RETURNING subreddit.id
+"""
+
+
+class SubredditCounters:
+    """
+    Write-behind counters for the denormalized subreddit stats.
+
+    Post creation records the new post IDs here. They are applied to the
+    in-memory directory at once, and to `Subreddit.post_count` /
+    `Subreddit.last_activity_at` by a background flush every `flush_interval`
+    seconds, as a single statement that also sets `Post.counted`. The flag
+    makes the flushed state visible in the database: a post is in its
+    subreddit's count exactly when it is counted. Deletions take counted
+    posts off the count in the delete statement itself (see
+    `PostService.delete_post`).
+
+    A slower reconciliation every `reconcile_interval` seconds recomputes
+    every subreddit's stats from its counted posts to repair drift, and
+    counts posts whose flush was lost, e.g. when a worker was killed before
+    flushing. Posts still waiting in some worker's memory are not counted
+    yet on either side, so busy subreddits are reconciled like idle ones.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = SUBREDDIT_COUNTER_FLUSH_INTERVAL,
+        reconcile_interval: float = SUBREDDIT_RECONCILE_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            flush_interval: Seconds between background flushes.
+            reconcile_interval: Seconds between reconciliations.
+        """
+        self.flush_interval: float = flush_interval
+        self.reconcile_interval: float = reconcile_interval
+        # IDs of the posts created since the last flush.
+        self._pending: list[int] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def record_posts(
+        self, subreddit_id: int, post_ids: list[int], created_at: datetime
+    ) -> None:
+        """
+        Record posts created in a subreddit.
+
+        Args:
+            subreddit_id: The ID of the subreddit.
+            post_ids: The IDs of the new posts.
+            created_at: When the posts were created.
+        """
+        subreddit_directory.record_posts(subreddit_id, len(post_ids), created_at)
+        self._pending.extend(post_ids)
+
+    def record_deletion(self, subreddit_id: int) -> None:
+        """
+        Record a post deleted from a subreddit.
+
+        The delete statement has already taken the post off the stored count
+        if it was counted, so only the directory and the cached list change.
+
+        Args:
+            subreddit_id: The ID of the subreddit.
+        """
+        subreddit_directory.record_posts(subreddit_id, -1)
+        response_cache.invalidate(SUBREDDIT_LIST_CACHE_KEY)
+
+    async def flush(self) -> None:
+        """
+        Count every pending post in its subreddit's stats.
+
+        The pending list is swapped out before the UPDATE is awaited; if it
+        fails, the drained posts are queued again and retried on the next
+        flush.
+        """
+        pending: list[int] = self._pending
+        self._pending = []
+        if not pending:
+            return
+        try:
+            await Subreddit.raw(FLUSH_COUNTED_POSTS, pending)
+        except Exception:
+            self._pending = pending + self._pending
+            raise
+        response_cache.invalidate(SUBREDDIT_LIST_CACHE_KEY)
+
+    async def reconcile(self) -> int:
+        """
+        Count lost posts, then recompute the stats of every subreddit and fix
+        any drift.
+
+        Runs under a transaction-level advisory lock; if another worker is
+        already reconciling, this one skips the run.
+
+        Returns:
+            int: The number of subreddits whose stats were corrected.
+        """
+        lost_before: datetime = datetime.now() - timedelta(
+            seconds=SUBREDDIT_RECONCILE_SETTLE
+        )
+        connection: Connection
+        async with acquire_connection() as connection:
+            async with connection.transaction():
+                if not await connection.fetchval(
+                    "SELECT pg_try_advisory_xact_lock($1)", RECONCILE_LOCK_ID
+                ):
+                    return 0
+                await connection.execute(COUNT_LOST_POSTS, lost_before)
+                repaired: int = len(await connection.fetch(RECONCILE_SUBREDDIT_STATS))
+        if repaired:
+            logger.warning("Repaired drifted stats of %d subreddits", repaired)
+            response_cache.invalidate(SUBREDDIT_LIST_CACHE_KEY)
+        return repaired
+
+    async def _run_forever(self) -> None:
+        """
+        Background loop that flushes every `flush_interval` seconds and
+        reconciles every `reconcile_interval` seconds.
+        """
+        next_reconcile: float = time.monotonic() + self.reconcile_interval
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Subreddit counter flush failed")
+            if time.monotonic() >= next_reconcile:
+                next_reconcile = time.monotonic() + self.reconcile_interval
+                try:
+                    await self.reconcile()
+                except Exception:
+                    logger.exception("Subreddit stats reconciliation failed")
+
+    async def start(self) -> None:
+        """
+        Start the background flusher.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """
+        Stop the background flusher and write out whatever is still pending.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+subreddit_counters: SubredditCounters = SubredditCounters()
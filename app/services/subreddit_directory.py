@@ -0,0 +1,230 @@
+import asyncio
+import bisect
+import heapq
+import logging
+import os
+from datetime import datetime
+import msgspec
+from app.dtos.subreddit import SubredditResponseDTO, SubredditSuggestionDTO
+from app.mapping import RowMapper, fetch_mapped
+from app.models.subreddit import Subreddit
+from app.queries import SUBREDDIT_BY_NAME
+from app.services.response_cache import response_cache
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The `response_cache` entry of the encoded subreddit list, which embeds the
+# stats; invalidated whenever they are written or reloaded.
+SUBREDDIT_LIST_CACHE_KEY: str = "subreddits:all"
+
+# Reloads pick up subreddits and post counts written by other workers.
+SUBREDDIT_DIRECTORY_REFRESH_INTERVAL: float = float(
+    os.environ.get("SUBREDDIT_DIRECTORY_REFRESH_INTERVAL", "60")
+)
+
+
+# Builds a subreddit DTO from a `Subreddit` row (a Piccolo dict or an asyncpg record).
+subreddit_from_row: RowMapper[SubredditResponseDTO] = RowMapper(
+    SubredditResponseDTO, {"owner_id": "owner"}
+)
+
+
+class SubredditDirectory:
+    """
+    In-memory map from subreddit name to its ID, metadata and stats.
+
+    Warmed from the database at startup, reloaded every
+    `SUBREDDIT_DIRECTORY_REFRESH_INTERVAL` seconds, and updated when this
+    process creates a subreddit or posts to one. Subreddits created by other
+    workers are picked up lazily by `resolve` on their first lookup.
+
+    It also keeps the names sorted case-insensitively, with each subreddit's
+    post count as its popularity, so name prefixes can be suggested with a
+    binary search instead of a query.
+    """
+
+    def __init__(
+        self, refresh_interval: float = SUBREDDIT_DIRECTORY_REFRESH_INTERVAL
+    ) -> None:
+        """
+        Args:
+            refresh_interval: Seconds between background reloads.
+        """
+        self.refresh_interval: float = refresh_interval
+        self._by_name: dict[str, SubredditResponseDTO] = {}
+        self._names_by_id: dict[int, str] = {}
+        # ``(name.lower(), name)`` pairs, kept sorted for `bisect`.
+        self._sorted_names: list[tuple[str, str]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def warm(self) -> None:
+        """
+        Load every subreddit, with its denormalized stats, into the directory.
+        """
+        subreddits: list[SubredditResponseDTO] = await fetch_mapped(
+            Subreddit.select(), subreddit_from_row
+        )
+        self._by_name = {subreddit.name: subreddit for subreddit in subreddits}
+        self._names_by_id = {subreddit.id: subreddit.name for subreddit in subreddits}
+        self._sorted_names = sorted((name.lower(), name) for name in self._by_name)
+        # The reload may have picked up stats written by other workers.
+        response_cache.invalidate(SUBREDDIT_LIST_CACHE_KEY)
+
+    def get(self, name: str) -> SubredditResponseDTO | None:
+        """
+        Look up a subreddit without touching the database.
+
+        Args:
+            name: The name of the subreddit.
+
+        Returns:
+            SubredditResponseDTO | None: The subreddit, or None if not cached.
+        """
+        return self._by_name.get(name)
+
+    def add(self, subreddit: SubredditResponseDTO) -> None:
+        """
+        Add or replace a subreddit in the directory.
+
+        Args:
+            subreddit: The subreddit to store.
+        """
+        if subreddit.name not in self._by_name:
+            bisect.insort(self._sorted_names, (subreddit.name.lower(), subreddit.name))
+        self._by_name[subreddit.name] = subreddit
+        self._names_by_id[subreddit.id] = subreddit.name
+
+    def record_posts(
+        self,
+        subreddit_id: int,
+        count: int = 1,
+        activity_at: datetime | None = None,
+    ) -> None:
+        """
+        Apply posts created (or, with a negative count, deleted) to a
+        subreddit's stats.
+
+        Args:
+            subreddit_id: The ID of the subreddit.
+            count: The change in the number of posts.
+            activity_at: When the posts were created, if they were.
+        """
+        name: str | None = self._names_by_id.get(subreddit_id)
+        if name is None:
+            return
+        subreddit: SubredditResponseDTO = self._by_name[name]
+        last_activity_at: datetime | None = subreddit.last_activity_at
+        if activity_at is not None and (
+            last_activity_at is None or activity_at > last_activity_at
+        ):
+            last_activity_at = activity_at
+        self._by_name[name] = msgspec.structs.replace(
+            subreddit,
+            post_count=max(0, subreddit.post_count + count),
+            last_activity_at=last_activity_at,
+        )
+
+    def suggest(self, prefix: str, limit: int) -> list[SubredditSuggestionDTO]:
+        """
+        Suggest subreddits whose name starts with a prefix, most popular first.
+
+        Args:
+            prefix: The typed prefix, matched case-insensitively.
+            limit: The maximum number of suggestions.
+
+        Returns:
+            list[SubredditSuggestionDTO]: The matching subreddits.
+        """
+        prefix = prefix.lower()
+        index: int = bisect.bisect_left(self._sorted_names, (prefix,))
+        # Rank plain tuples and build DTOs only for the ones returned.
+        matches: list[tuple[int, str]] = []
+        while index < len(self._sorted_names):
+            key: str
+            name: str
+            key, name = self._sorted_names[index]
+            if not key.startswith(prefix):
+                break
+            index += 1
+            matches.append((self._by_name[name].post_count, name))
+        return [
+            SubredditSuggestionDTO(name=name, post_count=post_count)
+            for post_count, name in heapq.nlargest(limit, matches)
+        ]
+
+    async def resolve(self, name: str) -> SubredditResponseDTO | None:
+        """
+        Look up a subreddit, falling back to the database on a miss.
+
+        Args:
+            name: The name of the subreddit.
+
+        Returns:
+            SubredditResponseDTO | None: The subreddit, or None if it does not exist.
+        """
+        subreddit: SubredditResponseDTO | None = self._by_name.get(name)
+        if subreddit is not None:
+            return subreddit
+
+        subreddit = await SUBREDDIT_BY_NAME.fetchrow(name)
+        if subreddit is not None:
+            self.add(subreddit)
+        return subreddit
+
+    async def resolve_many(self, names: set[str]) -> dict[str, SubredditResponseDTO]:
+        """
+        Look up several subreddits, fetching all directory misses in one query.
+
+        Args:
+            names: The names of the subreddits.
+
+        Returns:
+            dict[str, SubredditResponseDTO]: The subreddits found, by name.
+                Names that do not exist are left out.
+        """
+        found: dict[str, SubredditResponseDTO] = {
+            name: self._by_name[name] for name in names if name in self._by_name
+        }
+        missing: list[str] = [name for name in names if name not in found]
+        if missing:
+            subreddits: list[SubredditResponseDTO] = await fetch_mapped(
+                Subreddit.select().where(Subreddit.name.is_in(missing)),
+                subreddit_from_row,
+            )
+            for subreddit in subreddits:
+                self.add(subreddit)
+                found[subreddit.name] = subreddit
+        return found
+
+    async def _refresh_forever(self) -> None:
+        """
+        Background loop that reloads the directory every `refresh_interval` seconds.
+        """
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.warm()
+            except Exception:
+                logger.exception("Subreddit directory refresh failed")
+
+    async def start(self) -> None:
+        """
+        Start the background reloads; the first load is `warm` at startup.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        """
+        Stop the background reloads.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+subreddit_directory: SubredditDirectory = SubredditDirectory()
@@ -1,7 +1,74 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
+import msgspec
 from litestar.exceptions import ClientException, NotFoundException
+from app.mapping import fetch_mapped
 from app.models.subreddit import Subreddit
-from app.dtos.subreddit import SubredditCreateDTO, SubredditResponseDTO
+from app.models.subscription import Subscription
+from app.dtos.subreddit import (
+    SubredditCreateDTO,
+    SubredditResponseDTO,
+    SubredditSuggestionDTO,
+)
+from app.services.response_cache import CachedResponse, response_cache
+from app.services.streaming import stream_query
+from app.services.subreddit_directory import (
+    SUBREDDIT_LIST_CACHE_KEY,
+    subreddit_directory,
+    subreddit_from_row,
+)
+from app.services.timeline import TIMELINE_BACKFILL_POSTS, timeline_fanout
+
+# Joins a subreddit, counts the new member and, for subreddits that are fanned
+# out, copies its recent posts to the member's timeline, in one statement.
+# Parameters: ``(user_id, subreddit_id, created_at, user_id, subreddit_id,
+# backfill_posts, max_members)``. Returns no row if the user was already a
+# member.
+SUBSCRIBE: str = """
+    WITH joined AS (
+        INSERT INTO subscription ("user", subreddit, created_at)
+        VALUES ({}, {}, {})
+        ON CONFLICT DO NOTHING
+        RETURNING subreddit
+    ), counted AS (
+        UPDATE subreddit SET member_count = subreddit.member_count + 1
+        FROM joined WHERE subreddit.id = joined.subreddit
+        RETURNING subreddit.member_count
+    ), backfilled AS (
+        INSERT INTO timeline_entry ("user", post, subreddit, created_at)
+        SELECT {}::integer, recent.id, recent.subreddit, recent.created_at
+        FROM counted, LATERAL (
+            SELECT id, subreddit, created_at FROM post
+            WHERE post.subreddit = {}
+            ORDER BY created_at DESC, id DESC
+            LIMIT {}
+        ) AS recent
+        WHERE counted.member_count < {}
+        ON CONFLICT DO NOTHING
+    )
+    SELECT member_count FROM counted
+"""
+
+# Leaves a subreddit and clears its posts from the member's timeline.
+# Parameters: ``(user_id, subreddit_id, user_id)``. Returns no row if the user
+# was not a member.
+UNSUBSCRIBE: str = """
+    WITH left_subreddit AS (
+        DELETE FROM subscription
+        WHERE "user" = {} AND subreddit = {}
+        RETURNING subreddit
+    ), counted AS (
+        UPDATE subreddit SET member_count = GREATEST(subreddit.member_count - 1, 0)
+        FROM left_subreddit WHERE subreddit.id = left_subreddit.subreddit
+        RETURNING subreddit.member_count
+    ), cleared AS (
+        DELETE FROM timeline_entry USING left_subreddit
+        WHERE timeline_entry."user" = {}
+            AND timeline_entry.subreddit = left_subreddit.subreddit
+    )
+    SELECT member_count FROM counted
+"""
 
 
 class SubredditService:
@@ -25,6 +92,9 @@ class SubredditService:
         Raises:
             ClientException: If the subreddit name already exists.
         """
+        if subreddit_directory.get(data.name) is not None:
+            raise ClientException(f"Subreddit '{data.name}' already exists")
+
         existing: dict[str, Any] | None = (
             await Subreddit.select().where(Subreddit.name == data.name).first()
         )
@@ -36,13 +106,16 @@ class SubredditService:
         )
         await new_sub.save()
 
-        return SubredditResponseDTO(
+        subreddit: SubredditResponseDTO = SubredditResponseDTO(
             id=new_sub.id,
             name=new_sub.name,
             description=new_sub.description,
             created_at=new_sub.created_at,
             owner_id=new_sub.owner,
         )
+        subreddit_directory.add(subreddit)
+        response_cache.invalidate(SUBREDDIT_LIST_CACHE_KEY)
+        return subreddit
 
     async def get_all(self) -> list[SubredditResponseDTO]:
         """
@@ -51,23 +124,50 @@ class SubredditService:
         Returns:
             list[SubredditResponseDTO]: A list of all subreddits.
         """
-        subreddits: list[dict[str, Any]] = await Subreddit.select().order_by(
-            Subreddit.name
+        return await fetch_mapped(
+            Subreddit.select().order_by(Subreddit.name), subreddit_from_row
+        )
+
+    async def get_all_encoded(self) -> CachedResponse:
+        """
+        Get all subreddits as a pre-encoded JSON body with its ETag.
+
+        Served from `response_cache` so repeated directory loads cost neither a
+        query nor serialization. `create_subreddit`, the subreddit counter
+        flushes and the directory reloads invalidate the entry.
+
+        Returns:
+            CachedResponse: The encoded list of subreddits and its ETag.
+        """
+        cached: CachedResponse | None = response_cache.get(SUBREDDIT_LIST_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        generation: int = response_cache.generation(SUBREDDIT_LIST_CACHE_KEY)
+        subreddits: list[SubredditResponseDTO] = await self.get_all()
+        return response_cache.set(
+            SUBREDDIT_LIST_CACHE_KEY, msgspec.json.encode(subreddits), generation
+        )
+
+    async def stream_all(self, ndjson: bool = False) -> AsyncIterator[bytes]:
+        """
+        Stream every subreddit, ordered by name, from a server-side cursor.
+
+        Args:
+            ndjson: Emit newline-delimited JSON instead of a JSON array.
+
+        Returns:
+            AsyncIterator[bytes]: The encoded response body, chunk by chunk.
+        """
+        return stream_query(
+            Subreddit.select().order_by(Subreddit.name),
+            subreddit_from_row,
+            ndjson=ndjson,
         )
-        return [
-            SubredditResponseDTO(
-                id=sub["id"],
-                name=sub["name"],
-                description=sub["description"],
-                created_at=sub["created_at"],
-                owner_id=sub["owner"],
-            )
-            for sub in subreddits
-        ]
 
     async def get_by_name(self, name: str) -> SubredditResponseDTO:
         """
-        Get a subreddit by name.
+        Get a subreddit by name, served from the in-memory directory when cached.
 
         Args:
             name: The name of the subreddit.
@@ -78,16 +178,93 @@ class SubredditService:
         Raises:
             NotFoundException: If the subreddit does not exist.
         """
-        sub: dict[str, Any] | None = (
-            await Subreddit.select().where(Subreddit.name == name).first()
-        )
-        if not sub:
+        subreddit: SubredditResponseDTO | None = await subreddit_directory.resolve(name)
+        if subreddit is None:
             raise NotFoundException(f"Subreddit '{name}' not found")
 
-        return SubredditResponseDTO(
-            id=sub["id"],
-            name=sub["name"],
-            description=sub["description"],
-            created_at=sub["created_at"],
-            owner_id=sub["owner"],
+        return subreddit
+
+    async def subscribe(self, name: str, user_id: int) -> SubredditResponseDTO:
+        """
+        Join a subreddit, so its posts appear in the user's home feed.
+
+        Joining is idempotent: a user who is already a member is left as is.
+
+        Args:
+            name: The name of the subreddit.
+            user_id: The ID of the user joining.
+
+        Returns:
+            SubredditResponseDTO: The subreddit, with its updated member count.
+
+        Raises:
+            NotFoundException: If the subreddit does not exist.
+        """
+        subreddit: SubredditResponseDTO = await self.get_by_name(name)
+        rows: list[dict[str, int]] = await Subscription.raw(
+            SUBSCRIBE,
+            user_id,
+            subreddit.id,
+            datetime.now(),
+            user_id,
+            subreddit.id,
+            TIMELINE_BACKFILL_POSTS,
+            timeline_fanout.max_members,
+        )
+        return self._set_member_count(subreddit, rows)
+
+    async def unsubscribe(self, name: str, user_id: int) -> SubredditResponseDTO:
+        """
+        Leave a subreddit and remove its posts from the user's home feed.
+
+        Args:
+            name: The name of the subreddit.
+            user_id: The ID of the user leaving.
+
+        Returns:
+            SubredditResponseDTO: The subreddit, with its updated member count.
+
+        Raises:
+            NotFoundException: If the subreddit does not exist.
+        """
+        subreddit: SubredditResponseDTO = await self.get_by_name(name)
+        rows: list[dict[str, int]] = await Subscription.raw(
+            UNSUBSCRIBE, user_id, subreddit.id, user_id
+        )
+        return self._set_member_count(subreddit, rows)
+
+    def _set_member_count(
+        self, subreddit: SubredditResponseDTO, rows: list[dict[str, int]]
+    ) -> SubredditResponseDTO:
+        """
+        Store the member count returned by a (un)subscribe in the directory
+        and drop the cached subreddit list, which shows it.
+
+        Args:
+            subreddit: The subreddit.
+            rows: The statement's result; empty if membership did not change.
+
+        Returns:
+            SubredditResponseDTO: The subreddit with the current member count.
+        """
+        if not rows:
+            return subreddit
+        subreddit = msgspec.structs.replace(
+            subreddit, member_count=rows[0]["member_count"]
         )
+        subreddit_directory.add(subreddit)
+        response_cache.invalidate(SUBREDDIT_LIST_CACHE_KEY)
+        return subreddit
+
+    async def suggest(self, prefix: str, limit: int) -> list[SubredditSuggestionDTO]:
+        """
+        Suggest subreddit names for a typed prefix, served from the in-memory directory.
+
+        Args:
+            prefix: The typed prefix.
+            limit: The maximum number of suggestions.
+
+        Returns:
+            list[SubredditSuggestionDTO]: The matching subreddits, most popular first.
+        """
+        return subreddit_directory.suggest(prefix, limit)
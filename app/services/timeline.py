@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import os
+from datetime import datetime
+from app.models.timeline import TimelineEntry
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Subreddits with at least this many members are not fanned out; their posts
+# are pulled into home feeds at read time instead.
+FEED_FANOUT_MAX_MEMBERS: int = int(os.environ.get("FEED_FANOUT_MAX_MEMBERS", "10000"))
+TIMELINE_FANOUT_INTERVAL: float = float(
+    os.environ.get("TIMELINE_FANOUT_INTERVAL", "0.5")
+)
+# Recent posts copied into a timeline when its owner joins a subreddit.
+TIMELINE_BACKFILL_POSTS: int = int(os.environ.get("TIMELINE_BACKFILL_POSTS", "50"))
+
+# Copies every pending post to the timeline of each member of its subreddit,
+# skipping subreddits at or above the fan-out threshold. Those subreddits are
+# marked as not fanned out in the same statement, so home feeds pull their
+# posts even after they shrink below the threshold.
+FAN_OUT_POSTS: str = """
+    WITH skipped AS (
+        UPDATE subreddit SET fanned_out = FALSE
+        WHERE id = ANY({}::integer[]) AND member_count >= {} AND fanned_out
+    )
+    INSERT INTO timeline_entry ("user", post, subreddit, created_at)
+    SELECT subscription."user", posts.id, posts.subreddit, posts.created_at
+    FROM unnest(
+        {}::integer[], {}::integer[], {}::timestamp[]
+    ) AS posts(id, subreddit, created_at)
+    -- Posts deleted before their fan-out are skipped.
+    JOIN post ON post.id = posts.id
+    JOIN subreddit ON subreddit.id = posts.subreddit
+    JOIN subscription ON subscription.subreddit = posts.subreddit
+    WHERE subreddit.member_count < {}
+    ON CONFLICT DO NOTHING
+"""
+
+
+class TimelineFanout:
+    """
+    Write-behind fan-out of new posts to their subscribers' home timelines.
+
+    Creating a post only queues ``(post_id, subreddit_id, created_at)``. A
+    background task drains the queue every `flush_interval` seconds and
+    writes the timeline entries for the whole batch with one INSERT ...
+    SELECT, so the cost of fan-out is kept off the request that created the
+    post. Subreddits with `FEED_FANOUT_MAX_MEMBERS` or more members are left
+    out and flagged with `Subreddit.fanned_out`; `HomeFeedService` reads
+    their posts directly.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = TIMELINE_FANOUT_INTERVAL,
+        max_members: int = FEED_FANOUT_MAX_MEMBERS,
+    ) -> None:
+        """
+        Args:
+            flush_interval: Seconds between background flushes.
+            max_members: The member count at which a subreddit stops being
+                fanned out.
+        """
+        self.flush_interval: float = flush_interval
+        self.max_members: int = max_members
+        self._pending: list[tuple[int, int, datetime]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def add_post(self, post_id: int, subreddit_id: int, created_at: datetime) -> None:
+        """
+        Queue a new post for fan-out.
+
+        Args:
+            post_id: The ID of the post.
+            subreddit_id: The ID of its subreddit.
+            created_at: When the post was created.
+        """
+        self._pending.append((post_id, subreddit_id, created_at))
+
+    async def flush(self) -> None:
+        """
+        Write the timeline entries for every queued post.
+
+        The queue is swapped out before the INSERT is awaited; if it fails,
+        the drained posts are queued again and retried on the next flush.
+        """
+        pending: list[tuple[int, int, datetime]] = self._pending
+        self._pending = []
+        if not pending:
+            return
+        post_ids: list[int]
+        subreddit_ids: list[int]
+        created_ats: list[datetime]
+        post_ids, subreddit_ids, created_ats = map(list, zip(*pending))
+        try:
+            await TimelineEntry.raw(
+                FAN_OUT_POSTS,
+                subreddit_ids,
+                self.max_members,
+                post_ids,
+                subreddit_ids,
+                created_ats,
+                self.max_members,
+            )
+        except Exception:
+            self._pending = pending + self._pending
+            raise
+
+    async def _flush_forever(self) -> None:
+        """
+        Background loop that flushes the queue every `flush_interval` seconds.
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Timeline fan-out failed")
+
+    async def start(self) -> None:
+        """
+        Start the background flusher.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_forever())
+
+    async def stop(self) -> None:
+        """
+        Stop the background flusher and fan out whatever is still queued.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+timeline_fanout: TimelineFanout = TimelineFanout()
@@ -1,5 +1,8 @@
 from datetime import datetime
 from app.services.auth_service import AuthService
+from app.services.availability import availability_index
+from app.services.principal_cache import principal_cache, to_principal
+from app.services.rate_limiter import rate_limiter
 from app.dtos.auth import UserLoginResponseDTO
 from app.models.user import User
 from app.dtos.user import UserRegisterDTO, UserLoginDTO, UserResponseDTO
@@ -17,79 +20,98 @@ class UserService:
     Service for handling user business logic including creation, authentication, and retrieval.
     """
 
-    async def create_user(self, data: UserRegisterDTO) -> UserResponseDTO:
+    async def create_user(
+        self, data: UserRegisterDTO, client_ip: str
+    ) -> UserResponseDTO:
         """
         Create a new user in the database.
 
         Args:
             data: The registration data.
+            client_ip: The client's IP address, for rate limiting.
 
         Returns:
             UserResponseDTO: The created user's data.
 
         Raises:
+            TooManyRequestsException: If the client is rate limited.
             ClientException: If the username or email already exists.
+            ServiceUnavailableException: If the hashing pool is saturated.
         """
-        existing_user: dict[str, str | int | bool | datetime | None] | None = (
-            await User.select()
-            .where((User.username == data.username) | (User.email == data.email))
-            .first()
+        await rate_limiter.check_register(client_ip)
+
+        hashed_password: str = await auth_service.hash_password_async(data.password)
+
+        # One round trip: the unique constraints on username and email reject
+        # duplicates, with no window between a check and the insert.
+        created: list[dict[str, int | bool]] = (
+            await User.insert(
+                User(
+                    username=data.username,
+                    email=data.email,
+                    password_hash=hashed_password,
+                    avatar_url=data.avatar_url,
+                    bio=data.bio,
+                )
+            )
+            .on_conflict(action="DO NOTHING")
+            .returning(User.id, User.is_active, User.is_verified)
         )
 
-        if existing_user:
+        if not created:
             raise ClientException("Username or email already exists")
+        availability_index.add_user(data.username, data.email)
 
-        hashed_password: str = auth_service.hash_password(data.password)
-
-        new_user: User = User(
+        return UserResponseDTO(
+            id=created[0]["id"],
             username=data.username,
             email=data.email,
-            password_hash=hashed_password,
             avatar_url=data.avatar_url,
             bio=data.bio,
+            is_active=created[0]["is_active"],
+            is_verified=created[0]["is_verified"],
         )
-        await new_user.save()
 
-        return UserResponseDTO(
-            id=new_user.id,
-            username=new_user.username,
-            email=new_user.email,
-            avatar_url=new_user.avatar_url,
-            bio=new_user.bio,
-            is_active=new_user.is_active,
-            is_verified=new_user.is_verified,
-        )
-
-    async def authenticate_user(self, data: UserLoginDTO) -> UserLoginResponseDTO:
+    async def authenticate_user(
+        self, data: UserLoginDTO, client_ip: str
+    ) -> UserLoginResponseDTO:
         """
         Authenticate a user and generate an access token.
 
         Args:
             data: The login credentials.
+            client_ip: The client's IP address, for rate limiting.
 
         Returns:
             UserLoginResponseDTO: The response correctly containing the JWT token.
 
         Raises:
+            TooManyRequestsException: If the client or username is rate limited.
             NotFoundException: If the username is not found.
             PermissionDeniedException: If the password is incorrect.
+            ServiceUnavailableException: If the hashing pool is saturated.
         """
+        await rate_limiter.check_login(client_ip, data.username)
+
         user: dict[str, str | int | bool | datetime | None] | None = (
             await User.select().where(User.username == data.username).first()
         )
         if not user:
             raise NotFoundException("User not found")
 
-        if not auth_service.verify_password(user["password_hash"], data.password):
+        if not await auth_service.verify_password_async(
+            user["password_hash"], data.password
+        ):
             raise PermissionDeniedException("Invalid password")
 
         if auth_service.needs_rehash(user["password_hash"]):
-            new_hash: str = auth_service.hash_password(data.password)
+            new_hash: str = await auth_service.hash_password_async(data.password)
             await User.update({User.password_hash: new_hash}).where(
                 User.id == user["id"]
             )
+            principal_cache.invalidate(user["id"])
 
-        token: str = auth_service.create_token(user["id"])
+        token: str = auth_service.create_token(user["id"], principal=to_principal(user))
 
         user_dto: UserResponseDTO = UserResponseDTO(
             id=user["id"],
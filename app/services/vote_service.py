@@ -0,0 +1,123 @@
+from datetime import datetime
+from asyncpg import Connection
+from asyncpg.exceptions import ForeignKeyViolationError
+from litestar.exceptions import NotFoundException
+from app.db import acquire_connection
+from app.dtos.vote import VoteCreateDTO, VoteResponseDTO
+from app.services.score_counters import score_counters
+
+# Changes an existing vote and returns the value it replaced. The subquery
+# locks the row, so concurrent re-votes by the same user are applied one
+# after the other and each sees the value the previous one wrote.
+UPDATE_VOTE: str = """
+    UPDATE vote SET value = $3
+    FROM (
+        SELECT id, value FROM vote
+        WHERE "user" = $1 AND post = $2
+        FOR UPDATE
+    ) AS previous
+    WHERE vote.id = previous.id
+    RETURNING previous.value
+"""
+
+# Records a user's first vote on a post; returns no row if a concurrent
+# first vote got there first.
+INSERT_VOTE: str = """
+    INSERT INTO vote ("user", post, value, created_at)
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT ("user", post) DO NOTHING
+    RETURNING value
+"""
+
+# Removes a user's vote on a post and returns the value it had.
+DELETE_VOTE: str = """
+    DELETE FROM vote WHERE "user" = $1 AND post = $2
+    RETURNING value
+"""
+
+POST_EXISTS: str = "SELECT EXISTS (SELECT 1 FROM post WHERE id = $1)"
+
+
+class VoteService:
+    """
+    Service for casting votes on posts.
+    """
+
+    async def _upsert_vote(
+        self, connection: Connection, post_id: int, value: int, user_id: int
+    ) -> int | None:
+        """
+        Set a user's vote on a post inside the caller's transaction.
+
+        Args:
+            connection: The connection, inside a transaction.
+            post_id: The ID of the post.
+            value: The vote value (-1 or 1).
+            user_id: The ID of the voting user.
+
+        Returns:
+            int | None: The value the vote had before, or None if it is new.
+
+        Raises:
+            NotFoundException: If the post does not exist.
+        """
+        while True:
+            previous_value: int | None = await connection.fetchval(
+                UPDATE_VOTE, user_id, post_id, value
+            )
+            if previous_value is not None:
+                return previous_value
+            try:
+                inserted: int | None = await connection.fetchval(
+                    INSERT_VOTE, user_id, post_id, value, datetime.now()
+                )
+            except ForeignKeyViolationError:
+                raise NotFoundException("Post not found")
+            if inserted is not None:
+                return None
+            # A concurrent first vote inserted the row after the UPDATE ran;
+            # the next UPDATE sees and locks it.
+
+    async def cast_vote(
+        self, post_id: int, data: VoteCreateDTO, user_id: int
+    ) -> VoteResponseDTO:
+        """
+        Cast, change or retract (value 0) a user's vote on a post.
+
+        The vote row is changed in one transaction that also reads the value
+        it replaces; the resulting score change is handed to the write-behind
+        `score_counters` instead of updating `Post.score` inline.
+
+        Args:
+            post_id: The ID of the post.
+            data: The vote value (-1, 0 or 1).
+            user_id: The ID of the voting user.
+
+        Returns:
+            VoteResponseDTO: The user's vote as now stored.
+
+        Raises:
+            NotFoundException: If the post does not exist.
+        """
+        previous_value: int | None
+        connection: Connection
+        async with acquire_connection() as connection:
+            async with connection.transaction():
+                if data.value == 0:
+                    previous_value = await connection.fetchval(
+                        DELETE_VOTE, user_id, post_id
+                    )
+                    if previous_value is None and not await connection.fetchval(
+                        POST_EXISTS, post_id
+                    ):
+                        raise NotFoundException("Post not found")
+                else:
+                    previous_value = await self._upsert_vote(
+                        connection, post_id, data.value, user_id
+                    )
+
+        delta: int = data.value - (previous_value or 0)
+        if delta:
+            score_counters.add(post_id, delta)
+
+        return VoteResponseDTO(post_id=post_id, value=data.value)
@@ -0,0 +1,622 @@
+"""
+Measure API latency and throughput per endpoint.
+
+Usage:
+    python -m benchmarks.api [--tier inprocess|db] [--requests N]
+        [--concurrency N] [--output FILE]
+    python -m benchmarks.api --tier db --seed [--users N] [--subreddits N] [--posts N]
+
+The in-process tier drives `app.main.app` through httpx's ASGI transport with
+every service mocked, so it measures only routing, middleware, validation and
+serialization. The database tier runs the real services against the database
+configured in piccolo_conf.py, with the app's startup and shutdown hooks.
+`--seed` first fills it with synthetic users, subreddits and posts, all named
+with the `bench_` prefix; it skips seeding if they already exist.
+
+Results are written as JSON: the commit, the settings, and for each scenario
+the p50/p95/p99/max latency in milliseconds and the requests per second. Two
+runs can be diffed to compare commits.
+"""
+
+import argparse
+import asyncio
+import math
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+import msgspec
+from httpx import ASGITransport, AsyncClient
+from msgspec import Struct
+from app.dtos.comment import CommentNodeDTO, CommentTreeDTO
+from app.dtos.post import PostPageDTO, PostResponseDTO, PostSummaryDTO
+from app.dtos.subreddit import SubredditResponseDTO, SubredditSuggestionDTO
+from app.main import app
+from app.services.auth_service import AuthService
+from app.services.comment_service import CommentService
+from app.services.post_service import PostService
+from app.services.search_service import SearchService
+from app.services.subreddit_service import SubredditService
+
+BENCH_PREFIX: str = "bench_"
+SEED_PASSWORD: str = "bench-password"
+SEED_BATCH_SIZE: int = 1000
+SEARCH_WORDS: tuple[str, ...] = ("python", "postgres", "latency", "cache", "index")
+
+
+class Scenario(Struct):
+    """
+    One endpoint to measure. Requests cycle through `paths`.
+    """
+
+    name: str
+    method: str
+    paths: list[str]
+    body: bytes | None = None
+    authenticated: bool = False
+
+
+class ScenarioResult(Struct):
+    name: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    mean_ms: float
+    requests_per_second: float
+
+
+class BenchmarkReport(Struct):
+    tier: str
+    commit: str
+    python: str
+    started_at: datetime
+    requests: int
+    concurrency: int
+    results: list[ScenarioResult]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Get a percentile by the nearest-rank method.
+
+    Args:
+        sorted_values: The samples, in ascending order.
+        fraction: The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        float: The sample at that rank.
+    """
+    rank: int = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(
+    name: str, latencies: list[float], errors: int, elapsed: float
+) -> ScenarioResult:
+    """
+    Reduce raw latencies to the reported statistics.
+
+    Args:
+        name: The scenario name.
+        latencies: The request latencies in seconds.
+        errors: How many responses were not 2xx/3xx.
+        elapsed: The wall-clock time of the measured run in seconds.
+
+    Returns:
+        ScenarioResult: The statistics, in milliseconds.
+    """
+    latencies.sort()
+    return ScenarioResult(
+        name=name,
+        requests=len(latencies),
+        errors=errors,
+        p50_ms=round(percentile(latencies, 0.50) * 1000, 3),
+        p95_ms=round(percentile(latencies, 0.95) * 1000, 3),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 3),
+        max_ms=round(latencies[-1] * 1000, 3),
+        mean_ms=round(sum(latencies) / len(latencies) * 1000, 3),
+        requests_per_second=round(len(latencies) / elapsed, 1),
+    )
+
+
+async def run_scenario(
+    client: AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    headers: dict[str, str],
+) -> ScenarioResult:
+    """
+    Send `requests` requests from `concurrency` concurrent workers.
+
+    A warm-up of a tenth of the requests (at most 200) runs first and is not
+    measured.
+
+    Args:
+        client: The client bound to the app or server.
+        scenario: The endpoint to measure.
+        requests: The number of measured requests.
+        concurrency: The number of concurrent workers.
+        headers: Headers for authenticated scenarios.
+
+    Returns:
+        ScenarioResult: The latency and throughput statistics.
+    """
+    request_headers: dict[str, str] = {"Content-Type": "application/json"}
+    if scenario.authenticated:
+        request_headers.update(headers)
+    paths: list[str] = scenario.paths
+    latencies: list[float] = []
+    errors: int = 0
+    next_index: int = 0
+
+    async def worker(total: int, record: bool) -> None:
+        nonlocal next_index, errors
+        while next_index < total:
+            index: int = next_index
+            next_index += 1
+            started: float = time.perf_counter()
+            response = await client.request(
+                scenario.method,
+                paths[index % len(paths)],
+                content=scenario.body,
+                headers=request_headers,
+            )
+            elapsed: float = time.perf_counter() - started
+            if record:
+                latencies.append(elapsed)
+                if response.status_code >= 400:
+                    errors += 1
+
+    await asyncio.gather(
+        *(worker(min(200, requests // 10), False) for _ in range(concurrency))
+    )
+    next_index = 0
+    started: float = time.perf_counter()
+    await asyncio.gather(*(worker(requests, True) for _ in range(concurrency)))
+    return summarize(scenario.name, latencies, errors, time.perf_counter() - started)
+
+
+def git_commit() -> str:
+    """
+    Returns:
+        str: The current commit hash, with "-dirty" if the tree has changes.
+    """
+    try:
+        commit: str = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty: str = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def token_headers(user_id: int) -> dict[str, str]:
+    """
+    Args:
+        user_id: The user to authenticate as.
+
+    Returns:
+        dict[str, str]: An Authorization header with a fresh access token.
+    """
+    return {"Authorization": f"Bearer {AuthService().create_token(user_id)}"}
+
+
+# In-process tier
+
+
+def fixture_services() -> dict[str, Any]:
+    """
+    Build mocked services that return fixed, realistically sized responses.
+
+    Returns:
+        dict[str, Any]: The mocks, keyed by the controller provider they replace.
+    """
+    now: datetime = datetime.now(timezone.utc)
+    post: PostResponseDTO = PostResponseDTO(
+        id=1,
+        title="A benchmark post title of typical length",
+        content="Body text. " * 40,
+        url=None,
+        created_at=now,
+        author_id=1,
+        subreddit_id=1,
+        score=42,
+    )
+    page: PostPageDTO = PostPageDTO(
+        items=[
+            PostSummaryDTO(
+                id=index,
+                title=f"Post number {index} in the benchmark subreddit",
+                url=None,
+                created_at=now,
+                author_id=1,
+                subreddit_id=1,
+                preview="Body text. " * 18,
+                score=index,
+            )
+            for index in range(25, 0, -1)
+        ],
+        next_cursor="MjAyNi0wMS0wMVQwMDowMDowMHwx",
+    )
+    subreddit: SubredditResponseDTO = SubredditResponseDTO(
+        id=1, name="bench", description="Benchmarks", created_at=now, owner_id=1
+    )
+
+    def node(index: int, depth: int) -> CommentNodeDTO:
+        return CommentNodeDTO(
+            id=index,
+            content="A comment of typical length. " * 4,
+            author_id=1,
+            parent_id=None,
+            depth=depth,
+            reply_count=3 if depth < 2 else 0,
+            created_at=now,
+            replies=(
+                [node(index * 10 + child, depth + 1) for child in range(3)]
+                if depth < 2
+                else []
+            ),
+        )
+
+    post_service: AsyncMock = AsyncMock(spec=PostService)
+    post_service.get_post.return_value = post
+    post_service.create_post.return_value = post
+    post_service.get_posts_by_subreddit.return_value = page
+    post_service.get_feed.return_value = page
+
+    subreddit_service: AsyncMock = AsyncMock(spec=SubredditService)
+    subreddit_service.get_by_name.return_value = subreddit
+    subreddit_service.suggest.return_value = [
+        SubredditSuggestionDTO(name=f"bench{index}", post_count=100 - index)
+        for index in range(10)
+    ]
+
+    comment_service: AsyncMock = AsyncMock(spec=CommentService)
+    comment_service.get_comment_tree.return_value = CommentTreeDTO(
+        items=[node(index, 0) for index in range(1, 11)]
+    )
+
+    search_service: AsyncMock = AsyncMock(spec=SearchService)
+    search_service.search_posts.return_value = page
+
+    return {
+        "app.controllers.post.provide_post_service": post_service,
+        "app.controllers.subreddit.provide_subreddit_service": subreddit_service,
+        "app.controllers.comment.provide_comment_service": comment_service,
+        "app.controllers.search.provide_search_service": search_service,
+    }
+
+
+@contextmanager
+def mocked_services() -> Iterator[None]:
+    """
+    Patch every service used by the in-process scenarios, and the principal
+    lookup in the authentication middleware.
+    """
+    principal_query: MagicMock = MagicMock()
+    principal_query.fetchrow = AsyncMock(
+        return_value={
+            "id": 1,
+            "username": "bench",
+            "email": "bench@example.com",
+            "is_active": True,
+            "is_verified": True,
+            "avatar_url": None,
+            "bio": None,
+        }
+    )
+    with ExitStack() as stack:
+        for target, service in fixture_services().items():
+            stack.enter_context(patch(target, return_value=service))
+        stack.enter_context(
+            patch("app.middleware.auth.PRINCIPAL_BY_ID", principal_query)
+        )
+        yield
+
+
+IN_PROCESS_SCENARIOS: list[Scenario] = [
+    Scenario("get_post", "GET", ["/api/posts/1"]),
+    Scenario("list_posts", "GET", ["/api/r/bench/posts"]),
+    Scenario("feed", "GET", ["/api/posts/feed"]),
+    Scenario("get_subreddit", "GET", ["/api/subreddits/bench"]),
+    Scenario("suggest_subreddits", "GET", ["/api/subreddits/suggest?prefix=be"]),
+    Scenario("search_posts", "GET", ["/api/search/posts?q=bench"]),
+    Scenario("get_comments", "GET", ["/api/posts/1/comments"]),
+    Scenario("get_me", "GET", ["/api/users/me"], authenticated=True),
+    Scenario(
+        "create_post",
+        "POST",
+        ["/api/r/bench/posts"],
+        body=msgspec.json.encode(
+            {"title": "Benchmark", "subreddit_name": "bench", "content": "Body"}
+        ),
+        authenticated=True,
+    ),
+]
+
+
+async def run_in_process(requests: int, concurrency: int) -> list[ScenarioResult]:
+    """
+    Run the in-process scenarios against the app with mocked services.
+
+    Args:
+        requests: The number of measured requests per scenario.
+        concurrency: The number of concurrent workers.
+
+    Returns:
+        list[ScenarioResult]: One result per scenario.
+    """
+    results: list[ScenarioResult] = []
+    with mocked_services():
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            for scenario in IN_PROCESS_SCENARIOS:
+                results.append(
+                    await run_scenario(
+                        client, scenario, requests, concurrency, token_headers(1)
+                    )
+                )
+    return results
+
+
+# Database tier
+
+
+async def seed(users: int, subreddits: int, posts: int) -> None:
+    """
+    Insert synthetic users, subreddits and posts, unless already seeded.
+
+    Args:
+        users: The number of users.
+        subreddits: The number of subreddits.
+        posts: The number of posts, spread evenly over subreddits and users.
+    """
+    from app.models.post import PREVIEW_LENGTH, Post
+    from app.models.subreddit import Subreddit
+    from app.models.user import User
+
+    if await User.exists().where(User.username == f"{BENCH_PREFIX}user_0"):
+        print("Already seeded, skipping", file=sys.stderr)
+        return
+
+    password_hash: str = AuthService().hash_password(SEED_PASSWORD)
+    await User.insert(
+        *(
+            User(
+                username=f"{BENCH_PREFIX}user_{index}",
+                email=f"{BENCH_PREFIX}user_{index}@example.com",
+                password_hash=password_hash,
+                is_verified=True,
+            )
+            for index in range(users)
+        )
+    )
+    user_ids: list[int] = (
+        await User.select(User.id)
+        .where(User.username.like(f"{BENCH_PREFIX}user_%"))
+        .output(as_list=True)
+    )
+
+    await Subreddit.insert(
+        *(
+            Subreddit(
+                name=f"{BENCH_PREFIX}{index}",
+                description=f"Benchmark subreddit {index}",
+                owner=user_ids[index % len(user_ids)],
+            )
+            for index in range(subreddits)
+        )
+    )
+    subreddit_ids: list[int] = (
+        await Subreddit.select(Subreddit.id)
+        .where(Subreddit.name.like(f"{BENCH_PREFIX}%"))
+        .output(as_list=True)
+    )
+
+    for start in range(0, posts, SEED_BATCH_SIZE):
+        batch: list[Post] = []
+        for index in range(start, min(start + SEED_BATCH_SIZE, posts)):
+            content: str = (
+                f"Post {index} about {SEARCH_WORDS[index % len(SEARCH_WORDS)]}. " * 20
+            )
+            batch.append(
+                Post(
+                    title=f"{BENCH_PREFIX}post {index} "
+                    f"{SEARCH_WORDS[(index + 1) % len(SEARCH_WORDS)]}",
+                    content=content,
+                    preview=content[:PREVIEW_LENGTH],
+                    author=user_ids[index % len(user_ids)],
+                    subreddit=subreddit_ids[index % len(subreddit_ids)],
+                    score=index % 100,
+                )
+            )
+        await Post.insert(*batch)
+    print(
+        f"Seeded {users} users, {subreddits} subreddits and {posts} posts",
+        file=sys.stderr,
+    )
+
+
+async def database_scenarios() -> tuple[list[Scenario], dict[str, str]]:
+    """
+    Build the database scenarios from the seeded data.
+
+    Returns:
+        tuple[list[Scenario], dict[str, str]]: The scenarios, and the auth
+        headers of a seeded user.
+    """
+    from app.models.post import Post
+    from app.models.subreddit import Subreddit
+    from app.models.user import User
+
+    post_ids: list[int] = (
+        await Post.select(Post.id)
+        .where(Post.title.like(f"{BENCH_PREFIX}%"))
+        .limit(1000)
+        .output(as_list=True)
+    )
+    subreddit_names: list[str] = (
+        await Subreddit.select(Subreddit.name)
+        .where(Subreddit.name.like(f"{BENCH_PREFIX}%"))
+        .output(as_list=True)
+    )
+    users: list[dict[str, Any]] = (
+        await User.select(User.id, User.username)
+        .where(User.username.like(f"{BENCH_PREFIX}user_%"))
+        .limit(1000)
+    )
+    if not post_ids or not subreddit_names or not users:
+        raise SystemExit("No benchmark data found, run with --seed first")
+
+    scenarios: list[Scenario] = [
+        Scenario("get_post", "GET", [f"/api/posts/{id}" for id in post_ids]),
+        Scenario(
+            "list_posts", "GET", [f"/api/r/{name}/posts" for name in subreddit_names]
+        ),
+        Scenario(
+            "feed",
+            "GET",
+            [
+                "/api/posts/feed?sort=hot",
+                "/api/posts/feed?sort=new",
+                "/api/posts/feed?sort=top",
+            ],
+        ),
+        Scenario(
+            "get_subreddit",
+            "GET",
+            [f"/api/subreddits/{name}" for name in subreddit_names],
+        ),
+        Scenario(
+            "get_user", "GET", [f"/api/users/{user['username']}" for user in users]
+        ),
+        Scenario(
+            "search_posts",
+            "GET",
+            [f"/api/search/posts?q={word}" for word in SEARCH_WORDS],
+        ),
+        Scenario(
+            "get_comments",
+            "GET",
+            [f"/api/posts/{id}/comments" for id in post_ids],
+        ),
+        Scenario("get_me", "GET", ["/api/users/me"], authenticated=True),
+        Scenario(
+            "create_post",
+            "POST",
+            [f"/api/r/{subreddit_names[0]}/posts"],
+            body=msgspec.json.encode(
+                {
+                    "title": f"{BENCH_PREFIX}created",
+                    "subreddit_name": subreddit_names[0],
+                    "content": "Created by the benchmark",
+                }
+            ),
+            authenticated=True,
+        ),
+    ]
+    return scenarios, token_headers(users[0]["id"])
+
+
+@asynccontextmanager
+async def running_app() -> AsyncIterator[AsyncClient]:
+    """
+    Run the app's startup and shutdown hooks around a client bound to it.
+
+    Yields:
+        AsyncClient: The client.
+    """
+    async with app.lifespan():
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            yield client
+
+
+async def run_database(
+    requests: int, concurrency: int, seed_sizes: tuple[int, int, int] | None
+) -> list[ScenarioResult]:
+    """
+    Run the database scenarios against the configured database.
+
+    Args:
+        requests: The number of measured requests per scenario.
+        concurrency: The number of concurrent workers.
+        seed_sizes: Users, subreddits and posts to seed first, if any.
+
+    Returns:
+        list[ScenarioResult]: One result per scenario.
+    """
+    async with running_app() as client:
+        if seed_sizes is not None:
+            await seed(*seed_sizes)
+        scenarios, headers = await database_scenarios()
+        return [
+            await run_scenario(client, scenario, requests, concurrency, headers)
+            for scenario in scenarios
+        ]
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--tier", choices=("inprocess", "db"), default="inprocess")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--output", help="Write the JSON report here, not stdout")
+    parser.add_argument("--seed", action="store_true")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--subreddits", type=int, default=100)
+    parser.add_argument("--posts", type=int, default=100_000)
+    args: argparse.Namespace = parser.parse_args()
+
+    started_at: datetime = datetime.now(timezone.utc)
+    if args.tier == "inprocess":
+        results: list[ScenarioResult] = asyncio.run(
+            run_in_process(args.requests, args.concurrency)
+        )
+    else:
+        results = asyncio.run(
+            run_database(
+                args.requests,
+                args.concurrency,
+                (args.users, args.subreddits, args.posts) if args.seed else None,
+            )
+        )
+
+    report: BenchmarkReport = BenchmarkReport(
+        tier=args.tier,
+        commit=git_commit(),
+        python=platform.python_version(),
+        started_at=started_at,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        results=results,
+    )
+    encoded: bytes = msgspec.json.format(msgspec.json.encode(report))
+    if args.output:
+        with open(args.output, "wb") as output:
+            output.write(encoded + b"\n")
+    else:
+        sys.stdout.buffer.write(encoded + b"\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Measure time to first successful request for a freshly started server.
+
+Usage:
+    python -m benchmarks.cold_start [--runs N] [--fast] [--path PATH]
+        [--server "granian --interface asgi app.main:app"] [--output FILE]
+
+Each run starts the server as a new process, polls PATH until it answers
+2xx, then reads the worker's startup breakdown from /api/health/startup and
+stops the server. `--fast` sets FAST_START=true (run `make openapi` first so
+the pre-generated schema is served). Results are written as JSON.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Any
+
+DEFAULT_SERVER: str = "granian --interface asgi --port {port} app.main:app"
+POLL_INTERVAL: float = 0.01
+TIMEOUT: float = 60.0
+
+
+def get_json(url: str) -> tuple[int, Any]:
+    """
+    Fetch a URL.
+
+    Args:
+        url: The URL.
+
+    Returns:
+        tuple[int, Any]: The status code and the decoded JSON body (None if
+        the body is not JSON).
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            body: bytes = response.read()
+            status: int = response.status
+    except urllib.error.HTTPError as error:
+        return error.code, None
+    try:
+        return status, json.loads(body)
+    except ValueError:
+        return status, None
+
+
+def run_once(server: str, port: int, path: str, fast: bool) -> dict[str, Any]:
+    """
+    Start the server, wait for its first successful response, then stop it.
+
+    Args:
+        server: The server command, with a ``{port}`` placeholder.
+        port: The port to listen on.
+        path: The path to poll.
+        fast: Whether to start in FAST_START mode.
+
+    Returns:
+        dict[str, Any]: The time to first response and the startup breakdown.
+    """
+    env: dict[str, str] = {**os.environ, "FAST_START": "true" if fast else "false"}
+    started: float = time.perf_counter()
+    process: subprocess.Popen = subprocess.Popen(
+        shlex.split(server.format(port=port)),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            if process.poll() is not None:
+                raise SystemExit(f"Server exited with code {process.returncode}")
+            if time.perf_counter() - started > TIMEOUT:
+                raise SystemExit(f"No successful response within {TIMEOUT}s")
+            try:
+                status, _ = get_json(f"http://127.0.0.1:{port}{path}")
+            except OSError:
+                status = 0
+            if 200 <= status < 300:
+                break
+            time.sleep(POLL_INTERVAL)
+        first_response_ms: float = (time.perf_counter() - started) * 1000
+        _, startup = get_json(f"http://127.0.0.1:{port}/api/health/startup")
+    finally:
+        process.terminate()
+        process.wait()
+    return {"first_response_ms": round(first_response_ms, 1), "startup": startup}
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--fast", action="store_true")
+    parser.add_argument("--path", default="/api/health/hashing")
+    parser.add_argument("--server", default=DEFAULT_SERVER)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="Write the JSON report here, not stdout")
+    args: argparse.Namespace = parser.parse_args()
+
+    runs: list[dict[str, Any]] = [
+        run_once(args.server, args.port, args.path, args.fast) for _ in range(args.runs)
+    ]
+    times: list[float] = sorted(run["first_response_ms"] for run in runs)
+    report: dict[str, Any] = {
+        "fast_start": args.fast,
+        "server": args.server,
+        "median_first_response_ms": times[len(times) // 2],
+        "runs": runs,
+    }
+    encoded: str = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(encoded + "\n")
+    else:
+        sys.stdout.write(encoded + "\n")
+
+
+if __name__ == "__main__":
+    main()
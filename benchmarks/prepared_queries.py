@@ -0,0 +1,164 @@
+"""
+Compare the Piccolo query path with the prepared-statement path in `app.queries`.
+
+Usage:
+    python -m benchmarks.prepared_queries [--iterations N] [--offline]
+
+With a database configured (see piccolo_conf.py) it times full round trips
+for a post, a user and a subreddit page. `--offline` needs no database and
+times only the Python-side work: building and compiling the Piccolo query,
+and mapping a row into the DTO by name versus by position.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from collections.abc import Awaitable, Callable
+from typing import Any
+from app.db import compile_query, get_engine
+from app.dtos.post import PostResponseDTO
+from app.models.post import Post
+from app.models.user import User
+from app.queries import POST_BY_ID, POSTS_BY_SUBREDDIT, USER_BY_USERNAME
+from app.services.post_service import SUMMARY_COLUMNS, post_from_row
+
+
+def report(name: str, seconds: float, iterations: int) -> None:
+    """
+    Print the mean time per iteration.
+
+    Args:
+        name: The label of the measured path.
+        seconds: The total elapsed time.
+        iterations: The number of iterations run.
+    """
+    print(f"{name:<40} {seconds / iterations * 1_000_000:>10.1f} us/op")
+
+
+async def time_async(
+    name: str, operation: Callable[[], Awaitable[Any]], iterations: int
+) -> None:
+    """
+    Time an async operation, after a short warm-up.
+
+    Args:
+        name: The label of the measured path.
+        operation: The operation to run.
+        iterations: The number of iterations.
+    """
+    for _ in range(min(iterations, 50)):
+        await operation()
+    started: float = time.perf_counter()
+    for _ in range(iterations):
+        await operation()
+    report(name, time.perf_counter() - started, iterations)
+
+
+def run_offline(iterations: int) -> None:
+    """
+    Time the per-request work the prepared path avoids: building and compiling
+    the query, and mapping a row through a dict into the DTO.
+
+    Args:
+        iterations: The number of iterations.
+    """
+    started: float = time.perf_counter()
+    for post_id in range(iterations):
+        compile_query(Post.select().where(Post.id == post_id).first())
+    report(
+        "piccolo: build + compile post by id", time.perf_counter() - started, iterations
+    )
+
+    values: tuple[Any, ...] = (1, "title", "content", None, datetime.now(), 1, 1, 0)
+    row: dict[str, Any] = dict(
+        zip(
+            (
+                "id",
+                "title",
+                "content",
+                "url",
+                "created_at",
+                "author",
+                "subreddit",
+                "score",
+            ),
+            values,
+        )
+    )
+    started = time.perf_counter()
+    for _ in range(iterations):
+        post_from_row(row)
+    report("piccolo: map dict to DTO", time.perf_counter() - started, iterations)
+
+    decode: Callable[[Any], PostResponseDTO] = POST_BY_ID.decode
+    started = time.perf_counter()
+    for _ in range(iterations):
+        decode(values)
+    report("prepared: map record to DTO", time.perf_counter() - started, iterations)
+
+
+async def run_online(iterations: int) -> None:
+    """
+    Time full round trips against the configured database.
+
+    Args:
+        iterations: The number of iterations.
+    """
+    engine = get_engine()
+    await engine.start_connection_pool()
+    try:
+        post: dict[str, Any] | None = await Post.select(Post.id, Post.subreddit).first()
+        user: dict[str, Any] | None = await User.select(User.username).first()
+        if post is None or user is None:
+            raise SystemExit("Seed at least one user and one post first")
+
+        async def piccolo_post() -> None:
+            row = await Post.select().where(Post.id == post["id"]).first()
+            post_from_row(row)
+
+        async def piccolo_user() -> None:
+            await User.select().where(User.username == user["username"]).first()
+
+        async def piccolo_page() -> None:
+            await (
+                Post.select(*SUMMARY_COLUMNS)
+                .where(Post.subreddit == post["subreddit"])
+                .order_by(Post.created_at, Post.id, ascending=False)
+                .limit(26)
+            )
+
+        await time_async("piccolo: post by id", piccolo_post, iterations)
+        await time_async(
+            "prepared: post by id", lambda: POST_BY_ID.fetchrow(post["id"]), iterations
+        )
+        await time_async("piccolo: user by username", piccolo_user, iterations)
+        await time_async(
+            "prepared: user by username",
+            lambda: USER_BY_USERNAME.fetchrow(user["username"]),
+            iterations,
+        )
+        await time_async("piccolo: subreddit page", piccolo_page, iterations)
+        await time_async(
+            "prepared: subreddit page",
+            lambda: POSTS_BY_SUBREDDIT.fetch(post["subreddit"], 26),
+            iterations,
+        )
+    finally:
+        await engine.close_connection_pool()
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--offline", action="store_true")
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.offline:
+        run_offline(args.iterations)
+    else:
+        asyncio.run(run_online(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Compare ways of turning database rows into response structs.
+
+Usage:
+    python -m benchmarks.row_mapping [--rows N] [--repeat N]
+
+Maps N post summary rows (10k by default) to `PostSummaryDTO` four ways:
+
+- piccolo + kwargs: a dict per row, as Piccolo returns them, then a
+  hand-written constructor call with keyword arguments (the old mappers).
+- piccolo + RowMapper: the same dicts, mapped by `app.mapping.RowMapper`.
+- records + RowMapper: rows mapped as fetched by `fetch_records`, with no dict
+  per row. asyncpg records cannot be built without a connection, so
+  pre-built mappings stand in for them and their construction is not timed.
+- positional: `PreparedQuery`'s `positional` decoder on value tuples.
+
+For each path it prints the best time over `--repeat` runs and the peak
+memory allocated while mapping, result list included. Nearly all of the
+saving comes from not building a dict per row; on rows that already exist,
+`RowMapper` costs about the same as the hand-written call.
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import Any
+from app.db import positional
+from app.dtos.post import PostSummaryDTO
+from app.services.post_service import post_summary_from_row
+
+COLUMNS: tuple[str, ...] = (
+    "id",
+    "title",
+    "url",
+    "created_at",
+    "author",
+    "subreddit",
+    "preview",
+    "score",
+)
+
+
+def kwargs_from_row(row: Mapping[str, Any]) -> PostSummaryDTO:
+    """
+    The hand-written mapper `RowMapper` replaced.
+
+    Args:
+        row: The post row.
+
+    Returns:
+        PostSummaryDTO: The post summary.
+    """
+    return PostSummaryDTO(
+        id=row["id"],
+        title=row["title"],
+        url=row["url"],
+        created_at=row["created_at"],
+        author_id=row["author"],
+        subreddit_id=row["subreddit"],
+        preview=row["preview"],
+        score=row["score"],
+    )
+
+
+def measure(
+    name: str, operation: Callable[[], list[PostSummaryDTO]], repeat: int
+) -> None:
+    """
+    Print the best time and the peak allocation of a mapping path.
+
+    Args:
+        name: The label of the path.
+        operation: Maps every row and returns the structs.
+        repeat: The number of timed runs.
+    """
+    best: float = float("inf")
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<24} {best * 1000:>9.2f} ms {peak / 1024:>10.0f} KiB peak")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args: argparse.Namespace = parser.parse_args()
+
+    now: datetime = datetime.now()
+    values: list[tuple[Any, ...]] = [
+        (index, f"Post {index}", None, now, 1, 1, "Preview text. " * 10, index)
+        for index in range(args.rows)
+    ]
+    records: list[dict[str, Any]] = [dict(zip(COLUMNS, row)) for row in values]
+    decode: Callable[[tuple[Any, ...]], PostSummaryDTO] = positional(PostSummaryDTO)
+
+    def piccolo_rows() -> list[dict[str, Any]]:
+        # Piccolo materialises the whole result as dicts before returning it.
+        return [dict(zip(COLUMNS, row)) for row in values]
+
+    print(f"Mapping {args.rows} rows to PostSummaryDTO")
+    measure(
+        "piccolo + kwargs",
+        lambda: [kwargs_from_row(row) for row in piccolo_rows()],
+        args.repeat,
+    )
+    measure(
+        "piccolo + RowMapper",
+        lambda: post_summary_from_row.many(piccolo_rows()),
+        args.repeat,
+    )
+    measure(
+        "records + RowMapper",
+        lambda: post_summary_from_row.many(records),
+        args.repeat,
+    )
+    measure("positional", lambda: [decode(row) for row in values], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from piccolo.conf.apps import AppRegistry
-from piccolo.engine.postgres import PostgresEngine
+from app.db import InstrumentedPostgresEngine
 import os
 
 DB_HOST = os.environ.get("DB_HOST", "localhost")
@@ -8,15 +8,40 @@ DB_NAME = os.environ.get("DB_NAME", "reddit_clone")
 DB_USER = os.environ.get("DB_USER", "postgres_user")
 DB_PASSWORD = os.environ.get("DB_PASSWORD", "postgres_password")
 
-# Using PostgresEngine with asyncpg
-DB = PostgresEngine(
+# Read-only replicas, as a comma-separated list of host[:port]. They share the
+# primary's credentials and database name.
+DB_REPLICA_HOSTS = [
+    host.strip()
+    for host in os.environ.get("DB_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+
+
+def replica_config(address: str) -> dict:
+    host, _, port = address.partition(":")
+    return {
+        "host": host,
+        "database": DB_NAME,
+        "user": DB_USER,
+        "password": DB_PASSWORD,
+        "port": int(port or DB_PORT),
+    }
+
+
+# Using PostgresEngine with asyncpg; pool sizing comes from the DB_POOL_*
+# settings in app/db.py. GET requests read from healthy replicas.
+DB = InstrumentedPostgresEngine(
     config={
         "host": DB_HOST,
         "database": DB_NAME,
         "user": DB_USER,
         "password": DB_PASSWORD,
         "port": int(DB_PORT),
-    }
+    },
+    extra_nodes={
+        f"replica_{index}": InstrumentedPostgresEngine(config=replica_config(address))
+        for index, address in enumerate(DB_REPLICA_HOSTS)
+    },
 )
 
 APP_REGISTRY = AppRegistry(apps=["app.piccolo_app"])
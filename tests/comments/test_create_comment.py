@@ -0,0 +1,47 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from app.services.comment_service import CommentService
+from app.dtos.comment import CommentCreateDTO, CommentResponseDTO
+
+class CommentResponseDTOFactory(MsgspecFactory[CommentResponseDTO]):
+    pass
+
+@pytest.mark.asyncio
+async def test_create_comment(client, mocker, mock_auth):
+    # Mock
+    mock_service_instance = AsyncMock(spec=CommentService)
+    expected_response = CommentResponseDTOFactory.build(
+        content="Nice post", post_id=7, parent_id=3
+    )
+    mock_service_instance.create_comment.return_value = expected_response
+
+    mocker.patch("app.controllers.comment.provide_comment_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.post(
+        "/api/posts/7/comments",
+        json={"content": "Nice post", "parent_id": 3},
+        headers={"Authorization": "Bearer valid_token"},
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    data = response.json()
+    assert data["content"] == "Nice post"
+    assert data["parent_id"] == 3
+
+    mock_service_instance.create_comment.assert_called_once_with(
+        7, CommentCreateDTO(content="Nice post", parent_id=3), author_id=1
+    )
+
+@pytest.mark.asyncio
+async def test_create_comment_unauthenticated(client, mocker):
+    mock_service_instance = AsyncMock(spec=CommentService)
+
+    mocker.patch("app.controllers.comment.provide_comment_service", return_value=mock_service_instance)
+
+    response = await client.post("/api/posts/7/comments", json={"content": "Nice post"})
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    mock_service_instance.create_comment.assert_not_called()
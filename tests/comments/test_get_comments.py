@@ -0,0 +1,76 @@
+import pytest
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from litestar.exceptions import NotFoundException
+from app.services.comment_service import CommentService, build_comment_tree
+from app.dtos.comment import CommentNodeDTO, CommentTreeDTO
+
+def make_row(comment_id, parent_id, path, depth):
+    return {
+        "id": comment_id,
+        "content": f"comment {comment_id}",
+        "author": 1,
+        "parent": parent_id,
+        "path": path,
+        "depth": depth,
+        "reply_count": 0,
+        "created_at": datetime(2026, 2, 1),
+    }
+
+@pytest.mark.asyncio
+async def test_get_comments(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=CommentService)
+    reply = CommentNodeDTO(
+        id=2, content="reply", author_id=1, parent_id=1, depth=1,
+        reply_count=0, created_at=datetime(2026, 2, 1),
+    )
+    root = CommentNodeDTO(
+        id=1, content="root", author_id=1, parent_id=None, depth=0,
+        reply_count=1, created_at=datetime(2026, 2, 1), replies=[reply],
+    )
+    mock_service_instance.get_comment_tree.return_value = CommentTreeDTO(
+        items=[root], next_cursor="next"
+    )
+
+    mocker.patch("app.controllers.comment.provide_comment_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/posts/7/comments?depth=2&parent_id=5")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["items"][0]["replies"][0]["content"] == "reply"
+    assert data["next_cursor"] == "next"
+
+    mock_service_instance.get_comment_tree.assert_called_once_with(
+        7, depth=2, limit=200, cursor=None, parent_id=5
+    )
+
+@pytest.mark.asyncio
+async def test_get_comments_post_not_found(client, mocker):
+    mock_service_instance = AsyncMock(spec=CommentService)
+    mock_service_instance.get_comment_tree.side_effect = NotFoundException("Post not found")
+
+    mocker.patch("app.controllers.comment.provide_comment_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/posts/999/comments")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+def test_build_comment_tree():
+    rows = [
+        make_row(1, None, "0000000001", 0),
+        make_row(3, 1, "0000000001/0000000003", 1),
+        make_row(4, 3, "0000000001/0000000003/0000000004", 2),
+        make_row(2, None, "0000000002", 0),
+        # Parent is on an earlier page: returned as a root.
+        make_row(9, 8, "0000000008/0000000009", 1),
+    ]
+
+    roots = build_comment_tree(rows)
+
+    assert [node.id for node in roots] == [1, 2, 9]
+    assert [node.id for node in roots[0].replies] == [3]
+    assert [node.id for node in roots[0].replies[0].replies] == [4]
+    assert roots[1].replies == []
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, AsyncMock
 from httpx import AsyncClient, ASGITransport
 from litestar import Litestar
 from app.main import app
+from app.services.principal_cache import principal_cache
 
 
 from typing import Iterator
@@ -43,13 +44,16 @@ def mock_auth(mocker):
     Fixture to mock authentication middleware dependencies.
     Bypasses DB lookup and Token decoding.
     Returns:
-        MagicMock: The mocked User ORM object to allow customization if needed.
+        MagicMock: The mocked principal query to allow customization if needed.
     """
-    # Mock User ORM in middleware
-    mock_user_orm = MagicMock()
-    mock_query = AsyncMock()
+    # Start from an empty principal cache so the mocked lookup is used
+    principal_cache.clear()
+
+    # Mock the principal lookup in middleware
+    mock_principal_query = MagicMock()
+    mock_principal_query.fetchrow = AsyncMock()
     # Default user found
-    mock_query.first.return_value = {
+    mock_principal_query.fetchrow.return_value = {
         "id": 1, 
         "username": "testuser", 
         "email": "test@example.com", 
@@ -58,9 +62,8 @@ def mock_auth(mocker):
         "avatar_url": None,
         "bio": None
     }
-    mock_user_orm.select.return_value.where.return_value = mock_query
     
-    mocker.patch("app.middleware.auth.User", mock_user_orm)
+    mocker.patch("app.middleware.auth.PRINCIPAL_BY_ID", mock_principal_query)
     mocker.patch("app.middleware.auth.AuthService.decode_token", return_value=1)
     
-    return mock_user_orm
\ No newline at end of file
+    return mock_principal_query
\ No newline at end of file
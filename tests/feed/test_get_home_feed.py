@@ -0,0 +1,83 @@
+import pytest
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+from app.dtos.post import PostSummaryDTO
+from app.services.home_feed_service import FEED_START
+from app.services.pagination import encode_cursor
+from app.services.timeline import FAN_OUT_POSTS, TimelineFanout
+
+def make_post(post_id, subreddit_id, minutes_ago):
+    return PostSummaryDTO(
+        id=post_id, title=f"Post {post_id}", url=None,
+        created_at=datetime(2026, 2, 26, 12, 0) - timedelta(minutes=minutes_ago),
+        author_id=1, subreddit_id=subreddit_id, preview=None, score=0,
+    )
+
+@pytest.mark.asyncio
+async def test_get_home_feed_merges_timeline_and_pulled_posts(client, mocker, mock_auth):
+    # Mock
+    mock_timeline = MagicMock()
+    mock_timeline.fetch = AsyncMock(
+        return_value=[make_post(10, 1, 1), make_post(7, 2, 5), make_post(3, 1, 30)]
+    )
+    mock_pulled = MagicMock()
+    # Grouped by subreddit, newest first within each; post 7 was also fanned
+    # out before its subreddit grew past the threshold
+    mock_pulled.fetch = AsyncMock(
+        return_value=[make_post(9, 2, 2), make_post(7, 2, 5), make_post(8, 5, 3)]
+    )
+    mocker.patch("app.services.home_feed_service.HOME_TIMELINE", mock_timeline)
+    mocker.patch("app.services.home_feed_service.HOME_PULLED_POSTS", mock_pulled)
+
+    # Execute
+    response = await client.get(
+        "/api/feed/home?limit=4", headers={"Authorization": "Bearer valid_token"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [post["id"] for post in data["items"]] == [10, 9, 8, 7]
+    assert data["next_cursor"] is not None
+    mock_timeline.fetch.assert_called_once_with(1, FEED_START[0], FEED_START[1], 5)
+
+    # Execute
+    cursor = encode_cursor((make_post(7, 2, 5).created_at, 7))
+    mock_timeline.fetch.return_value = [make_post(3, 1, 30)]
+    mock_pulled.fetch.return_value = []
+    response = await client.get(
+        "/api/feed/home", params={"limit": 4, "cursor": cursor},
+        headers={"Authorization": "Bearer valid_token"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [post["id"] for post in data["items"]] == [3]
+    assert data["next_cursor"] is None
+    assert mock_timeline.fetch.call_args.args[1:3] == (make_post(7, 2, 5).created_at, 7)
+
+@pytest.mark.asyncio
+async def test_get_home_feed_unauthorized(client):
+    # Execute
+    response = await client.get("/api/feed/home")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+@pytest.mark.asyncio
+async def test_timeline_fanout_flags_skipped_subreddits(mocker):
+    # Mock
+    mock_entry = mocker.patch("app.services.timeline.TimelineEntry")
+    mock_entry.raw = AsyncMock(return_value=[])
+    fanout = TimelineFanout(max_members=100)
+    created_at = make_post(1, 1, 0).created_at
+    fanout.add_post(1, 4, created_at)
+    fanout.add_post(2, 5, created_at)
+
+    # Execute
+    await fanout.flush()
+
+    # Skipped subreddits are flagged in the same statement that fans out,
+    # so home feeds pull their posts even after they shrink
+    mock_entry.raw.assert_called_once_with(
+        FAN_OUT_POSTS, [4, 5], 100, [1, 2], [4, 5], [created_at, created_at], 100
+    )
@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from litestar.exceptions import ServiceUnavailableException
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from app.services.health_service import HealthService
+from app.dtos.health import HashingStatsDTO
+from app.services.hashing_pool import HashingPool
+
+class HashingStatsDTOFactory(MsgspecFactory[HashingStatsDTO]):
+    pass
+
+@pytest.mark.asyncio
+async def test_get_hashing_stats(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=HealthService)
+    expected_stats = HashingStatsDTOFactory.build()
+    mock_service_instance.get_hashing_stats.return_value = expected_stats
+
+    mocker.patch("app.controllers.health.provide_health_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/health/hashing")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["queue_depth"] == expected_stats.queue_depth
+    assert data["rejected"] == expected_stats.rejected
+
+    mock_service_instance.get_hashing_stats.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_register_rejected_when_hashing_saturated(client, mocker):
+    from app.services.user_service import UserService
+
+    mock_service_instance = AsyncMock(spec=UserService)
+    mock_service_instance.create_user.side_effect = ServiceUnavailableException(
+        "Password hashing is saturated, retry shortly", headers={"Retry-After": "1"}
+    )
+
+    mocker.patch("app.controllers.user.provide_user_service", return_value=mock_service_instance)
+
+    response = await client.post(
+        "/api/users/register",
+        json={"username": "user", "email": "user@example.com", "password": "secret"},
+    )
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_hashing_pool_rejects_when_full():
+    # Mock
+    pool = HashingPool(kind="thread", workers=1, max_queue=1)
+    release = threading.Event()
+    jobs = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    # Execute
+    try:
+        assert pool.in_flight == 2
+        assert pool.queue_depth == 1
+        with pytest.raises(ServiceUnavailableException):
+            await pool.run(release.wait)
+        assert pool.rejected == 1
+    finally:
+        release.set()
+        await asyncio.gather(*jobs)
+        await pool.shutdown()
+
+    assert pool.in_flight == 0
+    assert pool.completed == 2
+
+
+@pytest.mark.asyncio
+async def test_hashing_pool_keeps_slot_of_cancelled_job():
+    # Mock
+    pool = HashingPool(kind="thread", workers=1, max_queue=0)
+    release = threading.Event()
+    job = asyncio.create_task(pool.run(release.wait))
+    await asyncio.sleep(0.01)
+
+    # Execute
+    try:
+        job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await job
+        # The worker is still busy, so the slot stays taken
+        assert pool.in_flight == 1
+        with pytest.raises(ServiceUnavailableException):
+            await pool.run(release.wait)
+    finally:
+        release.set()
+        await pool.shutdown()
+        await asyncio.sleep(0)
+
+    assert pool.in_flight == 0
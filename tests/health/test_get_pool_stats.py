@@ -0,0 +1,38 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from app.services.health_service import HealthService
+from app.dtos.health import PoolStatsDTO
+
+class PoolStatsDTOFactory(MsgspecFactory[PoolStatsDTO]):
+    pass
+
+@pytest.mark.asyncio
+async def test_get_pool_stats(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=HealthService)
+    expected_stats = PoolStatsDTOFactory.build()
+    mock_service_instance.get_pool_stats.return_value = expected_stats
+
+    mocker.patch("app.controllers.health.provide_health_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/health/db")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["in_use"] == expected_stats.in_use
+    assert data["waiting"] == expected_stats.waiting
+
+    mock_service_instance.get_pool_stats.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_pool_stats_without_running_pool(client):
+    # No lifespan runs in tests, so the engine has no pool yet
+    response = await client.get("/api/health/db")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["running"] is False
+    assert data["size"] == 0
@@ -0,0 +1,77 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+from app.db import InstrumentedPostgresEngine, begin_request_routing, end_request_routing
+from app.services.health_service import HealthService
+from app.dtos.health import ReplicaStatsDTO
+
+@pytest.mark.asyncio
+async def test_get_replica_stats(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=HealthService)
+    expected_stats = [ReplicaStatsDTO(name="replica_0", healthy=True, lag_seconds=0.4, pool=None)]
+    mock_service_instance.get_replica_stats.return_value = expected_stats
+
+    mocker.patch("app.controllers.health.provide_health_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/health/replicas")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data[0]["name"] == "replica_0"
+    assert data[0]["healthy"] is True
+
+    mock_service_instance.get_replica_stats.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_replica_stats_without_replicas(client):
+    response = await client.get("/api/health/replicas")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == []
+
+def test_read_engine_falls_back_to_primary():
+    config = {"host": "localhost"}
+    replica = InstrumentedPostgresEngine(config=config)
+    lagging = InstrumentedPostgresEngine(config=config)
+    primary = InstrumentedPostgresEngine(
+        config=config, extra_nodes={"replica_0": replica, "replica_1": lagging}
+    )
+
+    # Unchecked replicas are not trusted
+    assert primary.read_engine() is primary
+
+    primary.replica_lag = {"replica_0": 0.0, "replica_1": primary.max_replica_lag + 1}
+    assert primary.read_engine() is replica
+
+    # Reads after a write in the same request stay on the primary
+    token = begin_request_routing(pinned=True)
+    try:
+        assert primary.read_engine() is primary
+    finally:
+        end_request_routing(token)
+
+    primary.replica_lag["replica_0"] = None
+    assert primary.read_engine() is primary
+
+
+@pytest.mark.asyncio
+async def test_replica_without_wal_receiver_is_unhealthy(mocker):
+    # Mock
+    config = {"host": "localhost"}
+    streaming = InstrumentedPostgresEngine(config=config)
+    disconnected = InstrumentedPostgresEngine(config=config)
+    primary = InstrumentedPostgresEngine(
+        config=config, extra_nodes={"replica_0": streaming, "replica_1": disconnected}
+    )
+    connection = MagicMock()
+    connection.fetchval = AsyncMock(side_effect=[0.5, None])
+    acquire = mocker.patch("app.db.acquire_connection")
+    acquire.return_value.__aenter__.return_value = connection
+
+    # Execute
+    await primary.check_replica_lag()
+
+    assert primary.replica_lag == {"replica_0": 0.5, "replica_1": None}
+    assert primary.read_engine() is streaming
@@ -0,0 +1,40 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from app.services.health_service import HealthService
+from app.dtos.health import StartupPhaseDTO, StartupStatsDTO
+
+@pytest.mark.asyncio
+async def test_get_startup_stats(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=HealthService)
+    expected_stats = StartupStatsDTO(
+        fast_start=True,
+        interpreter_ms=120.0,
+        phases=[StartupPhaseDTO(name="db_pool", duration_ms=35.5, background=False)],
+        ready_ms=410.0,
+        first_response_ms=432.1,
+    )
+    mock_service_instance.get_startup_stats.return_value = expected_stats
+
+    mocker.patch("app.controllers.health.provide_health_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/health/startup")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["ready_ms"] == 410.0
+    assert data["phases"][0]["name"] == "db_pool"
+
+    mock_service_instance.get_startup_stats.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_startup_stats_reports_import_phases(client):
+    response = await client.get("/api/health/startup")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [phase["name"] for phase in data["phases"]][:2] == ["imports", "build_app"]
+    # No lifespan runs in tests, so the worker never became ready
+    assert data["ready_ms"] is None
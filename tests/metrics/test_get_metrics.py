@@ -0,0 +1,57 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from app.services.metrics import MetricsService
+
+@pytest.mark.asyncio
+async def test_get_metrics(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=MetricsService)
+    mock_service_instance.render.return_value = "hashing_pool_in_flight 0\n"
+
+    mocker.patch("app.controllers.metrics.provide_metrics_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/metrics")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert response.text == "hashing_pool_in_flight 0\n"
+
+    mock_service_instance.render.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_metrics_records_requests(client):
+    # Execute
+    await client.get("/api/health/hashing")
+    response = await client.get("/metrics")
+
+    assert response.status_code == HTTPStatus.OK
+    labels = 'method="GET",route="/api/health/hashing"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}' in response.text
+    assert f'http_responses_total{{{labels},status="200"}}' in response.text
+    assert f"db_queries_total{{{labels}}} 0" in response.text
+    assert "db_pool_in_use 0" in response.text
+
+@pytest.mark.asyncio
+async def test_get_metrics_requires_ops_token(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=MetricsService)
+    mock_service_instance.render.return_value = ""
+    mocker.patch("app.controllers.metrics.provide_metrics_service", return_value=mock_service_instance)
+    mocker.patch("app.guards.OPS_TOKEN", "ops-secret")
+
+    # Execute
+    response = await client.get("/metrics")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    # Execute
+    response = await client.get("/api/health/hashing", headers={"Authorization": "Bearer wrong"})
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    # Execute
+    response = await client.get("/metrics", headers={"Authorization": "Bearer ops-secret"})
+
+    assert response.status_code == HTTPStatus.OK
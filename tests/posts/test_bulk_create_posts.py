@@ -0,0 +1,59 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from app.services.post_service import PostService, decode_post_batch
+from app.dtos.post import PostBulkErrorDTO, PostBulkResultDTO
+
+@pytest.mark.asyncio
+async def test_bulk_create_posts_ndjson(client, mocker, mock_auth):
+    # Mock
+    mock_service_instance = AsyncMock(spec=PostService)
+    mock_service_instance.bulk_create_posts.return_value = PostBulkResultDTO(
+        ids=[10, None],
+        errors=[PostBulkErrorDTO(index=1, error="Subreddit 'missing' not found")],
+    )
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    # Execute
+    body = (
+        b'{"title": "One", "subreddit_name": "python"}\n'
+        b'{"title": "Two", "subreddit_name": "missing"}\n'
+    )
+    response = await client.post(
+        "/api/posts/bulk",
+        content=body,
+        headers={
+            "Authorization": "Bearer valid_token",
+            "Content-Type": "application/x-ndjson",
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["ids"] == [10, None]
+    assert data["errors"][0]["index"] == 1
+
+    mock_service_instance.bulk_create_posts.assert_called_once_with(
+        body, ndjson=True, author_id=1
+    )
+
+@pytest.mark.asyncio
+async def test_bulk_create_posts_unauthenticated(client, mocker):
+    mock_service_instance = AsyncMock(spec=PostService)
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    response = await client.post("/api/posts/bulk", json=[{"title": "One", "subreddit_name": "python"}])
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    mock_service_instance.bulk_create_posts.assert_not_called()
+
+def test_decode_post_batch_reports_row_errors():
+    body = b'[{"title": "One", "subreddit_name": "python"}, {"title": 5}, {"title": "", "subreddit_name": "python"}]'
+
+    posts, errors, count = decode_post_batch(body, ndjson=False)
+
+    assert count == 3
+    assert [index for index, _ in posts] == [0]
+    assert [error.index for error in errors] == [1, 2]
@@ -2,7 +2,8 @@ import pytest
 from http import HTTPStatus
 from unittest.mock import AsyncMock
 from polyfactory.factories.msgspec_factory import MsgspecFactory
-from app.services.post_service import PostService
+from app.models.post import PREVIEW_LENGTH
+from app.services.post_service import PostService, make_preview
 from app.dtos.post import PostCreateDTO, PostResponseDTO
 
 class PostCreateDTOFactory(MsgspecFactory[PostCreateDTO]):
@@ -48,3 +49,23 @@ async def test_create_post(client, mocker, mock_auth):
     
     # Verify Service Call
     mock_service_instance.create_post.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (None, None),
+        ("short post", "short post"),
+        ("x" * PREVIEW_LENGTH, "x" * PREVIEW_LENGTH),
+        ("x" * (PREVIEW_LENGTH + 1), "x" * (PREVIEW_LENGTH - 1) + "…"),
+        (
+            "x" * (PREVIEW_LENGTH - 4) + " \n\t " + "tail",
+            "x" * (PREVIEW_LENGTH - 4) + "…",
+        ),
+    ],
+)
+def test_make_preview(content, expected):
+    preview = make_preview(content)
+
+    assert preview == expected
+    assert preview is None or len(preview) <= PREVIEW_LENGTH
@@ -0,0 +1,58 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+from app.services.post_service import PostService
+
+@pytest.mark.asyncio
+async def test_delete_post(client, mocker, mock_auth):
+    # Mock
+    mock_service_instance = AsyncMock(spec=PostService)
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.delete(
+        "/api/posts/7", headers={"Authorization": "Bearer valid_token"}
+    )
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    mock_service_instance.delete_post.assert_called_once_with(7, user_id=1)
+
+@pytest.mark.asyncio
+async def test_delete_post_updates_subreddit_counters(client, mocker, mock_auth):
+    # Mock
+    mock_post = mocker.patch("app.services.post_service.Post")
+    mock_post.raw = AsyncMock(return_value=[{"subreddit": 3}])
+    mock_counters = MagicMock()
+    mocker.patch("app.services.post_service.subreddit_counters", mock_counters)
+
+    # Execute
+    response = await client.delete(
+        "/api/posts/7", headers={"Authorization": "Bearer valid_token"}
+    )
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    mock_counters.record_deletion.assert_called_once_with(3)
+
+@pytest.mark.asyncio
+async def test_delete_post_not_author(client, mocker, mock_auth):
+    # Mock
+    mock_post = mocker.patch("app.services.post_service.Post")
+    mock_post.raw = AsyncMock(return_value=[])
+    mock_post.exists.return_value.where = AsyncMock(return_value=True)
+    mock_counters = MagicMock()
+    mocker.patch("app.services.post_service.subreddit_counters", mock_counters)
+
+    # Execute
+    response = await client.delete(
+        "/api/posts/7", headers={"Authorization": "Bearer valid_token"}
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    mock_counters.record_deletion.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_delete_post_unauthorized(client):
+    # Execute
+    response = await client.delete("/api/posts/7")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
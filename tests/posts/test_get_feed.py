@@ -0,0 +1,69 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from app.services.pagination import encode_cursor
+from app.services.post_service import PostService
+from app.dtos.post import FeedSort, PostPageDTO, PostSummaryDTO
+
+class PostSummaryDTOFactory(MsgspecFactory[PostSummaryDTO]):
+    pass
+
+@pytest.mark.asyncio
+async def test_get_feed_default_sort(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=PostService)
+    expected_list = [PostSummaryDTOFactory.build() for _ in range(3)]
+    mock_service_instance.get_feed.return_value = PostPageDTO(
+        items=expected_list, next_cursor="next"
+    )
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/posts/feed")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [p.id for p in expected_list]
+    assert data["next_cursor"] == "next"
+
+    mock_service_instance.get_feed.assert_called_once_with(
+        sort=FeedSort.HOT, limit=25, cursor=None
+    )
+
+@pytest.mark.asyncio
+async def test_get_feed_new_with_cursor(client, mocker):
+    mock_service_instance = AsyncMock(spec=PostService)
+    mock_service_instance.get_feed.return_value = PostPageDTO(items=[])
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/posts/feed?sort=new&limit=5&cursor=abc")
+
+    assert response.status_code == HTTPStatus.OK
+    mock_service_instance.get_feed.assert_called_once_with(
+        sort=FeedSort.NEW, limit=5, cursor="abc"
+    )
+
+@pytest.mark.asyncio
+async def test_get_feed_invalid_sort(client, mocker):
+    mock_service_instance = AsyncMock(spec=PostService)
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/posts/feed?sort=controversial")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    mock_service_instance.get_feed.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_feed_negative_cursor(client, mocker):
+    # Mock
+    mock_index = mocker.patch("app.services.post_service.feed_index")
+
+    # Execute
+    response = await client.get(f"/api/posts/feed?cursor={encode_cursor(-25)}")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    mock_index.page.assert_not_called()
@@ -3,27 +3,84 @@ from http import HTTPStatus
 from unittest.mock import AsyncMock
 from polyfactory.factories.msgspec_factory import MsgspecFactory
 from app.services.post_service import PostService
-from app.dtos.post import PostResponseDTO
+from app.dtos.post import PostPageDTO, PostSummaryDTO
 
-class PostResponseDTOFactory(MsgspecFactory[PostResponseDTO]):
+class PostSummaryDTOFactory(MsgspecFactory[PostSummaryDTO]):
     pass
 
 @pytest.mark.asyncio
 async def test_list_posts_in_subreddit(client, mocker):
     # Mock
     mock_service_instance = AsyncMock(spec=PostService)
-    expected_list = [PostResponseDTOFactory.build() for _ in range(2)]
-    mock_service_instance.get_posts_by_subreddit.return_value = expected_list
-    
+    expected_list = [PostSummaryDTOFactory.build() for _ in range(2)]
+    mock_service_instance.get_posts_by_subreddit.return_value = PostPageDTO(
+        items=expected_list, next_cursor="next"
+    )
+
     mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
-    
+
     # Execute
     sub_name = "testsub"
     response = await client.get(f"/api/r/{sub_name}/posts")
-    
+
     assert response.status_code == HTTPStatus.OK
     data = response.json()
-    assert len(data) == 2
-    assert data[0]["title"] == expected_list[0].title
-    
-    mock_service_instance.get_posts_by_subreddit.assert_called_once_with(sub_name)
+    assert len(data["items"]) == 2
+    assert data["items"][0]["title"] == expected_list[0].title
+    assert data["next_cursor"] == "next"
+
+    mock_service_instance.get_posts_by_subreddit.assert_called_once_with(
+        sub_name, limit=25, cursor=None
+    )
+
+@pytest.mark.asyncio
+async def test_list_posts_with_cursor(client, mocker):
+    mock_service_instance = AsyncMock(spec=PostService)
+    mock_service_instance.get_posts_by_subreddit.return_value = PostPageDTO(items=[])
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/r/testsub/posts?limit=10&cursor=abc")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"items": [], "next_cursor": None}
+
+    mock_service_instance.get_posts_by_subreddit.assert_called_once_with(
+        "testsub", limit=10, cursor="abc"
+    )
+
+@pytest.mark.asyncio
+async def test_list_posts_limit_out_of_range(client, mocker):
+    mock_service_instance = AsyncMock(spec=PostService)
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/r/testsub/posts?limit=1000")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    mock_service_instance.get_posts_by_subreddit.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_list_posts_stream_ndjson(client, mocker):
+    async def body():
+        yield b'{"id":1}\n'
+        yield b'{"id":2}\n'
+
+    mock_service_instance = AsyncMock(spec=PostService)
+    mock_service_instance.stream_posts_by_subreddit.return_value = body()
+
+    mocker.patch("app.controllers.post.provide_post_service", return_value=mock_service_instance)
+
+    response = await client.get(
+        "/api/r/testsub/posts?stream=true",
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.text.splitlines() == ['{"id":1}', '{"id":2}']
+
+    mock_service_instance.stream_posts_by_subreddit.assert_called_once_with(
+        "testsub", ndjson=True
+    )
+    mock_service_instance.get_posts_by_subreddit.assert_not_called()
@@ -0,0 +1,54 @@
+import re
+import msgspec
+import pytest
+from app import queries
+from app.db import PreparedQuery
+from app.dtos.post import PostResponseDTO, PostSummaryDTO
+from app.dtos.subreddit import SubredditResponseDTO
+from app.dtos.user import UserResponseDTO
+
+# Foreign key columns whose DTO field carries an ``_id`` suffix.
+RENAMES = {"author_id": "author", "subreddit_id": "subreddit", "owner_id": "owner"}
+
+# Every positionally decoded query and the DTO it builds.
+DECODED_QUERIES = {
+    "POST_BY_ID": PostResponseDTO,
+    "POSTS_BY_SUBREDDIT": PostSummaryDTO,
+    "POSTS_BY_SUBREDDIT_AFTER": PostSummaryDTO,
+    "USER_BY_USERNAME": UserResponseDTO,
+    "SUBREDDIT_BY_NAME": SubredditResponseDTO,
+    "HOME_TIMELINE": PostSummaryDTO,
+    "HOME_PULLED_POSTS": PostSummaryDTO,
+}
+
+# Decoded as a dict or a bare value, so there is no field order to check.
+UNCHECKED_QUERIES = {"PRINCIPAL_BY_ID", "USERNAME_TAKEN", "EMAIL_TAKEN"}
+
+
+def selected_columns(sql: str) -> list[str]:
+    """
+    Returns:
+        list[str]: The outermost SELECT list, without table qualifiers.
+    """
+    select_list = re.search(r"SELECT\s+(.*?)\s+FROM\s", sql, re.S).group(1)
+    return [column.strip().split(".")[-1] for column in select_list.split(",")]
+
+
+def test_every_prepared_query_is_checked():
+    names = {
+        name
+        for name, value in vars(queries).items()
+        if isinstance(value, PreparedQuery)
+    }
+
+    assert names == DECODED_QUERIES.keys() | UNCHECKED_QUERIES
+
+
+@pytest.mark.parametrize("name, dto", DECODED_QUERIES.items())
+def test_prepared_query_columns_match_dto_fields(name, dto):
+    query = getattr(queries, name)
+    fields = [
+        RENAMES.get(field.name, field.name) for field in msgspec.structs.fields(dto)
+    ]
+
+    assert selected_columns(query.sql) == fields
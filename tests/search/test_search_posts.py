@@ -0,0 +1,43 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from app.services.search_service import SearchService
+from app.dtos.post import PostPageDTO, PostSummaryDTO
+
+class PostSummaryDTOFactory(MsgspecFactory[PostSummaryDTO]):
+    pass
+
+@pytest.mark.asyncio
+async def test_search_posts(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=SearchService)
+    expected_list = [PostSummaryDTOFactory.build() for _ in range(2)]
+    mock_service_instance.search_posts.return_value = PostPageDTO(
+        items=expected_list, next_cursor="next"
+    )
+
+    mocker.patch("app.controllers.search.provide_search_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/search/posts?q=async+python&subreddit=python&limit=10")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [post.id for post in expected_list]
+    assert data["next_cursor"] == "next"
+
+    mock_service_instance.search_posts.assert_called_once_with(
+        "async python", subreddit_name="python", limit=10, cursor=None
+    )
+
+@pytest.mark.asyncio
+async def test_search_posts_requires_query(client, mocker):
+    mock_service_instance = AsyncMock(spec=SearchService)
+
+    mocker.patch("app.controllers.search.provide_search_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/search/posts?q=")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    mock_service_instance.search_posts.assert_not_called()
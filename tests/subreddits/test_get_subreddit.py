@@ -37,3 +37,32 @@ async def test_get_subreddit_not_found(client, mocker):
     
     response = await client.get("/api/subreddits/nonexistent")
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+@pytest.mark.asyncio
+async def test_get_subreddit_includes_recorded_posts(client, mocker):
+    from datetime import datetime
+    from app.services.subreddit_counters import SubredditCounters
+    from app.services.subreddit_directory import SubredditDirectory
+
+    # Mock
+    directory = SubredditDirectory()
+    directory.add(
+        SubredditResponseDTOFactory.build(
+            id=3, name="testsub", post_count=4, last_activity_at=None
+        )
+    )
+    mocker.patch("app.services.subreddit_service.subreddit_directory", directory)
+    mocker.patch("app.services.subreddit_counters.subreddit_directory", directory)
+    counters = SubredditCounters()
+    counters.record_posts(3, [10, 11], datetime(2026, 2, 23, 12, 0))
+    counters.record_deletion(3)
+
+    # Execute
+    response = await client.get("/api/subreddits/testsub")
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["post_count"] == 5
+    assert data["last_activity_at"] == "2026-02-23T12:00:00"
+    # Counted without a query; the posts are written on the next flush
+    assert counters._pending == [10, 11]
@@ -1,28 +1,117 @@
+import msgspec
 import pytest
 from http import HTTPStatus
 from unittest.mock import AsyncMock
 from polyfactory.factories.msgspec_factory import MsgspecFactory
 from app.services.subreddit_service import SubredditService
+from app.services.response_cache import CachedResponse, make_etag
 from app.dtos.subreddit import SubredditResponseDTO
 
 class SubredditResponseDTOFactory(MsgspecFactory[SubredditResponseDTO]):
     pass
 
+def build_cached_response(subreddits: list[SubredditResponseDTO]) -> CachedResponse:
+    body = msgspec.json.encode(subreddits)
+    return CachedResponse(body=body, etag=make_etag(body))
+
 @pytest.mark.asyncio
 async def test_list_subreddits(client, mocker):
     # Mock Service
     mock_service_instance = AsyncMock(spec=SubredditService)
     expected_list = [SubredditResponseDTOFactory.build() for _ in range(2)]
-    mock_service_instance.get_all.return_value = expected_list
-    
+    cached = build_cached_response(expected_list)
+    mock_service_instance.get_all_encoded.return_value = cached
+
     mocker.patch("app.controllers.subreddit.provide_subreddit_service", return_value=mock_service_instance)
-    
+
     # Execute
     response = await client.get("/api/subreddits/")
-    
+
     assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] == cached.etag
     data = response.json()
     assert len(data) == 2
     assert data[0]["name"] == expected_list[0].name
-    
-    mock_service_instance.get_all.assert_called_once()
+
+    mock_service_instance.get_all_encoded.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_list_subreddits_not_modified(client, mocker):
+    mock_service_instance = AsyncMock(spec=SubredditService)
+    cached = build_cached_response([SubredditResponseDTOFactory.build()])
+    mock_service_instance.get_all_encoded.return_value = cached
+
+    mocker.patch("app.controllers.subreddit.provide_subreddit_service", return_value=mock_service_instance)
+
+    response = await client.get(
+        "/api/subreddits/", headers={"If-None-Match": cached.etag}
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == cached.etag
+    assert response.content == b""
+
+@pytest.mark.asyncio
+async def test_list_subreddits_stale_etag(client, mocker):
+    mock_service_instance = AsyncMock(spec=SubredditService)
+    cached = build_cached_response([SubredditResponseDTOFactory.build()])
+    mock_service_instance.get_all_encoded.return_value = cached
+
+    mocker.patch("app.controllers.subreddit.provide_subreddit_service", return_value=mock_service_instance)
+
+    response = await client.get(
+        "/api/subreddits/", headers={"If-None-Match": '"stale"'}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()) == 1
+
+@pytest.mark.asyncio
+async def test_list_subreddits_stream_json_array(client, mocker):
+    async def body():
+        yield b'[{"name":"a"}'
+        yield b',{"name":"b"}]'
+
+    mock_service_instance = AsyncMock(spec=SubredditService)
+    mock_service_instance.stream_all.return_value = body()
+
+    mocker.patch("app.controllers.subreddit.provide_subreddit_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/subreddits/?stream=true")
+
+    assert response.status_code == HTTPStatus.OK
+    assert [sub["name"] for sub in response.json()] == ["a", "b"]
+
+    mock_service_instance.stream_all.assert_called_once_with(ndjson=False)
+    mock_service_instance.get_all_encoded.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_list_subreddits_refreshed_after_counter_flush(client, mocker):
+    from datetime import datetime
+    from app.services.response_cache import ResponseCache
+    from app.services.subreddit_counters import FLUSH_COUNTED_POSTS, SubredditCounters
+
+    # Mock
+    cache = ResponseCache()
+    mocker.patch("app.services.subreddit_service.response_cache", cache)
+    mocker.patch("app.services.subreddit_counters.response_cache", cache)
+    before = [SubredditResponseDTOFactory.build(post_count=1)]
+    after = [msgspec.structs.replace(before[0], post_count=2)]
+    mock_get_all = mocker.patch.object(
+        SubredditService, "get_all", AsyncMock(side_effect=[before, after])
+    )
+    mock_subreddit = mocker.patch("app.services.subreddit_counters.Subreddit")
+    mock_subreddit.raw = AsyncMock()
+    counters = SubredditCounters()
+
+    # Execute
+    first = await client.get("/api/subreddits/")
+    counters.record_posts(before[0].id, [7], datetime(2026, 2, 23, 12, 0))
+    await counters.flush()
+    second = await client.get("/api/subreddits/")
+
+    assert first.json()[0]["post_count"] == 1
+    assert second.json()[0]["post_count"] == 2
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert mock_get_all.await_count == 2
+    mock_subreddit.raw.assert_awaited_once_with(FLUSH_COUNTED_POSTS, [7])
@@ -0,0 +1,80 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from app.services.subreddit_service import SubredditService
+from app.services.subreddit_directory import SUBREDDIT_LIST_CACHE_KEY, SubredditDirectory
+from app.dtos.subreddit import SubredditResponseDTO
+
+class SubredditResponseDTOFactory(MsgspecFactory[SubredditResponseDTO]):
+    pass
+
+@pytest.mark.asyncio
+async def test_subscribe(client, mocker, mock_auth):
+    # Mock
+    directory = SubredditDirectory()
+    directory.add(SubredditResponseDTOFactory.build(id=3, name="testsub", member_count=4))
+    mocker.patch("app.services.subreddit_service.subreddit_directory", directory)
+    mock_subscription = mocker.patch("app.services.subreddit_service.Subscription")
+    mock_subscription.raw = AsyncMock(return_value=[{"member_count": 5}])
+    mock_cache = mocker.patch("app.services.subreddit_service.response_cache")
+
+    # Execute
+    response = await client.post(
+        "/api/subreddits/testsub/subscription",
+        headers={"Authorization": "Bearer valid_token"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["member_count"] == 5
+    assert directory.get("testsub").member_count == 5
+    mock_cache.invalidate.assert_called_once_with(SUBREDDIT_LIST_CACHE_KEY)
+    # Joined, counted and backfilled in one statement
+    mock_subscription.raw.assert_called_once()
+    assert mock_subscription.raw.call_args.args[1:3] == (1, 3)
+
+@pytest.mark.asyncio
+async def test_subscribe_already_member(client, mocker, mock_auth):
+    # Mock
+    directory = SubredditDirectory()
+    directory.add(SubredditResponseDTOFactory.build(id=3, name="testsub", member_count=4))
+    mocker.patch("app.services.subreddit_service.subreddit_directory", directory)
+    mock_subscription = mocker.patch("app.services.subreddit_service.Subscription")
+    mock_subscription.raw = AsyncMock(return_value=[])
+    mock_cache = mocker.patch("app.services.subreddit_service.response_cache")
+
+    # Execute
+    response = await client.post(
+        "/api/subreddits/testsub/subscription",
+        headers={"Authorization": "Bearer valid_token"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["member_count"] == 4
+    mock_cache.invalidate.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_unsubscribe(client, mocker, mock_auth):
+    # Mock
+    mock_service_instance = AsyncMock(spec=SubredditService)
+    mock_service_instance.unsubscribe.return_value = SubredditResponseDTOFactory.build(
+        name="testsub", member_count=0
+    )
+    mocker.patch("app.controllers.subreddit.provide_subreddit_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.delete(
+        "/api/subreddits/testsub/subscription",
+        headers={"Authorization": "Bearer valid_token"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["member_count"] == 0
+    mock_service_instance.unsubscribe.assert_called_once_with("testsub", user_id=1)
+
+@pytest.mark.asyncio
+async def test_subscribe_unauthorized(client):
+    # Execute
+    response = await client.post("/api/subreddits/testsub/subscription")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
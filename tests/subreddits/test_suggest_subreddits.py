@@ -0,0 +1,62 @@
+import pytest
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from app.services.subreddit_service import SubredditService
+from app.services.subreddit_directory import SubredditDirectory
+from app.dtos.subreddit import SubredditResponseDTO, SubredditSuggestionDTO
+
+@pytest.mark.asyncio
+async def test_suggest_subreddits(client, mocker):
+    # Mock
+    mock_service_instance = AsyncMock(spec=SubredditService)
+    mock_service_instance.suggest.return_value = [
+        SubredditSuggestionDTO(name="python", post_count=12),
+        SubredditSuggestionDTO(name="pytest", post_count=3),
+    ]
+
+    mocker.patch("app.controllers.subreddit.provide_subreddit_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.get("/api/subreddits/suggest?prefix=py&limit=5")
+
+    assert response.status_code == HTTPStatus.OK
+    assert [s["name"] for s in response.json()] == ["python", "pytest"]
+
+    mock_service_instance.suggest.assert_called_once_with("py", 5)
+    mock_service_instance.get_by_name.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_suggest_subreddits_requires_prefix(client, mocker):
+    mock_service_instance = AsyncMock(spec=SubredditService)
+
+    mocker.patch("app.controllers.subreddit.provide_subreddit_service", return_value=mock_service_instance)
+
+    response = await client.get("/api/subreddits/suggest")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    mock_service_instance.suggest.assert_not_called()
+
+def test_directory_suggest_ranks_by_popularity():
+    directory = SubredditDirectory()
+    for subreddit_id, name in enumerate(["Python", "pytest", "pics", "rust"], start=1):
+        directory.add(
+            SubredditResponseDTO(
+                id=subreddit_id, name=name, description=None,
+                created_at=datetime(2026, 2, 1), owner_id=1,
+            )
+        )
+    directory.record_posts(2, count=5)
+    directory.record_posts(1, count=2)
+
+    suggestions = directory.suggest("PY", limit=10)
+
+    assert suggestions == [
+        SubredditSuggestionDTO(name="pytest", post_count=5),
+        SubredditSuggestionDTO(name="Python", post_count=2),
+    ]
+    assert directory.suggest("py", limit=1) == [
+        SubredditSuggestionDTO(name="pytest", post_count=5)
+    ]
+    assert directory.suggest("r", limit=10)[0].name == "rust"
+    assert directory.suggest("z", limit=10) == []
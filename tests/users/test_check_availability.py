@@ -0,0 +1,120 @@
+import pytest
+from http import HTTPStatus
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from app.dtos.user import UserAvailabilityDTO
+from app.services.availability import AvailabilityIndex, BloomFilter
+from app.services.rate_limiter import MemoryRateLimitBackend, RateLimiter, TokenBucket
+
+@pytest.mark.asyncio
+async def test_check_availability_from_filter(client, unique_username, unique_email, mocker):
+    # Mock
+    index = AvailabilityIndex()
+    index.filter = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    index.add_user("taken", "taken@example.com")
+    mock_query = MagicMock()
+    mock_query.fetchrow = AsyncMock(return_value=True)
+    mocker.patch("app.controllers.user.availability_index", index)
+    mocker.patch("app.services.availability.USERNAME_TAKEN", mock_query)
+    mocker.patch("app.services.availability.EMAIL_TAKEN", mock_query)
+
+    # Execute
+    response = await client.get(
+        "/api/users/available",
+        params={"username": unique_username, "email": unique_email},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"username_available": True, "email_available": True}
+    # Filter misses never reach the database
+    mock_query.fetchrow.assert_not_called()
+
+    # Execute
+    response = await client.get("/api/users/available", params={"username": "taken"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"username_available": False, "email_available": None}
+    mock_query.fetchrow.assert_called_once_with("taken")
+
+@pytest.mark.asyncio
+async def test_check_availability_before_filter_is_built(client, unique_username, mocker):
+    # Mock
+    mock_query = MagicMock()
+    mock_query.fetchrow = AsyncMock(return_value=None)
+    mocker.patch("app.controllers.user.availability_index", AvailabilityIndex())
+    mocker.patch("app.services.availability.USERNAME_TAKEN", mock_query)
+
+    # Execute
+    response = await client.get("/api/users/available", params={"username": unique_username})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["username_available"] is True
+    mock_query.fetchrow.assert_called_once_with(unique_username)
+
+@pytest.mark.asyncio
+async def test_check_availability_requires_a_value(client):
+    # Execute
+    response = await client.get("/api/users/available")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+@pytest.mark.asyncio
+async def test_check_availability_rate_limited(client, unique_username, mocker):
+    # Mock
+    limiter = RateLimiter(
+        MemoryRateLimitBackend(),
+        ip_bucket=TokenBucket(capacity=5, per_minute=5),
+        username_bucket=TokenBucket(capacity=5, per_minute=5),
+        availability_bucket=TokenBucket(capacity=1, per_minute=1),
+        enabled=True,
+    )
+    mocker.patch("app.controllers.user.rate_limiter", limiter)
+    mock_index = AsyncMock(spec=AvailabilityIndex)
+    mock_index.check.return_value = UserAvailabilityDTO(username_available=True)
+    mocker.patch("app.controllers.user.availability_index", mock_index)
+
+    # Execute
+    first = await client.get("/api/users/available", params={"username": unique_username})
+    second = await client.get("/api/users/available", params={"username": unique_username})
+
+    assert first.status_code == HTTPStatus.OK
+    assert second.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert second.headers["Retry-After"] == "60"
+    mock_index.check.assert_called_once_with(username=unique_username, email=None)
+
+@pytest.mark.asyncio
+async def test_availability_rebuild_scans_primary(mocker):
+    # Mock
+    class Cursor:
+        def __init__(self, rows):
+            self.rows = iter(rows)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self.rows)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    connection = MagicMock()
+    connection.cursor.return_value = Cursor([("taken", "taken@example.com")])
+    engines = []
+
+    @asynccontextmanager
+    async def acquire_connection(engine=None):
+        engines.append(engine)
+        yield connection
+
+    mocker.patch("app.services.availability.acquire_connection", acquire_connection)
+    mocker.patch("app.services.availability.User.count", AsyncMock(return_value=1))
+    index = AvailabilityIndex()
+
+    # Execute
+    await index.rebuild()
+
+    # No engine means the primary, which never lags behind registrations
+    assert engines == [None]
+    assert index.filter.might_contain("username:taken")
+    assert index.filter.might_contain("email:taken@example.com")
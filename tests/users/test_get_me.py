@@ -32,3 +32,38 @@ async def test_get_me_unauthenticated(client):
     # Without Auth header, it returns None user -> 401
     response = await client.get("/api/users/me")
     assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_get_me_uses_cached_principal(client, mock_auth):
+    # Two authenticated requests for the same user hit the DB only once
+    headers = {"Authorization": "Bearer fake_token"}
+    first = await client.get("/api/users/me", headers=headers)
+    second = await client.get("/api/users/me", headers=headers)
+
+    assert first.status_code == HTTPStatus.OK
+    assert second.status_code == HTTPStatus.OK
+    assert second.json() == first.json()
+    mock_auth.fetchrow.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_me_trusted_claims_decodes_token_once(client, mock_auth, mocker):
+    # Mock
+    from app.services.auth_service import AuthService
+    mocker.patch("app.middleware.auth.AUTH_TRUST_TOKEN_CLAIMS", True)
+    # A token issued without the principal claim
+    token = AuthService().create_token(1)
+    decode = mocker.spy(AuthService, "_decode_payload")
+
+    # Execute
+    response = await client.get(
+        "/api/users/me", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["id"] == 1
+    # The claim and the subject come from the same decode
+    decode.assert_called_once()
+    AuthService.decode_token.assert_not_called()
+    mock_auth.fetchrow.assert_called_once_with(1)
@@ -9,25 +9,17 @@ class UserResponseDTOFactory(MsgspecFactory[UserResponseDTO]):
 
 @pytest.mark.asyncio
 async def test_get_user_profile(client, unique_username, mocker):
-    # Controller uses User.select().where(...).first()
-    # Patch app.controllers.user.User
+    # Controller uses the USER_BY_USERNAME prepared query
+    # Patch app.controllers.user.USER_BY_USERNAME
     
-    mock_user_orm = MagicMock()
-    mock_query = AsyncMock()
-    # Mock return dict
-    mock_query.first.return_value = {
-        "id": 1, 
-        "username": unique_username, 
-        "email": "test@example.com", 
-        "avatar_url": None, 
-        "bio": None,
-        "is_active": True, 
-        "is_verified": True
-    }
-    mock_user_orm.select.return_value.where.return_value = mock_query
+    mock_user_query = MagicMock()
+    mock_user_query.fetchrow = AsyncMock()
+    mock_user_query.fetchrow.return_value = UserResponseDTOFactory.build(
+        id=1, username=unique_username
+    )
+    
+    mocker.patch("app.controllers.user.USER_BY_USERNAME", mock_user_query)
     
-    mocker.patch("app.controllers.user.User", mock_user_orm)
-
     # Execute
     response = await client.get(f"/api/users/{unique_username}")
     
@@ -35,16 +27,14 @@ async def test_get_user_profile(client, unique_username, mocker):
     data = response.json()
     assert data["username"] == unique_username
     
-    mock_user_orm.select.assert_called()
+    mock_user_query.fetchrow.assert_called_once_with(unique_username)
 
 @pytest.mark.asyncio
 async def test_get_user_not_found(client, mocker):
-    mock_user_orm = MagicMock()
-    mock_query = AsyncMock()
-    mock_query.first.return_value = None # Not found
-    mock_user_orm.select.return_value.where.return_value = mock_query
+    mock_user_query = MagicMock()
+    mock_user_query.fetchrow = AsyncMock(return_value=None) # Not found
     
-    mocker.patch("app.controllers.user.User", mock_user_orm)
+    mocker.patch("app.controllers.user.USER_BY_USERNAME", mock_user_query)
     
     response = await client.get("/api/users/nonexistent_user")
     assert response.status_code == HTTPStatus.NOT_FOUND
@@ -1,3 +1,5 @@
+import asyncio
+import time
 import pytest
 from http import HTTPStatus
 from unittest.mock import AsyncMock
@@ -52,3 +54,59 @@ async def test_login_invalid_password(client, mocker):
     )
     
     assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+@pytest.mark.asyncio
+async def test_login_rate_limited(client, mocker):
+    from app.services.rate_limiter import MemoryRateLimitBackend, RateLimiter, TokenBucket
+
+    # Mock
+    limiter = RateLimiter(
+        MemoryRateLimitBackend(),
+        ip_bucket=TokenBucket(capacity=1, per_minute=1),
+        username_bucket=TokenBucket(capacity=0, per_minute=1),
+        enabled=True,
+    )
+    mocker.patch("app.services.user_service.rate_limiter", limiter)
+    mock_user = mocker.patch("app.services.user_service.User")
+
+    # Execute
+    response = await client.post(
+        "/api/users/login",
+        json={"username": "user", "password": "guess"},
+    )
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "60"
+    # Rejected before any hashing or database work
+    mock_user.select.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_redis_rate_limit_falls_back_when_slow(mocker):
+    from app.services.rate_limiter import (
+        MemoryRateLimitBackend,
+        RedisRateLimitBackend,
+        TokenBucket,
+    )
+
+    # Mock
+    backend = RedisRateLimitBackend(
+        "redis://localhost", MemoryRateLimitBackend(), timeout=0.05
+    )
+
+    async def hang(key, bucket):
+        await asyncio.Event().wait()
+
+    mock_take = mocker.patch.object(backend, "_take", side_effect=hang)
+    bucket = TokenBucket(capacity=1, per_minute=1)
+
+    # Execute: the second call waits for the connection behind the first.
+    started = time.monotonic()
+    results = await asyncio.gather(backend.take("a", bucket), backend.take("b", bucket))
+
+    assert results == [0.0, 0.0]
+    assert time.monotonic() - started < 0.5
+    # Only the first call reached the server; the server is now skipped.
+    assert mock_take.await_count == 1
+    assert await backend.take("c", bucket) == 0.0
+    assert mock_take.await_count == 1
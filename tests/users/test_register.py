@@ -47,3 +47,37 @@ async def test_register_user(client, mocker):
     # Verify Response matches Mock output
     assert data["username"] == expected_response.username
     assert data["id"] == expected_response.id
+
+@pytest.mark.asyncio
+async def test_register_user_conflict(client, mocker):
+    from app.services.rate_limiter import MemoryRateLimitBackend, RateLimiter, TokenBucket
+
+    # Mock
+    mocker.patch(
+        "app.services.user_service.rate_limiter",
+        RateLimiter(
+            MemoryRateLimitBackend(),
+            ip_bucket=TokenBucket(capacity=1, per_minute=1),
+            username_bucket=TokenBucket(capacity=1, per_minute=1),
+            enabled=False,
+        ),
+    )
+    mocker.patch(
+        "app.services.user_service.auth_service.hash_password_async",
+        AsyncMock(return_value="hash"),
+    )
+    mock_user = mocker.patch("app.services.user_service.User")
+    insert = mock_user.insert.return_value.on_conflict.return_value.returning
+    insert.return_value = AsyncMock(return_value=[])()
+
+    # Execute
+    response = await client.post(
+        "/api/users/register",
+        json={"username": "taken", "email": "taken@example.com", "password": "secret123"},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()["detail"] == "Username or email already exists"
+    # Duplicates are rejected by the insert itself, with no prior lookup
+    mock_user.select.assert_not_called()
+    insert.assert_called_once()
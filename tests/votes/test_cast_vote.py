@@ -0,0 +1,135 @@
+import pytest
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+from litestar.exceptions import NotFoundException
+from app.services.vote_service import (
+    DELETE_VOTE,
+    INSERT_VOTE,
+    POST_EXISTS,
+    UPDATE_VOTE,
+    VoteService,
+)
+from app.dtos.vote import VoteCreateDTO, VoteResponseDTO
+
+
+@pytest.mark.asyncio
+async def test_cast_vote(client, mocker, mock_auth):
+    # Mock
+    mock_service_instance = AsyncMock(spec=VoteService)
+    mock_service_instance.cast_vote.return_value = VoteResponseDTO(post_id=7, value=1)
+
+    mocker.patch("app.controllers.vote.provide_vote_service", return_value=mock_service_instance)
+
+    # Execute
+    response = await client.post(
+        "/api/posts/7/vote",
+        json={"value": 1},
+        headers={"Authorization": "Bearer valid_token"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"post_id": 7, "value": 1}
+
+    mock_service_instance.cast_vote.assert_called_once_with(
+        7, VoteCreateDTO(value=1), user_id=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_cast_vote_invalid_value(client, mocker, mock_auth):
+    mock_service_instance = AsyncMock(spec=VoteService)
+
+    mocker.patch("app.controllers.vote.provide_vote_service", return_value=mock_service_instance)
+
+    response = await client.post(
+        "/api/posts/7/vote",
+        json={"value": 5},
+        headers={"Authorization": "Bearer valid_token"},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    mock_service_instance.cast_vote.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cast_vote_unauthenticated(client, mocker):
+    mock_service_instance = AsyncMock(spec=VoteService)
+
+    mocker.patch("app.controllers.vote.provide_vote_service", return_value=mock_service_instance)
+
+    response = await client.post("/api/posts/7/vote", json={"value": 1})
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    mock_service_instance.cast_vote.assert_not_called()
+
+
+@pytest.fixture
+def mock_connection(mocker):
+    """
+    Fixture to replace the vote service's database connection.
+    Returns:
+        MagicMock: The connection; script `fetchval.side_effect` per test.
+    """
+    connection = MagicMock()
+    connection.fetchval = AsyncMock()
+    acquire = mocker.patch("app.services.vote_service.acquire_connection")
+    acquire.return_value.__aenter__.return_value = connection
+    return connection
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "value, fetched, delta",
+    [
+        # New vote: nothing to update, the insert succeeds.
+        (1, [None, 1], 1),
+        # The same vote again changes nothing.
+        (1, [1], 0),
+        # Flipping an upvote to a downvote.
+        (-1, [1], -2),
+        # Retracting a downvote.
+        (0, [-1], 1),
+    ],
+)
+async def test_cast_vote_score_delta(mocker, mock_connection, value, fetched, delta):
+    # Mock
+    mock_connection.fetchval.side_effect = fetched
+    mock_counters = mocker.patch("app.services.vote_service.score_counters")
+
+    # Execute
+    result = await VoteService().cast_vote(7, VoteCreateDTO(value=value), user_id=1)
+
+    assert result == VoteResponseDTO(post_id=7, value=value)
+    if delta:
+        mock_counters.add.assert_called_once_with(7, delta)
+    else:
+        mock_counters.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cast_vote_concurrent_first_vote(mocker, mock_connection):
+    # Mock: another first vote is inserted between the UPDATE and the INSERT.
+    mock_connection.fetchval.side_effect = [None, None, -1]
+    mock_counters = mocker.patch("app.services.vote_service.score_counters")
+
+    # Execute
+    await VoteService().cast_vote(7, VoteCreateDTO(value=1), user_id=1)
+
+    queries = [call.args[0] for call in mock_connection.fetchval.call_args_list]
+    assert queries == [UPDATE_VOTE, INSERT_VOTE, UPDATE_VOTE]
+    mock_counters.add.assert_called_once_with(7, 2)
+
+
+@pytest.mark.asyncio
+async def test_retract_vote_missing_post(mocker, mock_connection):
+    # Mock
+    mock_connection.fetchval.side_effect = [None, False]
+    mock_counters = mocker.patch("app.services.vote_service.score_counters")
+
+    # Execute
+    with pytest.raises(NotFoundException):
+        await VoteService().cast_vote(7, VoteCreateDTO(value=0), user_id=1)
+
+    queries = [call.args[0] for call in mock_connection.fetchval.call_args_list]
+    assert queries == [DELETE_VOTE, POST_EXISTS]
+    mock_counters.add.assert_not_called()